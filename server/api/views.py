@@ -1,4 +1,5 @@
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from .models import Item, Booking
 from .serializers import ItemSerializer, BookingSerializer
@@ -15,7 +16,7 @@ class ItemListCreateView(generics.ListCreateAPIView):
     def perform_create(self, serializer):
         # Optionally restrict creation to staff users:
         if not self.request.user.is_staff:
-            raise permissions.PermissionDenied("Only staff can create items.")
+            raise PermissionDenied("Only staff can create items.")
         serializer.save()
 
 # Bookings: each user sees their own bookings; create attaches user
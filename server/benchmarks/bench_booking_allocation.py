@@ -0,0 +1,91 @@
+"""
+Concurrency benchmark for activity slot allocation.
+
+Many threads try to book the same movie showing at once. The run fails if
+more bookings are created than the slot has capacity, and reports the
+allocation throughput.
+
+    python -m benchmarks.bench_booking_allocation --threads 32 --capacity 500
+"""
+import argparse
+import threading
+from datetime import date
+
+from benchmarks.common import benchmark_database, setup_django, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--capacity", type=int, default=500)
+    parser.add_argument("--attempts-per-thread", type=int, default=25)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from django.db import connection, transaction
+
+    from core.inventory import SlotUnavailable, allocate
+    from core.models import ActivitySlot, Booking, CruiseShip
+
+    User = get_user_model()
+    showing = date(2025, 6, 1)
+
+    with benchmark_database():
+        ship = CruiseShip.objects.create(name="Bench", capacity=args.capacity, destination="Nowhere")
+        slot = ActivitySlot.objects.create(ship=ship, activity="movie", date=showing)
+        users = User.objects.bulk_create(
+            User(username=f"bench{i}", email=f"bench{i}@example.com", password="!")
+            for i in range(args.threads)
+        )
+
+        counts = {"booked": 0, "rejected": 0, "errors": 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(args.threads)
+
+        def worker(user):
+            booked = rejected = errors = 0
+            barrier.wait()
+            try:
+                for _ in range(args.attempts_per_thread):
+                    try:
+                        with transaction.atomic():
+                            slot_id = allocate("movie", showing)
+                            Booking.objects.create(user=user, type="movie", date=showing, slot_id=slot_id)
+                        booked += 1
+                    except SlotUnavailable:
+                        rejected += 1
+                    except Exception:
+                        errors += 1
+            finally:
+                connection.close()
+            with lock:
+                counts["booked"] += booked
+                counts["rejected"] += rejected
+                counts["errors"] += errors
+
+        threads = [threading.Thread(target=worker, args=(user,)) for user in users]
+        with timed() as timing:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        slot.refresh_from_db()
+        stored = Booking.objects.filter(slot=slot).count()
+
+    attempts = args.threads * args.attempts_per_thread
+    print(f"threads={args.threads} capacity={args.capacity} attempts={attempts}")
+    print(f"booked={counts['booked']} rejected={counts['rejected']} errors={counts['errors']}")
+    print(f"stored bookings={stored} remaining={slot.remaining}")
+    print(f"elapsed={timing['elapsed']:.3f}s  {counts['booked'] / timing['elapsed']:.0f} bookings/s  "
+          f"{attempts / timing['elapsed']:.0f} attempts/s")
+
+    overbooked = stored > args.capacity or stored + slot.remaining != args.capacity
+    if overbooked or stored != counts["booked"] or counts["errors"]:
+        raise SystemExit("FAIL: slot inventory and stored bookings disagree")
+    print("OK: no overbooking")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Serialization cost of the booking, order and item lists: DRF
+ModelSerializers against the values_list() serializers in
+core.fast_serializers. Both read the same rows; the timings include the
+query and JSON rendering.
+
+    python -m benchmarks.bench_fast_serializers --bookings 5000 --repeat 5
+"""
+import argparse
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.common import benchmark_database, setup_django, timed
+
+
+def seed(bookings):
+    from core.models import Booking, Item, Order, OrderLine, User
+
+    user = User.objects.create_user(email="bench@example.com", password=None)
+    items = Item.objects.bulk_create(
+        Item(name=f"Dish {n}", category="catering", price=Decimal("9.50"), description="Chef's special")
+        for n in range(200)
+    )
+    created = Booking.objects.bulk_create(
+        Booking(user=user, type="catering", date=date(2025, 1, 1) + timedelta(days=n % 60))
+        for n in range(bookings)
+    )
+    orders = Order.objects.bulk_create(
+        Order(booking=booking, meal="lunch", total=Decimal("19.00")) for booking in created
+    )
+    OrderLine.objects.bulk_create(
+        OrderLine(order=order, item=items[n % len(items)], item_name=items[n % len(items)].name, quantity=2,
+                  unit_price=Decimal("9.50"), line_total=Decimal("19.00"))
+        for n, order in enumerate(orders)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        from django.db.models import Prefetch
+        from rest_framework.renderers import JSONRenderer
+
+        from core.fast_serializers import booking_order_values, booking_values, item_values
+        from core.models import Booking, Item, OrderLine
+        from core.serializers import BookingOrderSerializer, BookingSerializer, ItemSerializer
+
+        seed(args.bookings)
+        bookings = Booking.objects.all()
+        orders = bookings.select_related("order").prefetch_related(
+            Prefetch("order__lines", queryset=OrderLine.objects.order_by("id"))
+        )
+        items = Item.objects.all()
+        renderer = JSONRenderer()
+
+        cases = [
+            ("bookings", lambda: BookingSerializer(bookings.all(), many=True).data,
+             lambda: booking_values.serialize(bookings.all())),
+            ("orders", lambda: BookingOrderSerializer(orders.all(), many=True).data,
+             lambda: booking_order_values.serialize(bookings.all())),
+            ("items", lambda: ItemSerializer(items.all(), many=True).data,
+             lambda: item_values.serialize(items.all())),
+        ]
+        for name, model_serializer, fast_serializer in cases:
+            assert renderer.render(model_serializer()) == renderer.render(fast_serializer())
+            results = {}
+            for label, serialize in (("ModelSerializer", model_serializer), ("values_list", fast_serializer)):
+                with timed() as timing:
+                    for _ in range(args.repeat):
+                        renderer.render(serialize())
+                results[label] = timing["elapsed"] / args.repeat
+                print(f"{name:9s} {label:16s} {results[label] * 1000:8.1f} ms/list")
+            print(f"{name:9s} speedup          {results['ModelSerializer'] / results['values_list']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
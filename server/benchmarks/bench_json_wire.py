@@ -0,0 +1,69 @@
+"""
+Render time and bytes on the wire for the booking and item list payloads.
+
+Compares DRF's JSONRenderer with core.renderers.FastJSONRenderer (orjson
+when installed), then the size of each payload uncompressed, gzipped and,
+if the brotli package is installed, brotli-compressed.
+
+    python -m benchmarks.bench_json_wire --bookings 5000 --repeat 20
+"""
+import argparse
+import gzip
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.common import benchmark_database, setup_django, timed
+
+
+def seed(bookings):
+    from core.models import Booking, Item, User
+
+    user = User.objects.create_user(email="bench@example.com", password=None)
+    Item.objects.bulk_create(
+        Item(name=f"Dish {n}", category="catering", price=Decimal("9.50"), description="Chef's special of the day")
+        for n in range(200)
+    )
+    statuses = ["pending", "confirmed", "cancelled"]
+    Booking.objects.bulk_create(
+        Booking(user=user, type="movie", status=statuses[n % 3], date=date(2025, 1, 1) + timedelta(days=n % 60))
+        for n in range(bookings)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        from django.conf import settings
+        from rest_framework.renderers import JSONRenderer
+
+        from core.compression import brotli
+        from core.fast_serializers import booking_values, item_values
+        from core.models import Booking, Item
+        from core.renderers import FastJSONRenderer, orjson
+
+        seed(args.bookings)
+        payloads = {
+            "bookings": booking_values.serialize(Booking.objects.all()),
+            "items": item_values.serialize(Item.objects.all()),
+        }
+        print(f"orjson: {'yes' if orjson else 'no'}, brotli: {'yes' if brotli else 'no'}")
+        for name, data in payloads.items():
+            for label, renderer in (("JSONRenderer", JSONRenderer()), ("FastJSONRenderer", FastJSONRenderer())):
+                with timed() as timing:
+                    for _ in range(args.repeat):
+                        body = renderer.render(data)
+                print(f"{name:9s} {label:17s} {timing['elapsed'] / args.repeat * 1000:8.2f} ms/render")
+
+            sizes = {"plain": len(body), "gzip": len(gzip.compress(body, compresslevel=6))}
+            if brotli is not None:
+                sizes["brotli"] = len(brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY))
+            print(f"{name:9s} bytes " + ", ".join(f"{label} {size:,}" for label, size in sizes.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Login throughput benchmark.
+
+Runs concurrent `authenticate()` calls, the path behind session and JWT
+login, against a scratch database. Reports logins per second overall and
+per hashing core for the selected hasher profile.
+
+    python -m benchmarks.bench_login --threads 16 --logins 400 --iterations 600000
+"""
+import argparse
+import os
+import threading
+
+from benchmarks.common import benchmark_database, setup_django, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent login requests.")
+    parser.add_argument("--logins", type=int, default=200, help="Total logins to perform.")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=0,
+                        help="PBKDF2 iterations (0 = PASSWORD_PBKDF2_ITERATIONS / Django default).")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Hashing pool size (0 = PASSWORD_HASH_WORKERS / one per CPU).")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth import authenticate, get_user_model
+    from django.contrib.auth.hashers import get_hasher, make_password
+    from django.db import connection
+
+    if args.iterations:
+        settings.PASSWORD_PBKDF2_ITERATIONS = args.iterations
+    if args.workers:
+        settings.PASSWORD_HASH_WORKERS = args.workers
+    workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+    cores = min(args.threads, workers, os.cpu_count() or 1)
+
+    User = get_user_model()
+    password = "Sail-away-42"
+    with benchmark_database():
+        encoded = make_password(password)
+        User.objects.bulk_create(
+            User(username=f"guest{i}", email=f"guest{i}@example.com", password=encoded) for i in range(args.users)
+        )
+
+        per_thread = args.logins // args.threads
+        failures = []
+        barrier = threading.Barrier(args.threads)
+
+        def worker(offset):
+            barrier.wait()
+            try:
+                for n in range(per_thread):
+                    email = f"guest{(offset + n) % args.users}@example.com"
+                    if authenticate(email=email, password=password) is None:
+                        failures.append(email)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(i * per_thread,)) for i in range(args.threads)]
+        with timed() as timing:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+    total = per_thread * args.threads
+    rate = total / timing["elapsed"]
+    hasher = get_hasher("default")
+    print(f"hasher={hasher.algorithm} iterations={getattr(hasher, 'iterations', '-')} "
+          f"threads={args.threads} hash workers={workers} cores used={cores}")
+    print(f"logins={total} failures={len(failures)} elapsed={timing['elapsed']:.2f}s")
+    print(f"{rate:.1f} logins/s  {rate / cores:.1f} logins/s/core")
+    if failures:
+        raise SystemExit("FAIL: some logins were rejected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Microbenchmark of role permission checks.
+
+Compares the current core.permissions classes with the previous
+implementation, which wrote `view.allowed_roles` and rebuilt a lowercased
+role list on every call. No database is used.
+
+    python -m benchmarks.bench_permissions --iterations 200000
+"""
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from benchmarks.common import setup_django
+
+
+def legacy_permissions():
+    from rest_framework.exceptions import PermissionDenied
+    from rest_framework.permissions import BasePermission
+
+    class LegacyIsRole(BasePermission):
+        def has_permission(self, request, view):
+            if not request.user or not request.user.is_authenticated:
+                return False
+            allowed_roles = getattr(view, "allowed_roles", [])
+            user_role = getattr(request.user, "role", None)
+            if isinstance(user_role, str):
+                user_role = user_role.lower()
+            allowed_roles = [r.lower() for r in allowed_roles]
+            if not allowed_roles:
+                raise PermissionDenied("No roles defined for this endpoint.")
+            if user_role not in allowed_roles:
+                raise PermissionDenied("Access denied.")
+            return True
+
+    class LegacyIsVoyager(LegacyIsRole):
+        def has_permission(self, request, view):
+            view.allowed_roles = ["voyager"]
+            return super().has_permission(request, view)
+
+    class LegacyIsHeadCook(LegacyIsRole):
+        def has_permission(self, request, view):
+            view.allowed_roles = ["head_cook"]
+            return super().has_permission(request, view)
+
+    return LegacyIsVoyager, LegacyIsHeadCook
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    setup_django()
+    from core.permissions import IsHeadCook, IsVoyager
+
+    LegacyIsVoyager, LegacyIsHeadCook = legacy_permissions()
+    user = SimpleNamespace(is_authenticated=True, role="voyager")
+    request = SimpleNamespace(user=user, auth={"role": "voyager"})
+    view = SimpleNamespace()
+
+    cases = {
+        "legacy IsVoyager": LegacyIsVoyager(),
+        "IsVoyager": IsVoyager(),
+        "legacy IsVoyager | IsHeadCook": (LegacyIsVoyager | LegacyIsHeadCook)(),
+        "IsVoyager | IsHeadCook": (IsVoyager | IsHeadCook)(),
+    }
+    for name, permission in cases.items():
+        seconds = timeit.timeit(lambda: permission.has_permission(request, view), number=args.iterations)
+        print(f"{name:32s} {seconds / args.iterations * 1e9:8.0f} ns/check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+SQLite write throughput before and after the performance profile.
+
+Runs the same concurrent insert workload (contact messages and bookings,
+the way the views write them) in three configurations, each in a fresh
+process and scratch database:
+
+  stock      SQLITE_TUNING=False, WRITE_COALESCING=False
+  tuned      SQLITE_TUNING=True,  WRITE_COALESCING=False
+  coalesced  SQLITE_TUNING=True,  WRITE_COALESCING=True
+
+    python -m benchmarks.bench_sqlite_writes --threads 16 --writes 100
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+from datetime import date
+
+from benchmarks.common import benchmark_database, setup_django, timed
+
+MODES = {
+    "stock": {"SQLITE_TUNING": "False", "WRITE_COALESCING": "False"},
+    "tuned": {"SQLITE_TUNING": "True", "WRITE_COALESCING": "False"},
+    "coalesced": {"SQLITE_TUNING": "True", "WRITE_COALESCING": "True"},
+}
+
+
+def run_workload(threads, writes):
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    from core.batching import coalesced_write
+    from core.models import Booking, ContactMessage
+
+    User = get_user_model()
+    with benchmark_database():
+        users = User.objects.bulk_create(
+            User(username=f"w{i}", email=f"w{i}@example.com", password="!") for i in range(threads)
+        )
+        errors = []
+        barrier = threading.Barrier(threads)
+
+        def worker(user):
+            barrier.wait()
+            try:
+                for n in range(writes):
+                    try:
+                        if n % 2:
+                            coalesced_write(lambda: ContactMessage.objects.create(
+                                name=user.username, email=user.email, message=f"message {n}"
+                            ))
+                        else:
+                            coalesced_write(lambda: Booking.objects.create(
+                                user=user, type="movie", date=date(2025, 1, 1)
+                            ))
+                    except Exception as exc:
+                        errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(user,)) for user in users]
+        with timed() as timing:
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+        stored = ContactMessage.objects.count() + Booking.objects.count()
+
+    return stored, len(errors), timing["elapsed"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=100, help="Writes per thread.")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        stored, errors, elapsed = run_workload(args.threads, args.writes)
+        print(f"{args.mode:10s} stored={stored:6d} errors={errors:5d} "
+              f"elapsed={elapsed:7.2f}s  {stored / elapsed:8.0f} writes/s")
+        return
+
+    for mode, env in MODES.items():
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_sqlite_writes", "--mode", mode,
+             "--threads", str(args.threads), "--writes", str(args.writes)],
+            env={**os.environ, "DB_ENGINE": "sqlite", **env},
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
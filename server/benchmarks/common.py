@@ -0,0 +1,49 @@
+"""
+Shared setup for the benchmark scripts.
+
+Benchmarks run against a throwaway copy of the configured database (a temp
+file for SQLite), never against db.sqlite3. Run them from the server
+directory, e.g. `python -m benchmarks.bench_booking_allocation`.
+"""
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+import django
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """Create a migrated scratch database and drop it afterwards."""
+    from django.conf import settings
+    from django.db import connection
+
+    db = settings.DATABASES["default"]
+    if db["ENGINE"] == "django.db.backends.sqlite3":
+        # A file rather than an in-memory DB so worker threads each get
+        # their own connection, as they would in production.
+        tmpdir = tempfile.mkdtemp(prefix="bench-")
+        db.setdefault("TEST", {})["NAME"] = os.path.join(tmpdir, "bench.sqlite3")
+
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(db["NAME"], verbosity=0)
+
+
+@contextmanager
+def timed():
+    """Yields a dict whose `elapsed` key is filled in with wall-clock seconds."""
+    result = {}
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["elapsed"] = time.perf_counter() - start
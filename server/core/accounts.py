@@ -0,0 +1,150 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Q
+
+
+def username_base(email):
+    return email.split("@")[0]
+
+
+def first_free_username(base, taken):
+    """
+    `base` if it is free, else `base1`, `base2`, ... — the first name not in `taken`.
+
+    `taken` only needs the existing usernames among `username_candidates(base)`.
+    """
+    if base not in taken:
+        return base
+    counter = 1
+    while f"{base}{counter}" in taken:
+        counter += 1
+    return f"{base}{counter}"
+
+
+def username_candidates(base):
+    """
+    Match `base` and its numbered variants (`base1`, `base2`, ...) only, so
+    names that merely share the prefix (`baseball`) are not fetched.
+    """
+    return Q(username__regex=rf"^{re.escape(base)}[0-9]*$")
+
+
+def taken_usernames(bases):
+    """Existing usernames among the candidates for any of `bases`, in a single query."""
+    User = get_user_model()
+    condition = Q()
+    for base in bases:
+        condition |= username_candidates(base)
+    return set(User.objects.filter(condition).values_list("username", flat=True))
+
+
+def allocate_username(base):
+    return first_free_username(base, taken_usernames([base]))
+
+
+# ---- Bulk onboarding ----
+
+def _init_hash_worker():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+    django.setup()
+
+
+def _hash_chunk(passwords):
+    return [make_password(password) for password in passwords]
+
+
+def hash_passwords(passwords, workers=None, chunk_size=50):
+    """
+    Hash `passwords` with the configured hasher across a process pool.
+
+    Empty passwords become unusable ones without any hashing work.
+    """
+    passwords = list(passwords)
+    hashes = [make_password(None) if not password else None for password in passwords]
+    pending = [(index, password) for index, password in enumerate(passwords) if password]
+    if not pending:
+        return hashes
+
+    chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    if workers == 1 or len(chunks) == 1:
+        results = map(_hash_chunk, ([password for _, password in chunk] for chunk in chunks))
+        return _fill(hashes, chunks, results)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_hash_worker) as pool:
+        results = pool.map(_hash_chunk, ([password for _, password in chunk] for chunk in chunks))
+        return _fill(hashes, chunks, results)
+
+
+def _fill(hashes, chunks, results):
+    for chunk, chunk_hashes in zip(chunks, results):
+        for (index, _), encoded in zip(chunk, chunk_hashes):
+            hashes[index] = encoded
+    return hashes
+
+
+def onboard_voyagers(rows, workers=None, batch_size=200):
+    """
+    Create voyager accounts from manifest rows.
+
+    Each row is a dict with `email` and optionally `username`, `password`,
+    `first_name`, `last_name` and `phone_number`. Passwords are hashed in a
+    process pool. Each batch then costs two lookups (existing emails and
+    usernames) and two bulk INSERTs (users and voyager profiles).
+    Returns `(created, skipped)`, where `skipped` lists `(row_number, reason)`.
+    """
+    from .models import Voyager
+
+    User = get_user_model()
+    rows = list(rows)
+    hashes = hash_passwords((row.get("password") for row in rows), workers=workers)
+
+    created = 0
+    skipped = []
+    seen_emails = set()
+    for start in range(0, len(rows), batch_size):
+        batch = list(enumerate(rows[start:start + batch_size], start=start + 1))
+        emails = {(row.get("email") or "").strip().lower() for _, row in batch}
+        existing = set(User.objects.filter(email__in=emails).values_list("email", flat=True))
+
+        candidates = []
+        for number, row in batch:
+            email = (row.get("email") or "").strip().lower()
+            if not email or "@" not in email:
+                skipped.append((number, "missing or invalid email"))
+            elif email in existing or email in seen_emails:
+                skipped.append((number, "email already registered"))
+            else:
+                seen_emails.add(email)
+                base = User.normalize_username((row.get("username") or "").strip() or username_base(email))
+                candidates.append((number, row, email, base))
+
+        taken = taken_usernames({base for _, _, _, base in candidates}) if candidates else set()
+        users = []
+        profiles = []
+        for number, row, email, base in candidates:
+            username = first_free_username(base, taken)
+            taken.add(username)
+            users.append(User(
+                email=email,
+                username=username,
+                password=hashes[number - 1],
+                first_name=(row.get("first_name") or "").strip(),
+                last_name=(row.get("last_name") or "").strip(),
+                role=User.Role.VOYAGER,
+            ))
+            profiles.append((row.get("phone_number") or "").strip() or None)
+
+        with transaction.atomic():
+            users = User.objects.bulk_create(users)
+            Voyager.objects.bulk_create(
+                Voyager(user=user, phone_number=phone) for user, phone in zip(users, profiles)
+            )
+        created += len(users)
+
+    return created, skipped
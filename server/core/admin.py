@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User, CruiseShip, ContactMessage
+from .models import User, CruiseShip, ContactMessage, ActivitySlot, Order, OrderLine
 
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
@@ -20,3 +20,19 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_display = ('name', 'email', 'message')
     search_fields = ('name', 'email')
     ordering = ('name',)
+
+@admin.register(ActivitySlot)
+class ActivitySlotAdmin(admin.ModelAdmin):
+    list_display = ('ship', 'activity', 'date', 'remaining', 'capacity')
+    list_filter = ('activity', 'ship')
+    ordering = ('date', 'activity')
+
+class OrderLineInline(admin.TabularInline):
+    model = OrderLine
+    extra = 0
+    readonly_fields = ('item', 'item_name', 'quantity', 'unit_price', 'line_total')
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ('booking', 'total', 'created_at')
+    inlines = [OrderLineInline]
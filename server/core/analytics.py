@@ -0,0 +1,88 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from .caching import CacheNamespace
+from .counters import add_to_counter
+from .models import Booking, BookingDailyStat, CruiseShip
+
+# Dashboard figures, retired whenever a rollup changes. The timeout bounds
+# how long a summary read from a lagging replica can outlive the write.
+summary_cache = CacheNamespace("analytics", timeout=60)
+
+
+def record_booking(date, booking_type, booking_status, amount=1):
+    add_to_counter(BookingDailyStat, "count", amount, date=date, type=booking_type, status=booking_status)
+    summary_cache.invalidate()
+
+
+def record_bookings(bookings):
+    """Count a batch of new bookings, one UPDATE per distinct (date, type, status)."""
+    groups = Counter((booking.date, booking.type, booking.status) for booking in bookings)
+    for (booking_date, booking_type, booking_status), count in groups.items():
+        record_booking(booking_date, booking_type, booking_status, count)
+
+
+def rebuild_rollups():
+    """Replace the rollup table with a fresh GROUP BY over Booking. Returns the row count."""
+    rows = [
+        BookingDailyStat(**row)
+        for row in Booking.objects.values("date", "type", "status").annotate(count=Count("id")).order_by()
+    ]
+    with transaction.atomic():
+        BookingDailyStat.objects.all().delete()
+        BookingDailyStat.objects.bulk_create(rows, batch_size=1000)
+    summary_cache.invalidate()
+    return len(rows)
+
+
+def booking_summary(**filters):
+    """
+    Manager dashboard figures, computed from BookingDailyStat only.
+
+    `filters` are lookups on the rollup's `date` field (e.g. `date__gte`).
+    Occupancy compares active (not cancelled) bookings per day with the
+    combined capacity of all ships.
+    """
+    stats = BookingDailyStat.objects.filter(count__gt=0, **filters)
+
+    by_type = dict(stats.values_list("type").annotate(total=Sum("count")).order_by("type"))
+    by_status = dict(stats.values_list("status").annotate(total=Sum("count")).order_by("status"))
+    total = sum(by_type.values())
+    cancelled = by_status.get("cancelled", 0)
+
+    per_day = {}
+    for booking_date, booking_status, count in (
+        stats.values_list("date", "status").annotate(total=Sum("count")).order_by("date")
+    ):
+        day = per_day.setdefault(booking_date, {"date": booking_date, "total": 0, "cancelled": 0})
+        day["total"] += count
+        if booking_status == "cancelled":
+            day["cancelled"] += count
+
+    capacity = CruiseShip.objects.aggregate(total=Sum("capacity"))["total"] or 0
+    occupancy = [
+        {
+            "date": day["date"],
+            "active": day["total"] - day["cancelled"],
+            "rate": round((day["total"] - day["cancelled"]) / capacity, 4) if capacity else None,
+        }
+        for day in per_day.values()
+    ]
+
+    return {
+        "total": total,
+        "by_type": by_type,
+        "by_status": by_status,
+        "by_day": list(per_day.values()),
+        "cancellation_rate": round(cancelled / total, 4) if total else 0.0,
+        "capacity": capacity,
+        "occupancy": occupancy,
+    }
+
+
+def cached_booking_summary(**filters):
+    """booking_summary() through the analytics cache, keyed by the filters."""
+    key = "summary:" + ",".join(f"{lookup}={value}" for lookup, value in sorted(filters.items()))
+    return summary_cache.get_or_set(key, lambda: booking_summary(**filters))
@@ -0,0 +1,253 @@
+"""
+Native async versions of the hot read endpoints, for ASGI deployments.
+
+These are plain Django async views rather than DRF APIViews, because DRF
+dispatches synchronously and would pin a thread to every request. They
+authenticate from the JWT claims alone (see core.authentication), so a
+slow client holds a coroutine, not a worker thread or a DB connection.
+Responses match the JSON returned by their synchronous counterparts.
+"""
+import asyncio
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import SynchronousOnlyOperation
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed, NotFound
+from rest_framework.request import Request
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from .analytics import cached_booking_summary
+from .authentication import ClaimsJWTAuthentication
+from .catalog import acatalog_version, aget_catalog, catalog_etag, etag_matches
+from .filters import date_range_filters, filter_bookings
+from .db import use_replica
+from .events import alatest_event_id, format_event, ready_events, settled_before
+from .fast_serializers import BookingValues, ItemValues, for_params, project_fields
+from .kitchen import production_rows
+from .models import Booking, BookingEvent, Order
+from .pagination import BookingCursorPagination
+from .permissions import STAFF_BOOKING_TYPES, IsRole
+from .revocation import async_sync_cutoffs
+
+
+async def _authenticate(request):
+    """Return the ClaimsUser for the request's bearer token, or None."""
+    # Reload the revocation cut-offs in a thread if they changed, so the
+    # check made while verifying the token is only a cache read.
+    await async_sync_cutoffs()
+    authentication = ClaimsJWTAuthentication()
+    try:
+        try:
+            result = authentication.authenticate(request)
+        except SynchronousOnlyOperation:
+            # A user was revoked in between; verify again off the event loop.
+            result = await sync_to_async(authentication.authenticate)(request)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+    return result[0] if result else None
+
+
+def role_required(*roles, replica=False):
+    """
+    Async view decorator: JWT claims auth plus a role check, without the DB.
+
+    Only GET/HEAD are served. With `replica=True` the view's reads go to the
+    replica, like ReplicaReadMixin; the routing flag is a context variable,
+    so it follows the ORM calls that the async ORM runs in a thread.
+    """
+    allowed = frozenset(roles)
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+            user = await _authenticate(request)
+            if user is None:
+                return JsonResponse({"detail": "Authentication credentials were not provided or are invalid."},
+                                    status=401)
+            if user.role not in allowed:
+                return JsonResponse({"detail": IsRole.message}, status=403)
+            request.user = user
+            if replica:
+                with use_replica():
+                    return await view(request, *args, **kwargs)
+            return await view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _bad_request(errors):
+    return JsonResponse({"success": False, "errors": errors}, status=400)
+
+
+# ---- CATALOG ----
+async def _catalog(request, category):
+    serializer, errors = for_params(ItemValues, request.GET)
+    if errors:
+        return _bad_request(errors)
+    version = await acatalog_version(category)
+    etag = catalog_etag(category, version)
+    if etag_matches(request, etag):
+        response = HttpResponse(status=304)
+    else:
+        response = JsonResponse(project_fields(await aget_catalog(category, version), serializer.fields), safe=False)
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+@role_required("voyager", "head_cook")
+async def catering_catalog(request):
+    return await _catalog(request, "catering")
+
+
+@role_required("voyager", "head_cook")
+async def stationery_catalog(request):
+    return await _catalog(request, "stationery")
+
+
+# ---- MANAGER BOOKINGS ----
+@role_required("manager", replica=True)
+async def manager_bookings(request):
+    """
+    Bookings newest first, `page_size` at a time, with the manager filters.
+
+    Paged by BookingCursorPagination, so `next`, `previous` and their
+    cursors are the ones ManagerViewBookings returns; only the query runs
+    here, asynchronously.
+    """
+    bookings, errors = filter_bookings(Booking.objects.all(), request.GET)
+    serializer, field_errors = for_params(BookingValues, request.GET)
+    errors.update(field_errors)
+    if errors:
+        return _bad_request(errors)
+
+    paginator = BookingCursorPagination()
+    drf_request = Request(request)
+    paginator.page_size = paginator.get_page_size(drf_request)
+    # The paginator needs the ordering columns even when they are not shown.
+    columns = dict.fromkeys((*serializer.lookups, "created_at", "id"))
+    try:
+        page = paginator.page_queryset(bookings.values(*columns), drf_request)
+    except NotFound as exc:
+        return JsonResponse({"detail": exc.detail}, status=404)
+    rows = paginator.set_page([row async for row in page])
+    return JsonResponse({
+        "next": paginator.get_next_link(),
+        "previous": paginator.get_previous_link(),
+        "results": serializer.serialize_page(rows),
+    })
+
+
+# ---- DASHBOARDS ----
+@role_required("voyager", "head_cook")
+async def voyager_dashboard(request):
+    return JsonResponse({
+        "message": "Voyager API is working",
+        "endpoints": [
+            "/api/voyager/catering/",
+            "/api/voyager/stationery/",
+            "/api/voyager/bookings/"
+        ]
+    })
+
+
+@role_required("head_cook")
+async def head_cook_dashboard(request):
+    return JsonResponse({
+        "role": "head_cook",
+        "location": "Head Cook Dashboard",
+        "message": "Welcome Head Cook!"
+    })
+
+
+@role_required("head_cook", replica=True)
+async def head_cook_production(request):
+    filters, errors = date_range_filters(request.GET)
+    meal = request.GET.get("meal")
+    if meal:
+        if meal not in dict(Order.MEAL_WINDOWS):
+            errors["meal"] = [f"Unknown meal window '{meal}'."]
+        else:
+            filters["meal"] = meal
+    if errors:
+        return _bad_request(errors)
+    return JsonResponse(await sync_to_async(production_rows)(**filters), safe=False)
+
+
+@role_required("manager", replica=True)
+async def manager_analytics(request):
+    filters, errors = date_range_filters(request.GET)
+    if errors:
+        return _bad_request(errors)
+    return JsonResponse(await sync_to_async(cached_booking_summary)(**filters))
+
+
+# ---- LIVE BOOKING EVENTS ----
+EVENT_BATCH_SIZE = 500
+HEARTBEAT_INTERVAL = 15
+
+
+async def _event_stream(types, last_id, poll_interval, lifetime):
+    # Ask browsers to wait a little before reconnecting; they send
+    # Last-Event-ID on their own.
+    yield "retry: 3000\n\n"
+    deadline = time.monotonic() + lifetime
+    idle = 0.0
+    while True:
+        # Read every type, so a gap left by another role's event is not
+        # mistaken for a pending commit; filter afterwards.
+        batch = [
+            event async for event in BookingEvent.objects.filter(id__gt=last_id).order_by("id")[:EVENT_BATCH_SIZE]
+        ]
+        sent = False
+        for event in ready_events(batch, last_id, settled_before()):
+            last_id = event.pk
+            if types is None or event.type in types:
+                sent = True
+                yield format_event(event)
+        if batch and batch[-1].pk == last_id and len(batch) == EVENT_BATCH_SIZE:
+            continue
+        if time.monotonic() >= deadline:
+            return
+        await asyncio.sleep(poll_interval)
+        idle = 0.0 if sent else idle + poll_interval
+        if idle >= HEARTBEAT_INTERVAL:
+            idle = 0.0
+            yield ": keep-alive\n\n"
+
+
+@role_required(*STAFF_BOOKING_TYPES)
+async def booking_events(request):
+    """
+    Server-Sent Events feed of booking creates, status changes and deletes.
+
+    Resumes after the `Last-Event-ID` header (or `last_event_id` param);
+    a fresh connection starts at the end of the settled log (see
+    core.events), so it may replay the last few seconds. The server
+    closes the stream after BOOKING_EVENTS_STREAM_LIFETIME seconds and the
+    client reconnects from where it stopped.
+    """
+    last_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    if last_id is None:
+        last_id = await alatest_event_id()
+    elif not last_id.isdigit():
+        return _bad_request({"last_event_id": ["Enter a whole number."]})
+
+    response = StreamingHttpResponse(
+        _event_stream(
+            STAFF_BOOKING_TYPES[request.user.role],
+            int(last_id),
+            settings.BOOKING_EVENTS_POLL_INTERVAL,
+            settings.BOOKING_EVENTS_STREAM_LIFETIME,
+        ),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Keep reverse proxies from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,72 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.models import TokenUser
+
+
+# How long the User fields fetched for a token user may be reused.
+FULL_USER_CACHE_TIMEOUT = 60
+
+# The columns `ClaimsUser.instance` loads and caches. The password hash is
+# left out, so it never reaches the cache; reading it (or any other field)
+# costs a query. Listed in model field order, as Model.from_db expects.
+INSTANCE_FIELDS = (
+    "id", "last_login", "is_superuser", "username", "first_name", "last_name",
+    "is_staff", "is_active", "date_joined", "email", "role",
+)
+
+
+def user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def forget_user(user_id):
+    """Drop the cached fields of `user_id` (core.signals calls this on every save)."""
+    cache.delete(user_cache_key(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """
+    Request user built from the claims CustomTokenObtainPairSerializer puts
+    in the access token (`user_id`, `username`, `email`, `role`).
+
+    Views that only need the caller's id or role use it as-is. Views that
+    really need the `core.User` row read `request.user.instance`, a User
+    with INSTANCE_FIELDS loaded, cached for FULL_USER_CACHE_TIMEOUT seconds
+    and dropped when the user is saved. It raises AuthenticationFailed for
+    a deactivated user; deactivating also revokes the user's tokens.
+    """
+
+    @cached_property
+    def email(self):
+        return self.token.get("email", "")
+
+    @cached_property
+    def role(self):
+        return self.token.get("role")
+
+    @cached_property
+    def instance(self):
+        User = get_user_model()
+        key = user_cache_key(self.pk)
+        values = cache.get(key)
+        if values is None:
+            values = User.objects.filter(pk=self.pk).values_list(*INSTANCE_FIELDS).first()
+            if values is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            cache.set(key, values, FULL_USER_CACHE_TIMEOUT)
+        user = User.from_db(router.db_for_read(User), INSTANCE_FIELDS, values)
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    """JWT authentication that resolves the user from token claims, without a query."""
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        return ClaimsUser(user.token)
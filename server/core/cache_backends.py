@@ -0,0 +1,185 @@
+"""
+Two-tier cache backend: a per-process LRU in front of a shared backend.
+
+Reads are served from process memory when possible and otherwise from the
+shared backend (by default the file-based cache, visible to every worker
+on the host), whose value is then kept locally for at most LOCAL_TIMEOUT
+seconds. Writes go to both tiers. Atomic operations (`add`, `incr`) are
+decided by the shared tier, so they still work as cross-process locks and
+counters.
+
+A local copy can lag a write made by another process by up to
+LOCAL_TIMEOUT; data that must be current everywhere should use versioned
+keys (see core.caching), which never change once written. Cached objects
+are shared by reference within a process, so treat them as read-only.
+
+    CACHES = {
+        "default": {
+            "BACKEND": "core.cache_backends.TieredCache",
+            "LOCATION": "shared",  # alias of the shared backend
+            "OPTIONS": {"LOCAL_MAX_ENTRIES": 1000, "LOCAL_TIMEOUT": 10},
+        },
+        "shared": {...},
+    }
+"""
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_MISSING = object()
+
+
+class _LocalStore:
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = Counter()
+
+
+# Django builds one backend object per thread; the LRU is per process.
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _store_for(name):
+    with _stores_lock:
+        return _stores.setdefault(name, _LocalStore())
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.shared_alias = location or "shared"
+        self.local_max_entries = int(options.get("LOCAL_MAX_ENTRIES", 1000))
+        self.local_timeout = float(options.get("LOCAL_TIMEOUT", 10))
+        self._store = _store_for(self.shared_alias)
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    @property
+    def stats(self):
+        """Process-wide counts of local hits, shared hits and misses."""
+        return self._store.stats
+
+    # ---- local tier ----
+    def _local_get(self, local_key):
+        store = self._store
+        with store.lock:
+            entry = store.entries.get(local_key)
+            if entry is None:
+                return _MISSING
+            value, expires = entry
+            if expires <= time.monotonic():
+                del store.entries[local_key]
+                return _MISSING
+            store.entries.move_to_end(local_key)
+            return value
+
+    def _local_set(self, local_key, value, timeout=DEFAULT_TIMEOUT):
+        ttl = self.local_timeout
+        timeout = self.get_backend_timeout(timeout)
+        if timeout is not None:
+            ttl = min(ttl, timeout - time.time())
+        store = self._store
+        with store.lock:
+            if ttl <= 0:
+                store.entries.pop(local_key, None)
+                return
+            store.entries[local_key] = (value, time.monotonic() + ttl)
+            store.entries.move_to_end(local_key)
+            while len(store.entries) > self.local_max_entries:
+                store.entries.popitem(last=False)
+
+    def _local_delete(self, local_key):
+        with self._store.lock:
+            self._store.entries.pop(local_key, None)
+
+    # ---- cache API ----
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        value = self._local_get(local_key)
+        if value is not _MISSING:
+            self._store.stats["local_hits"] += 1
+            return value
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._store.stats["misses"] += 1
+            return default
+        self._store.stats["shared_hits"] += 1
+        self._local_set(local_key, value)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self.shared.set(key, value, self._shared_timeout(timeout), version=version)
+        self._local_set(local_key, value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        if not self.shared.add(key, value, self._shared_timeout(timeout), version=version):
+            return False
+        self._local_set(local_key, value, timeout)
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return self.shared.touch(key, self._shared_timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return self.shared.delete(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return self.shared.incr(key, delta, version=version)
+
+    # ---- async API ----
+    # Local hits are answered without leaving the event loop; only the
+    # shared tier goes through its own async methods.
+    async def aget(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        value = self._local_get(local_key)
+        if value is not _MISSING:
+            self._store.stats["local_hits"] += 1
+            return value
+        value = await self.shared.aget(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._store.stats["misses"] += 1
+            return default
+        self._store.stats["shared_hits"] += 1
+        self._local_set(local_key, value)
+        return value
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        await self.shared.aset(key, value, self._shared_timeout(timeout), version=version)
+        self._local_set(local_key, value, timeout)
+
+    async def aadd(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        if not await self.shared.aadd(key, value, self._shared_timeout(timeout), version=version):
+            return False
+        self._local_set(local_key, value, timeout)
+        return True
+
+    async def adelete(self, key, version=None):
+        self._local_delete(self.make_and_validate_key(key, version=version))
+        return await self.shared.adelete(key, version=version)
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def clear(self):
+        with self._store.lock:
+            self._store.entries.clear()
+        self.shared.clear()
+
+    def _shared_timeout(self, timeout):
+        # DEFAULT_TIMEOUT means this cache's default, not the shared backend's.
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
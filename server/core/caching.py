@@ -0,0 +1,201 @@
+"""
+Namespaced, versioned caching with stampede protection.
+
+A CacheNamespace prefixes its keys with its name and a version number.
+`invalidate()` moves the namespace to a new version when the current
+transaction commits, which retires every key in it at once, in every
+process, without deleting anything; old entries simply expire. However
+many writes a transaction makes, the version moves once. `get_or_set()` lets one caller per key compute a
+missing value while concurrent callers, in this process or others, wait
+for it instead of all hitting the database (best effort: the file-based
+backend's `add` is not atomic across processes). Hits and misses are
+counted per namespace and exported by core.metrics.
+"""
+import asyncio
+import threading
+import time
+from collections import Counter
+
+from asgiref.local import Local
+from django.core.cache import cache
+from django.db import transaction
+
+from .metrics import register_collector
+
+_MISSING = object()
+
+# Locks serialising computation of the same key within this process.
+_flight_locks = [threading.Lock() for _ in range(64)]
+
+counts = Counter()
+
+# The bump each namespace has queued on this thread's connection, which
+# (like the connection itself) is never shared between threads.
+_scheduled = Local()
+
+
+def shared_cache():
+    """The cross-process tier of the default cache (the cache itself if it has one tier)."""
+    return getattr(cache, "shared", cache)
+
+
+class CacheNamespace:
+    # How long a caller computing a value holds the cross-process lock,
+    # and how long others wait for it before computing it themselves.
+    lock_timeout = 10
+    poll_interval = 0.05
+
+    def __init__(self, name, timeout=300):
+        self.name = name
+        self.timeout = timeout
+        self._version_key = f"ns:{name}:version"
+
+    def version(self):
+        """
+        Current version, always read from the shared tier.
+
+        Versions start from a timestamp rather than 1 so an evicted or
+        flushed cache never reuses a version issued for older data.
+        """
+        shared = shared_cache()
+        version = shared.get(self._version_key)
+        if version is None:
+            shared.add(self._version_key, time.time_ns(), None)
+            version = shared.get(self._version_key)
+        return version
+
+    def invalidate(self):
+        """
+        Retire every key in the namespace when the current transaction
+        commits (at once outside a transaction). Until then other
+        connections cannot see the change, so the old values stay right.
+        """
+        scheduled = getattr(_scheduled, "bumps", None)
+        if scheduled is None:
+            scheduled = _scheduled.bumps = {}
+        pending = scheduled.get(self.name)
+        # Already queued in this transaction? A rollback drops the callback
+        # from run_on_commit, so a stale entry never hides a bump.
+        if pending is not None and any(func is pending for _, func, _ in transaction.get_connection().run_on_commit):
+            return
+
+        def bump():
+            scheduled.pop(self.name, None)
+            self._bump()
+
+        scheduled[self.name] = bump
+        transaction.on_commit(bump)
+
+    def _bump(self):
+        shared_cache().set(self._version_key, time.time_ns(), None)
+
+    async def aversion(self):
+        """Async `version()`."""
+        shared = shared_cache()
+        version = await shared.aget(self._version_key)
+        if version is None:
+            await shared.aadd(self._version_key, time.time_ns(), None)
+            version = await shared.aget(self._version_key)
+        return version
+
+    def key(self, key, version=None):
+        return f"ns:{self.name}:{self.version() if version is None else version}:{key}"
+
+    def get_or_set(self, key, compute, version=None, timeout=None):
+        """Cached value of `key`, calling `compute()` once to fill it on a miss."""
+        full_key = self.key(key, version)
+        value = cache.get(full_key, _MISSING)
+        if value is not _MISSING:
+            counts[(self.name, "hit")] += 1
+            return value
+        counts[(self.name, "miss")] += 1
+
+        timeout = self.timeout if timeout is None else timeout
+        with _flight_locks[hash(full_key) % len(_flight_locks)]:
+            value = cache.get(full_key, _MISSING)
+            if value is not _MISSING:
+                return value
+            lock_key = f"{full_key}:lock"
+            shared = shared_cache()
+            if shared.add(lock_key, 1, self.lock_timeout):
+                try:
+                    value = compute()
+                    cache.set(full_key, value, timeout)
+                finally:
+                    shared.delete(lock_key)
+                return value
+        # Another process is computing it. Wait without holding the striped
+        # lock, which other keys share.
+        value = self._wait_for(full_key)
+        if value is _MISSING:
+            value = compute()
+            cache.set(full_key, value, timeout)
+        return value
+
+    async def aget_or_set(self, key, compute, version=None, timeout=None):
+        """
+        Async `get_or_set()`, where `compute` returns an awaitable. Callers
+        in this process are kept apart by the shared lock alone.
+        """
+        if version is None:
+            version = await self.aversion()
+        full_key = self.key(key, version)
+        value = await cache.aget(full_key, _MISSING)
+        if value is not _MISSING:
+            counts[(self.name, "hit")] += 1
+            return value
+        counts[(self.name, "miss")] += 1
+
+        lock_key = f"{full_key}:lock"
+        shared = shared_cache()
+        timeout = self.timeout if timeout is None else timeout
+        if await shared.aadd(lock_key, 1, self.lock_timeout):
+            try:
+                value = await compute()
+                await cache.aset(full_key, value, timeout)
+            finally:
+                await shared.adelete(lock_key)
+            return value
+        value = await self._await_value(full_key)
+        if value is _MISSING:
+            value = await compute()
+            await cache.aset(full_key, value, timeout)
+        return value
+
+    async def _await_value(self, full_key):
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            value = await cache.aget(full_key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return _MISSING
+
+    def _wait_for(self, full_key):
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            value = cache.get(full_key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return _MISSING
+
+
+def exposition():
+    """Prometheus lines for the namespace and tier counters."""
+    lines = [
+        "# HELP cache_requests_total Cache lookups per namespace.",
+        "# TYPE cache_requests_total counter",
+    ]
+    for (name, result), count in sorted(counts.items()):
+        lines.append(f'cache_requests_total{{namespace="{name}",result="{result}"}} {count}')
+    stats = getattr(cache, "stats", None)
+    if stats is not None:
+        lines.append("# HELP cache_tier_requests_total Default cache lookups by the tier that answered.")
+        lines.append("# TYPE cache_tier_requests_total counter")
+        for result, count in sorted(stats.items()):
+            lines.append(f'cache_tier_requests_total{{result="{result}"}} {count}')
+    return lines
+
+
+register_collector(exposition)
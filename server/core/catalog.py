@@ -0,0 +1,57 @@
+from django.utils.http import parse_etags, quote_etag
+
+from .caching import CacheNamespace
+from .fast_serializers import item_values
+from .models import Item
+
+
+CATALOG_CATEGORIES = [value for value, _ in Item.CATEGORY_CHOICES]
+CATALOG_TIMEOUT = 60 * 60 * 24
+
+
+_namespaces = {category: CacheNamespace(f"catalog:{category}", CATALOG_TIMEOUT) for category in CATALOG_CATEGORIES}
+
+
+def catalog_version(category):
+    """Current version of a category's catalog; bumped whenever its items change."""
+    return _namespaces[category].version()
+
+
+def invalidate_catalog(categories=None):
+    """
+    Bump the version of the given categories (all of them by default) once
+    the current transaction commits, so no request can cache the old items
+    under the new version before the change is visible.
+    """
+    for category in categories or CATALOG_CATEGORIES:
+        _namespaces[category].invalidate()
+
+
+async def acatalog_version(category):
+    return await _namespaces[category].aversion()
+
+
+def catalog_etag(category, version):
+    return quote_etag(f"{category}-{version}")
+
+
+def get_catalog(category, version):
+    """Serialized items for `category` at `version`, read from the cache when possible."""
+    return _namespaces[category].get_or_set(
+        "items", lambda: item_values.serialize(Item.objects.filter(category=category)), version=version
+    )
+
+
+async def aget_catalog(category, version):
+    return await _namespaces[category].aget_or_set(
+        "items", lambda: item_values.aserialize(Item.objects.filter(category=category)), version=version
+    )
+
+
+def etag_matches(request, etag):
+    """True if the request's If-None-Match header already covers `etag`."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return "*" in etags or etag in etags or f"W/{etag}" in etags
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # optional: without it responses are only gzipped
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b")
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Brotli or gzip response compression above COMPRESSION_MIN_SIZE bytes.
+
+    Brotli is used when the `brotli` package is installed, the client
+    accepts it and the request carries no cookies; otherwise Django's gzip
+    handling applies, streamed responses included. Server-Sent Events are
+    left alone so each event reaches the client as soon as it is written.
+
+    BREACH recovers a secret in a compressed body from the sizes of
+    responses to requests an attacker makes the victim's browser send,
+    with the victim's cookies. Django's gzip pads each response with a
+    random number of bytes against it ("Heal the Breach"); brotli has no
+    place for such padding, so it is kept to cookie-less requests, i.e.
+    the bearer-token API, which a cross-site page cannot call as the user.
+    """
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        if (
+            brotli is not None
+            and not response.streaming
+            and not response.has_header("Content-Encoding")
+            and not request.COOKIES
+            and re_accepts_brotli.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        ):
+            patch_vary_headers(response, ("Accept-Encoding",))
+            compressed = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+            etag = response.get("ETag")
+            if etag and etag.startswith('"'):
+                response.headers["ETag"] = "W/" + etag
+            response.headers["Content-Encoding"] = "br"
+            return response
+        return super().process_response(request, response)
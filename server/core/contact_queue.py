@@ -0,0 +1,157 @@
+"""
+File-backed intake queue for contact messages.
+
+With CONTACT_QUEUE on, `contact_api` appends each validated message as a
+JSON line to a spool file and answers at once; `manage.py
+process_contact_queue` drains the spool into ContactMessage in batches.
+Appends hold an exclusive flock, so concurrent workers and the drainer
+never interleave or lose lines, and no broker is needed. Repeated
+messages (same email and text) within CONTACT_DEDUP_WINDOW are dropped.
+
+The spool relies on POSIX file locks; on platforms without `fcntl`
+(Windows) only CONTACT_QUEUE itself is unavailable.
+"""
+import hashlib
+import json
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ContactMessage
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+INCOMING = "incoming.jsonl"
+CLAIMED_PREFIX = "processing-"
+
+
+def spool_dir():
+    path = Path(settings.CONTACT_QUEUE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _lock(spool):
+    if fcntl is None:
+        raise ImproperlyConfigured("CONTACT_QUEUE needs POSIX file locks (fcntl); turn it off on this platform.")
+    fcntl.flock(spool, fcntl.LOCK_EX)
+
+
+def message_digest(email, message):
+    return hashlib.sha256(f"{email.strip().lower()}\0{message.strip()}".encode()).hexdigest()
+
+
+def _seen_key(email, message):
+    return f"contact:seen:{message_digest(email, message)}"
+
+
+def is_duplicate(email, message):
+    """
+    True when the same message was already accepted within the dedup
+    window. Checked through the cache, so the first copy wins; call
+    `forget_message` if that copy then fails to be stored.
+    """
+    return not cache.add(_seen_key(email, message), 1, settings.CONTACT_DEDUP_WINDOW)
+
+
+def forget_message(email, message):
+    """Undo `is_duplicate`'s claim, so a retry of a message that was not stored gets through."""
+    cache.delete(_seen_key(email, message))
+
+
+def _locked_append(path, line):
+    while True:
+        with open(path, "a", encoding="utf-8") as spool:
+            _lock(spool)
+            # The drainer may have claimed (renamed) the file between our
+            # open and our lock; if so, write to the fresh one instead.
+            try:
+                current = os.stat(path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current == os.fstat(spool.fileno()).st_ino:
+                spool.write(line)
+                spool.flush()
+                return
+
+
+def enqueue(data):
+    """Append one validated message (name, email, message) to the spool."""
+    record = {
+        "name": data["name"],
+        "email": data["email"],
+        "message": data["message"],
+        "created_at": timezone.now().isoformat(),
+    }
+    _locked_append(spool_dir() / INCOMING, json.dumps(record) + "\n")
+
+
+def _claim():
+    """Move the incoming spool aside and return every claimed file, oldest first."""
+    directory = spool_dir()
+    try:
+        os.rename(directory / INCOMING, directory / f"{CLAIMED_PREFIX}{time.time_ns()}.jsonl")
+    except FileNotFoundError:
+        pass
+    # Files left by a drainer that stopped midway are picked up again.
+    return sorted(directory.glob(f"{CLAIMED_PREFIX}*.jsonl"))
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as spool:
+        # Wait for any append that opened the file before it was claimed.
+        _lock(spool)
+        for line in spool:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _recent_digests(records):
+    since = timezone.now() - timedelta(seconds=settings.CONTACT_DEDUP_WINDOW)
+    emails = {record["email"] for record in records}
+    recent = ContactMessage.objects.filter(created_at__gte=since, email__in=emails).values_list("email", "message")
+    return {message_digest(email, message) for email, message in recent}
+
+
+def drain(batch_size=500):
+    """
+    Persist everything queued so far. Returns (saved, duplicates).
+
+    Each claimed file is written in one transaction and removed only after
+    it commits, so a crash re-processes the file rather than losing it.
+    """
+    saved = duplicates = 0
+    for path in _claim():
+        records = list(_read(path))
+        seen = _recent_digests(records) if records else set()
+        messages = []
+        for record in records:
+            digest = message_digest(record["email"], record["message"])
+            if digest in seen:
+                duplicates += 1
+                continue
+            seen.add(digest)
+            messages.append(ContactMessage(
+                name=record["name"],
+                email=record["email"],
+                message=record["message"],
+                created_at=parse_datetime(record["created_at"]),
+            ))
+        with transaction.atomic():
+            ContactMessage.objects.bulk_create(messages, batch_size=batch_size)
+        path.unlink()
+        saved += len(messages)
+    return saved, duplicates
@@ -0,0 +1,22 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+
+def add_to_counter(model, field, amount, **key):
+    """
+    Add `amount` to `field` on the summary row identified by `key`.
+
+    Issues an atomic `UPDATE ... SET field = field + amount` and only
+    inserts when the row does not exist yet. `key` must match a unique
+    constraint on `model` so racing inserts collapse into one row.
+    """
+    if not amount:
+        return
+    if model.objects.filter(**key).update(**{field: F(field) + amount}):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**key, **{field: amount})
+    except IntegrityError:
+        # Another request created the row first; add to it instead.
+        model.objects.filter(**key).update(**{field: F(field) + amount})
@@ -0,0 +1,59 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+
+REPLICA_ALIAS = "replica"
+
+_read_from_replica = ContextVar("read_from_replica", default=False)
+
+
+@contextmanager
+def use_replica():
+    """Route ORM reads made inside the block to the replica, if one is configured."""
+    token = _read_from_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to `replica` only inside `use_replica()`; everything else,
+    and every write, goes to `default`. Without a `replica` entry in
+    DATABASES it routes everything to `default`.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _read_from_replica.get() and REPLICA_ALIAS in settings.DATABASES:
+            return REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema through replication.
+        return db != REPLICA_ALIAS
+
+
+class ReplicaReadMixin:
+    """
+    For read-only staff list views: GET/HEAD requests read from the replica.
+
+    Replication lag is acceptable for these dashboards; anything that must
+    see its own writes should not use this mixin.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            with use_replica():
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
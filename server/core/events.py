@@ -0,0 +1,90 @@
+"""
+Booking change log behind the staff dashboards' live feed.
+
+Every booking create, status change and delete appends a BookingEvent
+(see core.signals); the SSE view in core.async_views tails the log from
+the client's last event id, so dashboards receive deltas instead of
+re-polling the full order lists.
+
+Ids are taken when a row is inserted but become visible when its
+transaction commits, so on PostgreSQL a lower id can appear after a
+higher one. The stream never moves past a gap in the ids until the
+event after it is older than BOOKING_EVENTS_SETTLE_SECONDS; by then the
+missing id has committed or was rolled back. Events therefore go out in
+id order, each exactly once, and `Last-Event-ID` stays an exact resume
+point.
+"""
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import BookingEvent
+
+
+def _event(booking, kind):
+    return BookingEvent(
+        kind=kind,
+        booking_id=booking.pk,
+        user_id=booking.user_id,
+        type=booking.type,
+        date=booking.date,
+        status=booking.status,
+    )
+
+
+def record_event(booking, kind):
+    _event(booking, kind).save()
+
+
+def record_events(bookings, kind="created"):
+    """Log a batch of bookings in one INSERT (for bulk_create, which skips signals)."""
+    BookingEvent.objects.bulk_create([_event(booking, kind) for booking in bookings])
+
+
+def settled_before():
+    """Events created before this can no longer have uncommitted lower ids."""
+    return timezone.now() - timedelta(seconds=settings.BOOKING_EVENTS_SETTLE_SECONDS)
+
+
+async def alatest_event_id():
+    """Where a fresh stream starts: the newest event with no gap still open before it."""
+    latest = await BookingEvent.objects.filter(created_at__lt=settled_before()).aaggregate(latest=Max("id"))
+    return latest["latest"] or 0
+
+
+def ready_events(batch, last_id, settled):
+    """
+    The leading events of `batch` (ordered by id, all after `last_id`)
+    that can be sent: it stops at the first gap in the ids unless the
+    event after the gap was created before `settled`.
+    """
+    ready = []
+    for event in batch:
+        if event.pk != last_id + 1 and event.created_at >= settled:
+            break
+        ready.append(event)
+        last_id = event.pk
+    return ready
+
+
+def format_event(event):
+    """One Server-Sent Events frame for a BookingEvent."""
+    data = json.dumps({
+        "booking": event.booking_id,
+        "user": event.user_id,
+        "type": event.type,
+        "date": event.date,
+        "status": event.status,
+        "at": event.created_at,
+    }, cls=DjangoJSONEncoder)
+    return f"id: {event.pk}\nevent: {event.kind}\ndata: {data}\n\n"
+
+
+def prune_events(before):
+    """Delete events logged before `before`. Returns the number removed."""
+    deleted, _ = BookingEvent.objects.filter(created_at__lt=before).delete()
+    return deleted
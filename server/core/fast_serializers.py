@@ -0,0 +1,292 @@
+"""
+Read-only serializers that build rows straight from `values_list()`.
+
+They produce exactly the JSON of the matching ModelSerializers in
+core.serializers (same keys, order and formatting) without creating model
+instances or running per-field `to_representation`. Each field's converter
+is chosen once, from the model field type, when the serializer is built.
+Only for output: validation and writes still go through core.serializers.
+
+Every serializer also accepts a sparse fieldset (`?fields=`) and embedded
+relations (`?include=user`); see `for_params()`.
+"""
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+
+from asgiref.sync import sync_to_async
+from django.db import models
+from django.utils import timezone
+
+from .metrics import timed_serialization
+from .models import Booking, Item, OrderLine
+
+
+def _datetime(value):
+    # As DRF's DateTimeField: current time zone, ISO 8601, "Z" for UTC.
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _date(value):
+    return value.isoformat()
+
+
+def _decimal(places):
+    quantum = Decimal(1).scaleb(-places)
+
+    def convert(value):
+        return f"{value.quantize(quantum):f}"
+    return convert
+
+
+def converter_for(field):
+    """The function turning a database value of `field` into its JSON form, or None."""
+    if isinstance(field, models.DateTimeField):
+        return _datetime
+    if isinstance(field, models.DateField):
+        return _date
+    if isinstance(field, models.DecimalField):
+        return _decimal(field.decimal_places)
+    return None
+
+
+class ValuesSerializer:
+    """
+    Subclasses set `model` and `fields` (output names, in output order);
+    `sources` maps an output name to another ORM lookup, and `includes`
+    maps a foreign key that may be embedded to the related fields shown.
+
+    An instance can be narrowed to some of the fields and can embed
+    included relations in place of their ids; the related columns are
+    read through the same query's JOIN.
+    """
+
+    model = None
+    fields = ()
+    sources = {}
+    includes = {}
+
+    def __init__(self, fields=None, include=()):
+        if fields is not None:
+            self.fields = tuple(fields)
+        self.include = tuple(include)
+        for relation in self.include:
+            if relation not in self.fields:
+                self.fields += (relation,)
+
+        # Output plan: (name, converters) where converters is a single
+        # converter for a plain column, or a tuple of (name, converter)
+        # for an embedded relation spanning several columns.
+        lookups, plan = [], []
+        for name in self.fields:
+            if name in self.include:
+                related = tuple(f"{name}__{field}" for field in self.includes[name])
+                lookups.extend(related)
+                plan.append((name, tuple(
+                    (field, converter_for(self._model_field(lookup)))
+                    for field, lookup in zip(self.includes[name], related)
+                )))
+            else:
+                lookup = self.sources.get(name, name)
+                lookups.append(lookup)
+                plan.append((name, converter_for(self._model_field(lookup))))
+        self.lookups = tuple(lookups)
+        self.converters = tuple(convert for _, convert in plan)
+        self._plan = plan
+        if len(self.lookups) > 1:
+            self._row_getter = itemgetter(*self.lookups)
+        elif self.lookups:
+            getter = itemgetter(*self.lookups)
+            self._row_getter = lambda row: (getter(row),)
+        else:
+            # Only reachable from BookingOrderValues with `order` alone.
+            self._row_getter = lambda row: ()
+
+    def _model_field(self, lookup):
+        model = self.model
+        *relations, name = lookup.split("__")
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    def represent(self, row):
+        """One row (a tuple in `lookups` order) as an output dict."""
+        if not self.include:
+            return {
+                name: value if convert is None or value is None else convert(value)
+                for name, convert, value in zip(self.fields, self.converters, row)
+            }
+        values = iter(row)
+        result = {}
+        for name, convert in self._plan:
+            if isinstance(convert, tuple):
+                related = {
+                    field: value if field_convert is None or value is None else field_convert(value)
+                    for (field, field_convert), value in zip(convert, values)
+                }
+                result[name] = None if related[next(iter(related))] is None else related
+            else:
+                value = next(values)
+                result[name] = value if convert is None or value is None else convert(value)
+        return result
+
+    @timed_serialization()
+    def serialize(self, queryset):
+        represent = self.represent
+        return [represent(row) for row in queryset.values_list(*self.lookups)]
+
+    async def aserialize(self, queryset):
+        represent = self.represent
+        with timed_serialization():
+            return [represent(row) async for row in queryset.values_list(*self.lookups)]
+
+    @timed_serialization()
+    def serialize_page(self, rows):
+        """
+        Rows of `queryset.values()` covering at least `lookups`, e.g. a page
+        cut by a paginator that needed extra ordering columns.
+        """
+        represent, getter = self.represent, self._row_getter
+        return [represent(getter(row)) for row in rows]
+
+
+USER_FIELDS = ("id", "username", "email")
+
+
+class ItemValues(ValuesSerializer):
+    """Output of ItemSerializer."""
+
+    model = Item
+    fields = ("id", "name", "description", "category", "price", "created_at")
+
+
+class BookingValues(ValuesSerializer):
+    """Output of BookingSerializer; `include=user` embeds the guest's id, username and email."""
+
+    model = Booking
+    fields = ("id", "user", "type", "date", "status", "created_at")
+    includes = {"user": USER_FIELDS}
+
+
+class OrderLineValues(ValuesSerializer):
+    """Output of OrderLineSerializer."""
+
+    model = OrderLine
+    fields = ("item", "item_name", "quantity", "unit_price", "line_total")
+
+
+class BookingOrderValues(BookingValues):
+    """
+    Output of BookingOrderSerializer, in two queries: the bookings joined
+    to their order, then every line of those orders. Leaving `order` out
+    of the fields skips both the join and the lines query; listing it
+    among others keeps its position.
+    """
+
+    fields = BookingValues.fields + ("order",)
+    order_fields = ("id", "meal", "total")
+
+    def __init__(self, fields=None, include=()):
+        fields = self.fields if fields is None else tuple(fields)
+        self.with_order = "order" in fields
+        super().__init__([name for name in fields if name != "order"], include)
+        # Key order when `order` is not last (e.g. `fields=order,type`).
+        output = fields + tuple(relation for relation in self.include if relation not in fields)
+        self._output_order = output if self.with_order and output != self.fields + ("order",) else None
+        self.lines = OrderLineValues()
+        self.order_lookups = tuple(f"order__{name}" for name in self.order_fields) if self.with_order else ()
+        self.order_converters = tuple(converter_for(self._model_field(lookup)) for lookup in self.order_lookups)
+
+    @timed_serialization()
+    def serialize(self, queryset):
+        if not self.with_order:
+            return super().serialize(queryset)
+        width = len(self.lookups)
+        rows = list(queryset.values_list(*self.lookups, *self.order_lookups))
+
+        lines = {}
+        order_ids = [row[width] for row in rows if row[width] is not None]
+        if order_ids:
+            line_rows = (
+                OrderLine.objects.filter(order_id__in=order_ids)
+                .order_by("id")
+                .values_list("order_id", *self.lines.lookups)
+            )
+            for order_id, *line in line_rows:
+                lines.setdefault(order_id, []).append(self.lines.represent(line))
+
+        results = []
+        for row in rows:
+            booking = self.represent(row[:width])
+            order_id = row[width]
+            if order_id is None:
+                booking["order"] = None
+            else:
+                order = {
+                    name: value if convert is None else convert(value)
+                    for name, convert, value in zip(self.order_fields, self.order_converters, row[width:])
+                }
+                order["lines"] = lines.get(order_id, [])
+                booking["order"] = order
+            results.append(booking)
+        if self._output_order is not None:
+            results = [{name: booking[name] for name in self._output_order} for booking in results]
+        return results
+
+    async def aserialize(self, queryset):
+        if not self.with_order:
+            return await super().aserialize(queryset)
+        return await sync_to_async(self.serialize)(queryset)
+
+
+@lru_cache(maxsize=256)
+def _build(serializer_class, fields, include):
+    return serializer_class(fields, include)
+
+
+def _split(value):
+    return tuple(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+
+
+def for_params(serializer_class, params):
+    """
+    Serializer for the `fields` and `include` query params, as (serializer, errors).
+
+    `fields=type,status,date` keeps only those keys (in that order) and
+    reads only their columns; `include=user` embeds the related object.
+    Instances are cached per combination, so converters are built once.
+    """
+    errors = {}
+    fields = include = None
+    if params.get("fields"):
+        fields = _split(params["fields"])
+        unknown = [name for name in fields if name not in serializer_class.fields]
+        if not fields:
+            errors["fields"] = ["Select at least one field."]
+        elif unknown:
+            errors["fields"] = [f"Unknown field(s): {', '.join(unknown)}."]
+    if params.get("include"):
+        include = _split(params["include"])
+        unknown = [name for name in include if name not in serializer_class.includes]
+        if unknown:
+            errors["include"] = [f"Cannot include: {', '.join(unknown)}."]
+    if errors:
+        return None, errors
+    return _build(serializer_class, fields, include or ()), {}
+
+
+def project_fields(rows, fields):
+    """Narrow already serialized rows (e.g. a cached catalog) to `fields`."""
+    if not rows or tuple(rows[0]) == fields:
+        return rows
+    return [{name: row[name] for name in fields} for row in rows]
+
+
+item_values = ItemValues()
+booking_values = BookingValues()
+booking_order_values = BookingOrderValues()
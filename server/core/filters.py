@@ -0,0 +1,74 @@
+from datetime import date
+
+from .models import Booking
+
+
+BOOKING_TYPE_VALUES = {value for value, _ in Booking.BOOKING_TYPES} | {"catering", "stationery"}
+BOOKING_STATUS_VALUES = {value for value, _ in Booking.STATUS_CHOICES}
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def date_range_filters(params, field="date"):
+    """
+    Lookups for the inclusive `date_from`/`date_to` query params.
+
+    Returns `(filters, errors)` in the same shape as filter_bookings.
+    """
+    filters = {}
+    errors = {}
+    for param, lookup in (("date_from", f"{field}__gte"), ("date_to", f"{field}__lte")):
+        raw = params.get(param)
+        if raw:
+            parsed = _parse_date(raw)
+            if parsed is None:
+                errors[param] = ["Enter a valid date in YYYY-MM-DD format."]
+            else:
+                filters[lookup] = parsed
+    return filters, errors
+
+
+def filter_bookings(queryset, params):
+    """
+    Apply the manager booking filters from query params.
+
+    Supported params: `type`, `status`, `date_from`, `date_to` (ISO dates,
+    inclusive) and `user` (user id). Returns `(queryset, errors)`; when
+    `errors` is non-empty the queryset must not be used.
+    """
+    errors = {}
+    filters = {}
+
+    booking_type = params.get("type")
+    if booking_type:
+        if booking_type not in BOOKING_TYPE_VALUES:
+            errors["type"] = [f"Unknown booking type '{booking_type}'."]
+        else:
+            filters["type"] = booking_type
+
+    booking_status = params.get("status")
+    if booking_status:
+        if booking_status not in BOOKING_STATUS_VALUES:
+            errors["status"] = [f"Unknown booking status '{booking_status}'."]
+        else:
+            filters["status"] = booking_status
+
+    date_filters, date_errors = date_range_filters(params)
+    filters.update(date_filters)
+    errors.update(date_errors)
+
+    user = params.get("user")
+    if user:
+        if not user.isdigit():
+            errors["user"] = ["User must be a numeric id."]
+        else:
+            filters["user_id"] = int(user)
+
+    if errors:
+        return queryset.none(), errors
+    return queryset.filter(**filters), errors
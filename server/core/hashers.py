@@ -0,0 +1,88 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher,
+    check_password,
+    get_hasher,
+    identify_hasher,
+    make_password,
+)
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the work factor taken from `PASSWORD_PBKDF2_ITERATIONS`.
+
+    It keeps Django's `pbkdf2_sha256` algorithm name, so existing hashes stay
+    valid. When the setting changes, hashes are upgraded or downgraded
+    transparently the next time their owner logs in (see verify_password).
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, "PASSWORD_PBKDF2_ITERATIONS", None) or PBKDF2PasswordHasher.iterations
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def default_hash_workers():
+    return max(1, (os.cpu_count() or 1) // 2)
+
+
+def _hashing_pool():
+    """
+    Dedicated, bounded pool for password hashing.
+
+    hashlib releases the GIL while hashing, so work here runs in parallel,
+    but never more than PASSWORD_HASH_WORKERS hashes at once (by default
+    half the CPUs). A login burst therefore cannot take every core from
+    requests that are waiting on I/O, nor from the other worker processes
+    on the host, each of which has a pool of its own.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = getattr(settings, "PASSWORD_HASH_WORKERS", 0) or default_hash_workers()
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    return _pool
+
+
+def run_hashing(func, *args):
+    return _hashing_pool().submit(func, *args).result()
+
+
+def hash_password(raw_password):
+    return run_hashing(make_password, raw_password)
+
+
+def needs_rehash(encoded):
+    """True if `encoded` was made by a different hasher or work factor than the current profile."""
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    preferred = get_hasher("default")
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def verify_password(user, raw_password):
+    """
+    Check `raw_password` against `user` on the hashing pool.
+
+    On success, a hash made with an outdated profile is replaced and saved.
+    Only the hashing runs on the pool; the save stays on the request's own
+    thread and DB connection.
+    """
+    encoded = user.password
+    if not run_hashing(check_password, raw_password, encoded):
+        return False
+    if needs_rehash(encoded):
+        user.password = hash_password(raw_password)
+        user.save(update_fields=["password"])
+    return True
@@ -0,0 +1,69 @@
+from django.db.models import F
+
+from .models import ActivitySlot
+
+
+class SlotUnavailable(Exception):
+    """Raised when a booking cannot be allocated a place in its activity slot."""
+
+
+def find_slot(activity, date, ship_id=None):
+    """
+    Return the id of the slot covering `activity` on `date`, or None.
+
+    Activities without a configured slot stay unlimited. When slots exist on
+    more than one ship the caller has to say which ship the booking is for.
+    """
+    slots = ActivitySlot.objects.filter(activity=activity, date=date)
+    if ship_id is not None:
+        slots = slots.filter(ship_id=ship_id)
+    slot_ids = list(slots.values_list("id", flat=True)[:2])
+
+    if not slot_ids:
+        if ship_id is not None and ActivitySlot.objects.filter(activity=activity, date=date).exists():
+            raise SlotUnavailable(f"No {activity} slot on ship {ship_id} for {date}.")
+        return None
+    if len(slot_ids) > 1:
+        raise SlotUnavailable("Several ships offer this activity on that date; specify a ship.")
+    return slot_ids[0]
+
+
+def reserve_places(slot_id, count=1):
+    """
+    Take `count` places from a slot.
+
+    This is a single `UPDATE ... SET remaining = remaining - n WHERE
+    remaining >= n`, so the check and the decrement are atomic in the
+    database and concurrent callers cannot overbook.
+    """
+    updated = ActivitySlot.objects.filter(pk=slot_id, remaining__gte=count).update(
+        remaining=F("remaining") - count
+    )
+    if not updated:
+        if count == 1:
+            raise SlotUnavailable("This activity is fully booked.")
+        raise SlotUnavailable(f"Not enough places left for {count} bookings.")
+
+
+def release_places(slot_id, count=1):
+    """
+    Give `count` places back to a slot, e.g. when a booking is cancelled.
+    Like `reserve_places` a single UPDATE; it never raises `remaining`
+    above the slot's capacity.
+    """
+    ActivitySlot.objects.filter(pk=slot_id, remaining__lte=F("capacity") - count).update(
+        remaining=F("remaining") + count
+    )
+
+
+def allocate(activity, date, ship_id=None, count=1):
+    """
+    Find and reserve places for `count` bookings. Must run inside the same
+    transaction that creates the bookings so a failed insert returns the places.
+    With `count=0` (bookings created cancelled) the slot is only looked up;
+    reinstating such a booking takes its place then.
+    """
+    slot_id = find_slot(activity, date, ship_id)
+    if slot_id is not None and count:
+        reserve_places(slot_id, count)
+    return slot_id
@@ -0,0 +1,63 @@
+from django.db import transaction
+from django.db.models import F, Sum
+
+from .caching import CacheNamespace
+from .counters import add_to_counter
+from .models import KitchenDemand, OrderLine
+
+# Production lists, retired whenever the summary table changes.
+production_cache = CacheNamespace("kitchen", timeout=60)
+
+
+def record_lines(date, meal, lines, sign=1):
+    """Add (or with sign=-1 remove) order lines from the daily summary."""
+    for line in lines:
+        add_to_counter(
+            KitchenDemand, "quantity", sign * line.quantity, date=date, meal=meal, item_name=line.item_name
+        )
+    production_cache.invalidate()
+
+
+def aggregate_demand(queryset=None):
+    """
+    Kitchen demand computed straight from OrderLine with one GROUP BY.
+
+    Returns dicts with `date`, `meal`, `item_name` and `quantity`.
+    """
+    lines = queryset if queryset is not None else OrderLine.objects.all()
+    return (
+        lines.filter(order__booking__type="catering")
+        .exclude(order__booking__status="cancelled")
+        .values(date=F("order__booking__date"), meal=F("order__meal"), name=F("item_name"))
+        .annotate(quantity=Sum("quantity"))
+        .order_by("date", "meal", "name")
+    )
+
+
+def rebuild_demand():
+    """Replace the summary table with a fresh aggregation. Returns the row count."""
+    rows = [
+        KitchenDemand(date=row["date"], meal=row["meal"], item_name=row["name"], quantity=row["quantity"])
+        for row in aggregate_demand()
+    ]
+    with transaction.atomic():
+        KitchenDemand.objects.all().delete()
+        KitchenDemand.objects.bulk_create(rows, batch_size=1000)
+    production_cache.invalidate()
+    return len(rows)
+
+
+def production_rows(**filters):
+    """
+    KitchenDemand rows with something to prepare, as dicts with `date`,
+    `meal`, `item_name` and `quantity`; cached per set of filters.
+    """
+    key = "production:" + ",".join(f"{lookup}={value}" for lookup, value in sorted(filters.items()))
+    return production_cache.get_or_set(
+        key,
+        lambda: list(
+            KitchenDemand.objects.filter(quantity__gt=0, **filters)
+            .order_by("date", "meal", "item_name")
+            .values("date", "meal", "item_name", "quantity")
+        ),
+    )
@@ -0,0 +1,36 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.accounts import onboard_voyagers
+
+
+class Command(BaseCommand):
+    help = (
+        "Create voyager accounts from a passenger manifest CSV with an `email` "
+        "column and optional `username`, `password`, `first_name`, `last_name` "
+        "and `phone_number` columns. Rows without a password get an unusable one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="Path to the manifest CSV file.")
+        parser.add_argument("--workers", type=int, default=None,
+                            help="Password hashing processes (default: one per CPU).")
+        parser.add_argument("--batch-size", type=int, default=200,
+                            help="Accounts written per INSERT batch.")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["manifest"], newline="", encoding="utf-8-sig") as manifest:
+                reader = csv.DictReader(manifest)
+                if not reader.fieldnames or "email" not in reader.fieldnames:
+                    raise CommandError("Manifest must have an 'email' column.")
+                rows = list(reader)
+        except OSError as exc:
+            raise CommandError(f"Cannot read manifest: {exc}")
+
+        created, skipped = onboard_voyagers(rows, workers=options["workers"], batch_size=options["batch_size"])
+
+        for number, reason in skipped:
+            self.stderr.write(f"Row {number}: skipped ({reason})")
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} voyagers, skipped {len(skipped)}."))
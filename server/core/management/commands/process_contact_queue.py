@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.contact_queue import drain
+
+
+class Command(BaseCommand):
+    help = (
+        "Save contact messages queued by the contact endpoint (CONTACT_QUEUE=True). "
+        "Runs until stopped, draining every --interval seconds; use --once from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit.")
+        parser.add_argument("--interval", type=float, default=2.0, help="Seconds between drains (default 2).")
+        parser.add_argument("--batch-size", type=int, default=500, help="Messages written per INSERT batch.")
+
+    def handle(self, *args, **options):
+        while True:
+            saved, duplicates = drain(batch_size=options["batch_size"])
+            if saved or duplicates or options["once"]:
+                self.stdout.write(f"Saved {saved} contact messages, dropped {duplicates} duplicates.")
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
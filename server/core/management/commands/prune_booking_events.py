@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.events import prune_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete booking events older than --days from the live feed log. "
+        "Dashboards offline for longer than that should reload their lists."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7, help="Events to keep, in days (default 7).")
+
+    def handle(self, *args, **options):
+        count = prune_events(timezone.now() - timedelta(days=options["days"]))
+        self.stdout.write(self.style.SUCCESS(f"Pruned {count} booking events."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.revocation import prune_revocations
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete revoked-token records whose tokens have expired. The cache "
+        "entries expire on their own; this only compacts the table."
+    )
+
+    def handle(self, *args, **options):
+        count = prune_revocations()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {count} revoked tokens."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.sync import prune_tombstones, tombstone_horizon
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete delta sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS. "
+        "Clients syncing from before that get a full listing instead."
+    )
+
+    def handle(self, *args, **options):
+        count = prune_tombstones(tombstone_horizon())
+        self.stdout.write(self.style.SUCCESS(f"Pruned {count} tombstones."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.analytics import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the BookingDailyStat rollups from the Booking table. "
+        "Schedule periodically, or run after bulk edits that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        count = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt booking rollups: {count} rows."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.kitchen import rebuild_demand
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the KitchenDemand summary from catering order lines. "
+        "Run after bulk edits that bypass model signals (e.g. QuerySet.update)."
+    )
+
+    def handle(self, *args, **options):
+        count = rebuild_demand()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt kitchen demand: {count} rows."))
@@ -0,0 +1,260 @@
+"""
+Per-route request metrics, exported in the Prometheus text format.
+
+RequestMetricsMiddleware times every request and counts the SQL it runs.
+Serialization time is the time core.fast_serializers spend turning rows
+into response data, less the SQL they run; render time is the time
+TimedJSONRenderer (core.renderers) spends encoding that data as JSON.
+DRF serializers, used for single-object write responses, are not
+timed separately. Figures are kept per process: scrape each worker, or
+run a single worker per metrics port. Requests slower than
+SLOW_REQUEST_THRESHOLD_MS are logged to the `core.slow_requests` logger
+with the SQL they executed.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse, StreamingHttpResponse
+
+slow_request_logger = logging.getLogger("core.slow_requests")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set, as Prometheus expects."""
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series = {}
+
+    def observe(self, labels, value):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+        counts = series[0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        series[1] += value
+        series[2] += 1
+
+    def exposition(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total:g}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._create()
+
+    def _create(self):
+        self.latency = Histogram("http_request_duration_seconds", "Time to produce the response.", LATENCY_BUCKETS)
+        self.queries = Histogram("http_request_db_queries", "SQL statements per request.", QUERY_BUCKETS)
+        self.db_time = Histogram("http_request_db_seconds", "Time spent in SQL per request.", LATENCY_BUCKETS)
+        self.serialize_time = Histogram(
+            "http_request_serialize_seconds", "Time spent building the response data, excluding SQL.", LATENCY_BUCKETS
+        )
+        self.render_time = Histogram(
+            "http_request_render_seconds", "Time spent encoding the response data as JSON.", LATENCY_BUCKETS
+        )
+        self.size = Histogram("http_response_size_bytes", "Response body size.", SIZE_BUCKETS)
+
+    def record(self, labels, stats):
+        with self._lock:
+            self.latency.observe(labels, stats.duration)
+            self.queries.observe(labels, stats.query_count)
+            self.db_time.observe(labels, stats.query_time)
+            self.serialize_time.observe(labels, stats.serialize_time)
+            self.render_time.observe(labels, stats.render_time)
+            if stats.size is not None:
+                self.size.observe(labels, stats.size)
+
+    def exposition(self):
+        with self._lock:
+            lines = []
+            histograms = (self.latency, self.queries, self.db_time, self.serialize_time, self.render_time, self.size)
+            for histogram in histograms:
+                lines.extend(histogram.exposition())
+        for collector in _collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._create()
+
+
+registry = Registry()
+
+# Callables returning extra exposition lines (e.g. core.caching's counters).
+_collectors = []
+
+
+def register_collector(collector):
+    if collector not in _collectors:
+        _collectors.append(collector)
+
+
+class RequestStats:
+    __slots__ = (
+        "started", "duration", "query_count", "query_time", "serialize_time", "serializing", "render_time",
+        "size", "statements",
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.query_count = 0
+        self.query_time = 0.0
+        self.serialize_time = 0.0
+        self.serializing = False
+        self.render_time = 0.0
+        self.size = None
+        self.statements = []
+
+
+# Stats of the request being handled; a context variable so that queries
+# the async ORM runs in a worker thread are still attributed to it.
+current_stats = ContextVar("current_request_stats", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats.query_count += 1
+        stats.query_time += elapsed
+        if len(stats.statements) < settings.SLOW_REQUEST_MAX_QUERIES:
+            stats.statements.append((elapsed, sql))
+
+
+@contextmanager
+def timed_serialization():
+    """Add the time spent in the block, less its SQL, to the request's serialization time."""
+    stats = current_stats.get()
+    # Nested blocks (a serializer calling another) are counted once.
+    if stats is None or stats.serializing:
+        yield
+        return
+    stats.serializing = True
+    started, query_time = time.perf_counter(), stats.query_time
+    try:
+        yield
+    finally:
+        stats.serializing = False
+        stats.serialize_time += time.perf_counter() - started - (stats.query_time - query_time)
+
+
+@receiver(connection_created)
+def instrument_connection(sender, connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def route_label(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "<unmatched>"
+    return "/" + match.route
+
+
+class RequestMetricsMiddleware:
+    """Records latency, SQL count and time, serialization and render time and size per route."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_stats.reset(token)
+        self.finish(request, response, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_stats.reset(token)
+        self.finish(request, response, stats)
+        return response
+
+    def finish(self, request, response, stats):
+        stats.duration = time.perf_counter() - stats.started
+        if not isinstance(response, StreamingHttpResponse):
+            stats.size = len(response.content)
+        route = route_label(request)
+        registry.record((("method", request.method), ("route", route), ("status", str(response.status_code))), stats)
+
+        threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+        if threshold and stats.duration * 1000 >= threshold:
+            slowest = sorted(stats.statements, reverse=True)
+            slow_request_logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms\n%s",
+                request.method, request.get_full_path(), route, stats.duration * 1000,
+                stats.query_count, stats.query_time * 1000,
+                "\n".join(f"  {elapsed * 1000:.1f} ms  {sql}" for elapsed, sql in slowest),
+            )
+
+
+def scraper_address(request):
+    """
+    The client address to check against METRICS_ALLOWED_IPS, or None.
+
+    Behind METRICS_TRUSTED_PROXIES reverse proxies, each appends the
+    address it was reached from to X-Forwarded-For, so the client is the
+    entry that many places from the end; entries before it are whatever
+    the client sent. With no trusted proxies, a request carrying the
+    header came through some proxy anyway, and REMOTE_ADDR is only that
+    proxy's address (often 127.0.0.1), so it is refused.
+    """
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+    proxies = settings.METRICS_TRUSTED_PROXIES
+    if not proxies:
+        return None if forwarded else request.META.get("REMOTE_ADDR")
+    addresses = [address.strip() for address in (forwarded or "").split(",") if address.strip()]
+    return addresses[-proxies] if len(addresses) >= proxies else None
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint, limited to METRICS_ALLOWED_IPS (see scraper_address)."""
+    if scraper_address(request) not in settings.METRICS_ALLOWED_IPS:
+        return HttpResponse(status=404)
+    return HttpResponse(registry.exposition(), content_type="text/plain; version=0.0.4; charset=utf-8")
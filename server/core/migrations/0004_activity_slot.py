@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_booking_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivitySlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activity', models.CharField(max_length=50)),
+                ('date', models.DateField()),
+                ('capacity', models.PositiveIntegerField(blank=True)),
+                ('remaining', models.PositiveIntegerField(blank=True)),
+                ('ship', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_slots', to='core.cruiseship')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='slot',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bookings', to='core.activityslot'),
+        ),
+        migrations.AddIndex(
+            model_name='activityslot',
+            index=models.Index(fields=['activity', 'date'], name='activity_slot_lookup_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='activityslot',
+            constraint=models.UniqueConstraint(fields=('ship', 'activity', 'date'), name='unique_activity_slot'),
+        ),
+        migrations.AddConstraint(
+            model_name='activityslot',
+            constraint=models.CheckConstraint(condition=models.Q(('remaining__lte', models.F('capacity'))), name='activity_slot_remaining_lte_capacity'),
+        ),
+    ]
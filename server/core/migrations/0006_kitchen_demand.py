@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_order'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='meal',
+            field=models.CharField(choices=[('any', 'Any time'), ('breakfast', 'Breakfast'), ('lunch', 'Lunch'), ('dinner', 'Dinner')], default='any', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='KitchenDemand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('meal', models.CharField(choices=[('any', 'Any time'), ('breakfast', 'Breakfast'), ('lunch', 'Lunch'), ('dinner', 'Dinner')], max_length=20)),
+                ('item_name', models.CharField(max_length=255)),
+                ('quantity', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('date', 'meal', 'item_name'), name='unique_kitchen_demand')],
+            },
+        ),
+    ]
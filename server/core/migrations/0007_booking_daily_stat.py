@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:55
+
+from django.db import migrations, models
+
+
+def backfill_daily_stats(apps, schema_editor):
+    Booking = apps.get_model("core", "Booking")
+    BookingDailyStat = apps.get_model("core", "BookingDailyStat")
+    rows = Booking.objects.values("date", "type", "status").annotate(count=models.Count("id")).order_by()
+    BookingDailyStat.objects.bulk_create((BookingDailyStat(**row) for row in rows), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_kitchen_demand'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('type', models.CharField(max_length=50)),
+                ('status', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('date', 'type', 'status'), name='unique_booking_daily_stat')],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
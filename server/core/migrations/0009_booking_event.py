@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_user_manager'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('created', 'Created'), ('status_changed', 'Status changed'), ('deleted', 'Deleted')], max_length=20)),
+                ('booking_id', models.IntegerField()),
+                ('user_id', models.IntegerField()),
+                ('type', models.CharField(max_length=50)),
+                ('date', models.DateField()),
+                ('status', models.CharField(max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['type', 'id'], name='booking_event_type_id_idx'), models.Index(fields=['created_at'], name='booking_event_created_idx')],
+            },
+        ),
+    ]
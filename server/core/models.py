@@ -1,5 +1,5 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from django.conf import settings
@@ -7,6 +7,24 @@ from django.conf import settings
 # =======================
 # Custom User Model
 # =======================
+class UserManager(DjangoUserManager):
+    """Users log in by email; when no username is given one is derived from it."""
+
+    def _with_username(self, email, username):
+        if username:
+            return username
+        from .accounts import allocate_username, username_base
+        return allocate_username(username_base(self.normalize_email(email)))
+
+    def create_user(self, email=None, password=None, username=None, **extra_fields):
+        username = self._with_username(email, username)
+        return super().create_user(username, email, password, **extra_fields)
+
+    def create_superuser(self, email=None, password=None, username=None, **extra_fields):
+        username = self._with_username(email, username)
+        return super().create_superuser(username, email, password, **extra_fields)
+
+
 class User(AbstractUser):
     email = models.EmailField(unique=True)
 
@@ -19,6 +37,8 @@ class User(AbstractUser):
 
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.VOYAGER)
 
+    objects = UserManager()
+
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
@@ -84,10 +104,64 @@ class Item(models.Model):
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     price = models.DecimalField(max_digits=8, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="item_updated_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.category})"
     
+# =======================
+# ActivitySlot Model
+# =======================
+class ActivitySlot(models.Model):
+    """
+    Bookable capacity for one activity on one ship and date.
+
+    `remaining` is only ever changed with a conditional UPDATE (see
+    core.inventory), so concurrent bookings can never push it below zero.
+    Cancelling or deleting a booking gives its place back (core.signals).
+    """
+
+    ship = models.ForeignKey(CruiseShip, on_delete=models.CASCADE, related_name="activity_slots")
+    activity = models.CharField(max_length=50)
+    date = models.DateField()
+    capacity = models.PositiveIntegerField(blank=True)
+    remaining = models.PositiveIntegerField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["ship", "activity", "date"], name="unique_activity_slot"),
+            models.CheckConstraint(
+                condition=models.Q(remaining__lte=models.F("capacity")),
+                name="activity_slot_remaining_lte_capacity",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["activity", "date"], name="activity_slot_lookup_idx"),
+        ]
+
+    def _apply_capacity_defaults(self):
+        # Default to the ship's capacity and start with every place free.
+        if self.capacity is None and self.ship_id is not None:
+            self.capacity = self.ship.capacity
+        if self.remaining is None:
+            self.remaining = self.capacity
+
+    def clean(self):
+        self._apply_capacity_defaults()
+
+    def save(self, *args, **kwargs):
+        self._apply_capacity_defaults()
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.ship} - {self.activity} on {self.date} ({self.remaining}/{self.capacity})"
+
+
 # =======================
 # Booking Model
 # =======================
@@ -115,6 +189,208 @@ class Booking(models.Model):
     date = models.DateField()
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="pending")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    slot = models.ForeignKey(
+        ActivitySlot,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="bookings"
+    )
+
+    class Meta:
+        indexes = [
+            # Keyset pagination on (created_at, id), optionally narrowed by a filter.
+            models.Index(fields=["created_at", "id"], name="booking_created_id_idx"),
+            models.Index(fields=["type", "created_at", "id"], name="booking_type_created_idx"),
+            models.Index(fields=["status", "created_at", "id"], name="booking_status_created_idx"),
+            models.Index(fields=["user", "created_at", "id"], name="booking_user_created_idx"),
+            models.Index(fields=["date"], name="booking_date_idx"),
+            models.Index(fields=["updated_at", "id"], name="booking_updated_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email} - {self.type} on {self.date} ({self.status})"
+
+# =======================
+# Order Models
+# =======================
+class Order(models.Model):
+    """
+    Line items behind a catering or stationery booking.
+
+    `total` is the sum of the lines' `line_total`, stored so fulfilment
+    views never have to aggregate lines on read.
+    """
+
+    MEAL_WINDOWS = [
+        ("any", "Any time"),
+        ("breakfast", "Breakfast"),
+        ("lunch", "Lunch"),
+        ("dinner", "Dinner"),
+    ]
+
+    booking = models.OneToOneField(Booking, on_delete=models.CASCADE, related_name="order")
+    meal = models.CharField(max_length=20, choices=MEAL_WINDOWS, default="any")
+    total = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Order #{self.pk} - {self.booking.type} ({self.total})"
+
+
+class OrderLine(models.Model):
+    """One ordered item. Name and price are snapshotted at order time."""
+
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="lines")
+    item = models.ForeignKey(Item, on_delete=models.SET_NULL, null=True, related_name="order_lines")
+    item_name = models.CharField(max_length=255)
+    quantity = models.PositiveIntegerField()
+    unit_price = models.DecimalField(max_digits=8, decimal_places=2)
+    line_total = models.DecimalField(max_digits=10, decimal_places=2)
+
+    def __str__(self):
+        return f"{self.quantity} x {self.item_name}"
+
+
+# =======================
+# KitchenDemand Model
+# =======================
+class KitchenDemand(models.Model):
+    """
+    Daily summary of catering quantities per meal window and item.
+
+    Maintained incrementally by core.kitchen as orders are placed,
+    cancelled or deleted; `manage.py rebuild_kitchen_demand` recomputes it
+    from OrderLine with a single GROUP BY.
+    """
+
+    date = models.DateField()
+    meal = models.CharField(max_length=20, choices=Order.MEAL_WINDOWS)
+    item_name = models.CharField(max_length=255)
+    quantity = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["date", "meal", "item_name"], name="unique_kitchen_demand"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.meal}: {self.quantity} x {self.item_name}"
+
+
+# =======================
+# BookingDailyStat Model
+# =======================
+class BookingDailyStat(models.Model):
+    """
+    Booking counts per service date, type and status.
+
+    Kept current by the Booking signals in core.signals (and explicitly by
+    bulk inserts); `manage.py rebuild_booking_rollups` recomputes it.
+    """
+
+    date = models.DateField()
+    type = models.CharField(max_length=50)
+    status = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["date", "type", "status"], name="unique_booking_daily_stat"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.type} {self.status}: {self.count}"
+
+
+# =======================
+# BookingEvent Model
+# =======================
+class BookingEvent(models.Model):
+    """
+    Append-only log of booking changes pushed to the staff dashboards.
+
+    The auto-increment id doubles as the SSE event id, so a reconnecting
+    client resumes with `Last-Event-ID`. Rows copy the booking fields
+    instead of referencing the booking, so deletions can be reported too.
+    Written by core.events; `manage.py prune_booking_events` trims it.
+    """
+
+    KINDS = [
+        ("created", "Created"),
+        ("status_changed", "Status changed"),
+        ("deleted", "Deleted"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KINDS)
+    booking_id = models.IntegerField()
+    user_id = models.IntegerField()
+    type = models.CharField(max_length=50)
+    date = models.DateField()
+    status = models.CharField(max_length=50)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["type", "id"], name="booking_event_type_id_idx"),
+            models.Index(fields=["created_at"], name="booking_event_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.pk} {self.kind} booking {self.booking_id}"
+
+
+# =======================
+# Tombstone Model
+# =======================
+class Tombstone(models.Model):
+    """
+    Record of a deleted Booking or Item, so delta sync clients (core.sync)
+    can drop rows they still hold. Written by the post_delete signals.
+    """
+
+    MODELS = [
+        ("booking", "Booking"),
+        ("item", "Item"),
+    ]
+
+    model = models.CharField(max_length=20, choices=MODELS)
+    object_id = models.IntegerField()
+    # Booking type or item category, for role-scoped feeds.
+    kind = models.CharField(max_length=50, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["model", "deleted_at"], name="tombstone_model_deleted_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} deleted {self.deleted_at}"
+
+
+# =======================
+# Revoked Token Model
+# =======================
+class RevokedToken(models.Model):
+    """
+    Durable record of a revoked JWT, or of every token a user was issued
+    before `issued_before` when `jti` is empty.
+
+    Lookups go through the cache (core.revocation); this table only
+    refills it after a flush. Rows are useless once `expires_at` passes,
+    since the tokens they cover are expired too; `manage.py
+    prune_revoked_tokens` removes them.
+    """
+
+    jti = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    user_id = models.IntegerField(null=True)
+    issued_before = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"{self.user.email} - {self.type} on {self.date} ({self.status})"
\ No newline at end of file
+        if self.jti:
+            return f"token {self.jti}"
+        return f"tokens of user {self.user_id} issued before {self.issued_before}"
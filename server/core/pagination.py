@@ -0,0 +1,90 @@
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class BookingCursorPagination(CursorPagination):
+    """
+    Keyset pagination for booking lists.
+
+    Pages are ordered by (created_at, id) so every page is an index range
+    scan on `booking_created_id_idx`, no matter how deep the client goes.
+    The cursor holds the (created_at, id) of the row the page starts after,
+    so bookings sharing a timestamp are never skipped or repeated and no
+    offset is needed. Cursors use DRF's encoding.
+
+    `page_queryset` and `set_page` split `paginate_queryset` around the
+    query, so async views can run it themselves.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def _get_position_from_instance(self, instance, ordering):
+        if isinstance(instance, dict):
+            created_at, pk = instance["created_at"], instance["id"]
+        else:
+            created_at, pk = instance.created_at, instance.pk
+        return f"{created_at.isoformat()}|{pk}"
+
+    def _beyond(self, position, reverse):
+        """Rows after `position` in page order (before it when `reverse`)."""
+        try:
+            created_at, pk = position.split("|")
+            created_at, pk = datetime.fromisoformat(created_at), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if reverse:
+            return Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+
+    def page_queryset(self, queryset, request):
+        """The query for the requested page, plus one row to detect a following page."""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.reverse = self.cursor is not None and self.cursor.reverse
+        self.position = None if self.cursor is None else self.cursor.position
+        if self.reverse:
+            queryset = queryset.order_by("created_at", "id")
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if self.position is not None:
+            queryset = queryset.filter(self._beyond(self.position, self.reverse))
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        """Take the rows `page_queryset` returned; returns the page in display order."""
+        rows = list(rows)
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = self.position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        return self.set_page(self.page_queryset(queryset, request))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering) if self.page else self.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering) if self.page else self.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
@@ -2,67 +2,84 @@ from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
 
 
+def request_role(request):
+    """
+    Role of the authenticated caller.
+
+    Read from the `role` claim of the validated JWT when there is one, so
+    no user attribute (or query) is needed; session-authenticated requests
+    fall back to `request.user.role`.
+    """
+    token = getattr(request, "auth", None)
+    if token is not None and hasattr(token, "get"):
+        role = token.get("role")
+        if role:
+            return role
+    return getattr(request.user, "role", None)
+
+
+# Booking types each staff role follows on its dashboard; None means all.
+STAFF_BOOKING_TYPES = {
+    "manager": None,
+    "head_cook": ("catering",),
+    "supervisor": ("stationery",),
+}
+
+
 class IsRole(BasePermission):
     """
     Base permission class for role-based access.
-    Views must define `allowed_roles = ['role1', 'role2', ...]`
-    or use the specific role-based classes below.
+
+    Subclasses set `roles` to the roles they admit; alternatively a view
+    can declare `allowed_roles = frozenset({'role1', 'role2'})` and use
+    `IsRole` directly. Either way the set is built once per class and never
+    written to during a request, so composing permissions with `|` is safe
+    under threaded workers.
     """
 
+    roles = frozenset()
+    message = "Your role does not have access to this endpoint."
+    _view_roles = {}
+
+    def get_roles(self, view):
+        if self.roles:
+            return self.roles
+        view_class = type(view)
+        roles = self._view_roles.get(view_class)
+        if roles is None:
+            roles = frozenset(role.lower() for role in getattr(view_class, "allowed_roles", ()))
+            self._view_roles[view_class] = roles
+        return roles
+
     def has_permission(self, request, view):
         # User must be authenticated
         if not request.user or not request.user.is_authenticated:
             return False
 
-        # Get roles defined in the view
-        allowed_roles = getattr(view, "allowed_roles", [])
-        user_role = getattr(request.user, "role", None)
-
-        # Normalize roles to lowercase for comparison
-        if isinstance(user_role, str):
-            user_role = user_role.lower()
-        allowed_roles = [r.lower() for r in allowed_roles]
-
+        roles = self.get_roles(view)
         # If no allowed roles are defined, block access
-        if not allowed_roles:
+        if not roles:
             raise PermissionDenied("No roles defined for this endpoint.")
 
-        # If user role does not match allowed roles → deny
-        if user_role not in allowed_roles:
-            raise PermissionDenied(
-                f"Access denied for role '{user_role}'. "
-                f"Allowed roles: {allowed_roles}"
-            )
-
-        return True
+        return request_role(request) in roles
 
 
 # 🔹 Easy role-specific permissions
 class IsVoyager(IsRole):
-    def has_permission(self, request, view):
-        view.allowed_roles = ["voyager"]
-        return super().has_permission(request, view)
+    roles = frozenset({"voyager"})
 
 
 class IsAdmin(IsRole):
-    def has_permission(self, request, view):
-        view.allowed_roles = ["admin"]
-        return super().has_permission(request, view)
+    roles = frozenset({"admin"})
 
 
 class IsManager(IsRole):
-    def has_permission(self, request, view):
-        view.allowed_roles = ["manager"]
-        return super().has_permission(request, view)
+    roles = frozenset({"manager"})
 
 
 class IsHeadCook(IsRole):
-    def has_permission(self, request, view):
-        view.allowed_roles = ["head_cook"]
-        return super().has_permission(request, view)
+    roles = frozenset({"head_cook"})
 
 
 class IsSupervisor(IsRole):
-    def has_permission(self, request, view):
-        view.allowed_roles = ["supervisor"]
-        return super().has_permission(request, view)
+    roles = frozenset({"supervisor"})
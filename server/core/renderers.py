@@ -0,0 +1,55 @@
+import time
+
+from rest_framework.renderers import JSONRenderer
+
+from .metrics import current_stats
+
+try:
+    import orjson
+except ImportError:  # optional: FastJSONRenderer then behaves like JSONRenderer
+    orjson = None
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer that reports its rendering time to the request metrics."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        started = time.perf_counter()
+        try:
+            return self.encode(data, accepted_media_type, renderer_context)
+        finally:
+            stats = current_stats.get()
+            if stats is not None:
+                stats.render_time += time.perf_counter() - started
+
+    def encode(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class FastJSONRenderer(TimedJSONRenderer):
+    """
+    Renders with orjson when it is installed, producing the same bytes as
+    DRF's JSONRenderer: compact, UTF-8, with datetimes, lazy strings and
+    other non-JSON types converted by DRF's encoder. Indented output (the
+    `indent` media type parameter) still goes through the stdlib encoder.
+    """
+
+    def encode(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().encode(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().encode(data, accepted_media_type, renderer_context)
+
+        encoder = self.encoder_class()
+        content = orjson.dumps(
+            data,
+            default=encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # Like JSONRenderer, escape the two characters JSON allows but JavaScript does not.
+        if b"\xe2\x80" in content:
+            content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return content
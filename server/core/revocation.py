@@ -0,0 +1,152 @@
+"""
+JWT revocation list.
+
+RevokedToken is the list itself; nothing is kept only in a cache, so no
+eviction or flush can bring a revoked token back.
+
+A single revoked token is a row with its `jti`. Refresh tokens are the
+only ones revoked one at a time (on rotation and on logout), and with
+BLACKLIST_AFTER_ROTATION every refresh inserts the presented token's row,
+so the unique `jti` column rejects a reused token without a lookup.
+Access tokens are not revoked singly; they expire within
+ACCESS_TOKEN_LIFETIME.
+
+Revoking every token of a user (e.g. when a guest disembarks) stores a
+cut-off time: tokens of that user issued before it are rejected, access
+tokens included, until the longest-lived of them would have expired
+anyway. Every process holds the unexpired cut-offs in memory and
+compares a generation marker in the shared cache before each check,
+reloading from the table when it changed; a missing marker (evicted or
+flushed) also forces a reload, so the check is one cache read and only
+touches the database after a revocation.
+
+`prune_revoked_tokens` deletes rows past their expiry.
+"""
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from .caching import shared_cache
+from .models import RevokedToken
+
+GENERATION_KEY = "revoked:users:generation"
+
+
+class _Cutoffs:
+    def __init__(self):
+        self.generation = None
+        # user id -> (issued_before timestamp, expires_at timestamp)
+        self.by_user = {}
+        self.lock = threading.Lock()
+
+
+_cutoffs = _Cutoffs()
+
+
+def _max_token_lifetime():
+    return max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME).total_seconds()
+
+
+def _bump_generation():
+    shared_cache().set(GENERATION_KEY, time.time_ns(), None)
+
+
+def cutoffs_current():
+    """True if this process holds every committed per-user cut-off."""
+    generation = shared_cache().get(GENERATION_KEY)
+    return generation is not None and generation == _cutoffs.generation
+
+
+def sync_cutoffs():
+    """Reload the per-user cut-offs if another revocation happened since the last load."""
+    shared = shared_cache()
+    generation = shared.get(GENERATION_KEY)
+    if generation is not None and generation == _cutoffs.generation:
+        return
+    with _cutoffs.lock:
+        if generation is not None and generation == _cutoffs.generation:
+            return
+        if generation is None:
+            shared.add(GENERATION_KEY, time.time_ns(), None)
+            generation = shared.get(GENERATION_KEY)
+        # The marker is read before the table, so a revocation committed
+        # after this query changes it and triggers another reload.
+        by_user = {}
+        rows = RevokedToken.objects.filter(jti__isnull=True, expires_at__gt=timezone.now())
+        for user_id, issued_before, expires_at in rows.values_list("user_id", "issued_before", "expires_at"):
+            cutoff = (issued_before.timestamp(), expires_at.timestamp())
+            by_user[user_id] = max(by_user.get(user_id, cutoff), cutoff)
+        _cutoffs.by_user = by_user
+        _cutoffs.generation = generation
+
+
+async def async_sync_cutoffs():
+    if not cutoffs_current():
+        await sync_to_async(sync_cutoffs)()
+
+
+def revoke_token(token):
+    """
+    Revoke a single token (anything with `jti` and `exp` claims).
+
+    Returns False if it was already revoked, so rotating the same refresh
+    token twice, even concurrently, lets only one request through.
+    """
+    payload = token.payload
+    if payload["exp"] <= time.time():
+        return True
+    try:
+        with transaction.atomic():
+            RevokedToken.objects.create(
+                jti=payload[api_settings.JTI_CLAIM],
+                user_id=payload.get(api_settings.USER_ID_CLAIM),
+                expires_at=datetime.fromtimestamp(payload["exp"], tz=dt_timezone.utc),
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def is_token_revoked(jti):
+    """Whether the token `jti` was revoked on its own (one query)."""
+    return RevokedToken.objects.filter(jti=jti).exists()
+
+
+def revoke_user_tokens(user_id):
+    """Revoke every token issued to `user_id` up to now."""
+    now = timezone.now()
+    RevokedToken.objects.create(
+        user_id=user_id,
+        issued_before=now,
+        expires_at=datetime.fromtimestamp(now.timestamp() + _max_token_lifetime(), tz=dt_timezone.utc),
+    )
+    transaction.on_commit(_bump_generation)
+
+
+def is_revoked(payload):
+    """True if the token with these claims was issued before its user's cut-off."""
+    # Cut-offs are keyed by the integer primary key, while
+    # RefreshToken.for_user writes the claim as a string.
+    try:
+        user_id = int(payload.get(api_settings.USER_ID_CLAIM))
+    except (TypeError, ValueError):
+        return False
+    sync_cutoffs()
+    cutoff = _cutoffs.by_user.get(user_id)
+    if cutoff is None:
+        return False
+    issued_before, expires_at = cutoff
+    # `iat` has whole-second resolution, so a token issued in the same
+    # second as the cut-off counts as revoked.
+    return expires_at > time.time() and payload.get("iat", 0) <= issued_before
+
+
+def prune_revocations(now=None):
+    """Delete revocations whose tokens have all expired. Returns the number removed."""
+    deleted, _ = RevokedToken.objects.filter(expires_at__lte=now or timezone.now()).delete()
+    return deleted
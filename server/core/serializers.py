@@ -1,7 +1,12 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from django.contrib.auth import authenticate, get_user_model
-from .models import ContactMessage, Item, Booking
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from .models import ContactMessage, Item, Booking, Order, OrderLine
+from .accounts import allocate_username, first_free_username, username_base, username_candidates
+from .kitchen import record_lines
+from .tokens import RefreshToken
 
 User = get_user_model()
 
@@ -20,33 +25,44 @@ class BaseRegisterSerializer(serializers.ModelSerializer):
     role = None  # To be set in child classes
 
     def validate_email(self, value):
-        """Normalize email and check duplicates clearly"""
-        email = value.strip().lower()   # normalize
-        if User.objects.filter(email=email).exists():
-            raise serializers.ValidationError("This email is already registered.")
-        return email
+        """Normalize email; uniqueness is checked in validate()"""
+        return value.strip().lower()
+
+    def validate(self, attrs):
+        """
+        Check the email is free and pick a free username in one query:
+        the requested (or email-derived) name, else the first of name1, name2, ...
+        """
+        email = attrs["email"]
+        base = User.normalize_username(attrs.get("username") or username_base(email))
+        rows = User.objects.filter(Q(email=email) | username_candidates(base)).values_list("email", "username")
+
+        taken = set()
+        for existing_email, existing_username in rows:
+            if existing_email == email:
+                raise serializers.ValidationError({"email": ["This email is already registered."]})
+            taken.add(existing_username)
+
+        attrs["username"] = first_free_username(base, taken)
+        attrs["username_base"] = base
+        return attrs
 
     def create(self, validated_data):
-        password = validated_data.pop("password")
-        email = validated_data["email"].strip().lower()
-        username = validated_data.get("username") or email.split("@")[0]
-
-        # ensure username is unique fallback
-        if User.objects.filter(username=username).exists():
-            base_username = username
-            counter = 1
-            while User.objects.filter(username=f"{base_username}{counter}").exists():
-                counter += 1
-            username = f"{base_username}{counter}"
-
-        user = User.objects.create_user(
-            email=email,
-            username=username,
-            password=password
+        user = User(
+            email=validated_data["email"],
+            username=validated_data["username"],
+            role=self.role or User.Role.VOYAGER,
         )
-        if self.role:
-            user.role = self.role
-        user.save()
+        user.set_password(validated_data["password"])
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            # A concurrent registration took the email or username since validate().
+            if User.objects.filter(email=user.email).exists():
+                raise serializers.ValidationError({"email": ["This email is already registered."]})
+            user.username = allocate_username(validated_data["username_base"])
+            user.save()
         return user
 
 
@@ -81,6 +97,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
 
     username_field = "email"
+    token_class = RefreshToken
 
     @classmethod
     def get_token(cls, user):
@@ -107,9 +124,6 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         if user is None:
             raise serializers.ValidationError({"non_field_errors": ["Invalid email or password."]})
 
-        # DEBUG: print the exact role for this user
-        print(f"User '{user.username}' has role: '{user.role}'")
-
         # For parent class compatibility
         attrs["username"] = getattr(user, self.username_field)
         attrs["password"] = password
@@ -127,6 +141,16 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return data
 
 
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refreshes with revocable tokens, so a rotated refresh token is revoked."""
+
+    token_class = RefreshToken
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    refresh = serializers.CharField()
+
+
 # ========= CONTACT MESSAGE SERIALIZER ========= #
 class ContactMessageSerializer(serializers.ModelSerializer):
     class Meta:
@@ -149,3 +173,95 @@ class BookingSerializer(serializers.ModelSerializer):
         model = Booking
         fields = ["id", "user", "type", "date", "status", "created_at"]
         read_only_fields = ["id", "user", "created_at"]
+
+
+# ========= ORDER SERIALIZERS ========= #
+class OrderLineSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OrderLine
+        fields = ["item", "item_name", "quantity", "unit_price", "line_total"]
+        read_only_fields = fields
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    lines = OrderLineSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Order
+        fields = ["id", "meal", "total", "lines"]
+        read_only_fields = fields
+
+
+class BookingOrderSerializer(BookingSerializer):
+    """
+    A catering/stationery booking together with its line items.
+
+    Querysets should use `select_related("order")` and prefetch
+    `order__lines` so a list costs two queries in total.
+    """
+
+    order = OrderSerializer(read_only=True)
+
+    class Meta(BookingSerializer.Meta):
+        fields = BookingSerializer.Meta.fields + ["order"]
+
+
+class OrderLineInputSerializer(serializers.Serializer):
+    item = serializers.IntegerField()
+    quantity = serializers.IntegerField(min_value=1, max_value=100)
+
+
+class OrderCreateSerializer(serializers.Serializer):
+    """
+    Places a catering or stationery order.
+
+    The view passes the order category in `context["category"]`; every item
+    must belong to it. Items are fetched in one query and their current
+    name and price are copied onto the order lines.
+    """
+
+    date = serializers.DateField()
+    meal = serializers.ChoiceField(choices=Order.MEAL_WINDOWS, default="any")
+    items = OrderLineInputSerializer(many=True, allow_empty=False)
+
+    def validate_items(self, value):
+        quantities = {}
+        for line in value:
+            quantities[line["item"]] = quantities.get(line["item"], 0) + line["quantity"]
+
+        items = Item.objects.filter(category=self.context["category"]).in_bulk(list(quantities))
+        missing = sorted(set(quantities) - set(items))
+        if missing:
+            raise serializers.ValidationError(
+                f"Unknown {self.context['category']} item(s): {', '.join(map(str, missing))}."
+            )
+        return [(items[item_id], quantity) for item_id, quantity in quantities.items()]
+
+    def create(self, validated_data):
+        lines = [
+            OrderLine(
+                item=item,
+                item_name=item.name,
+                quantity=quantity,
+                unit_price=item.price,
+                line_total=item.price * quantity,
+            )
+            for item, quantity in validated_data["items"]
+        ]
+        with transaction.atomic():
+            booking = Booking.objects.create(
+                user_id=validated_data["user_id"],
+                type=self.context["category"],
+                date=validated_data["date"],
+            )
+            order = Order.objects.create(
+                booking=booking,
+                meal=validated_data["meal"],
+                total=sum(line.line_total for line in lines),
+            )
+            for line in lines:
+                line.order = order
+            OrderLine.objects.bulk_create(lines)
+            if booking.type == "catering":
+                record_lines(booking.date, order.meal, lines)
+        return booking
@@ -0,0 +1,146 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .analytics import record_booking, summary_cache
+from .authentication import forget_user
+from .catalog import invalidate_catalog
+from .events import record_event
+from .inventory import release_places, reserve_places
+from .kitchen import record_lines
+from .models import Booking, CruiseShip, Item, Order, OrderLine, Tombstone
+from .revocation import revoke_user_tokens
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: forget_user(user_id))
+    if created or instance.is_active or (update_fields is not None and "is_active" not in update_fields):
+        return
+    # Tokens are checked without loading the user, so a deactivated user's
+    # tokens are revoked rather than left working until they expire.
+    revoke_user_tokens(user_id)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: forget_user(user_id))
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+def item_changed(sender, instance, **kwargs):
+    # An update may move an item between categories, so refresh every
+    # category rather than tracking the previous one. The versions move
+    # when the transaction commits (see CacheNamespace.invalidate).
+    invalidate_catalog()
+
+
+@receiver(post_delete, sender=Item)
+def item_deleted(sender, instance, **kwargs):
+    Tombstone.objects.create(model="item", object_id=instance.pk, kind=instance.category)
+
+
+@receiver(post_save, sender=CruiseShip)
+@receiver(post_delete, sender=CruiseShip)
+def ship_changed(sender, instance, **kwargs):
+    # Occupancy rates depend on total capacity.
+    summary_cache.invalidate()
+
+
+@receiver(post_delete, sender=OrderLine)
+def order_line_deleted(sender, instance, **kwargs):
+    try:
+        booking = instance.order.booking
+    except (Order.DoesNotExist, Booking.DoesNotExist):
+        return
+    if booking.type == "catering" and booking.status != "cancelled":
+        record_lines(booking.date, instance.order.meal, [instance], sign=-1)
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_state(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_state = (
+            Booking.objects.filter(pk=instance.pk).values_list("date", "type", "status").first()
+        )
+        previous = instance._previous_state
+        reinstated = previous is not None and previous[2] == "cancelled" and instance.status != "cancelled"
+        # Reinstating a cancelled booking takes its place back before the
+        # row is written, so a full slot (SlotUnavailable) stops the save.
+        if reinstated and instance.slot_id is not None:
+            reserve_places(instance.slot_id)
+
+
+@receiver(post_save, sender=Booking)
+def booking_saved(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_previous_state", None)
+    current = (instance.date, instance.type, instance.status)
+    if created or previous is None:
+        record_booking(*current)
+        record_event(instance, "created")
+        return
+    if previous == current:
+        return
+    record_booking(*previous, amount=-1)
+    record_booking(*current)
+    if previous[2] != instance.status:
+        record_event(instance, "status_changed")
+
+    was_cancelled = previous[2] == "cancelled"
+    is_cancelled = instance.status == "cancelled"
+    if instance.slot_id is not None and is_cancelled and not was_cancelled:
+        # A cancelled booking gives its place back (see remember_booking_state
+        # for reinstating).
+        release_places(instance.slot_id)
+
+    # The kitchen summary counts active catering orders under their date.
+    # Cancelling takes an order out, reinstating puts it back, and a new
+    # date moves it: its lines leave the old key and join the new one.
+    was_counted = previous[1] == "catering" and not was_cancelled
+    is_counted = instance.type == "catering" and not is_cancelled
+    if not (was_counted or is_counted) or (was_counted and is_counted and previous[0] == instance.date):
+        return
+    try:
+        order = instance.order
+    except Order.DoesNotExist:
+        return
+    lines = list(order.lines.all())
+    if was_counted:
+        record_lines(previous[0], order.meal, lines, sign=-1)
+    if is_counted:
+        record_lines(instance.date, order.meal, lines)
+
+
+@receiver(pre_save, sender=Order)
+def remember_order_meal(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_meal = Order.objects.filter(pk=instance.pk).values_list("meal", flat=True).first()
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, created, **kwargs):
+    previous_meal = getattr(instance, "_previous_meal", None)
+    if created or previous_meal is None or previous_meal == instance.meal:
+        return
+    booking = instance.booking
+    if booking.type != "catering" or booking.status == "cancelled":
+        return
+    # A new meal window moves the order's demand to it.
+    lines = list(instance.lines.all())
+    record_lines(booking.date, previous_meal, lines, sign=-1)
+    record_lines(booking.date, instance.meal, lines)
+
+
+@receiver(post_delete, sender=Booking)
+def booking_deleted(sender, instance, **kwargs):
+    record_booking(instance.date, instance.type, instance.status, amount=-1)
+    record_event(instance, "deleted")
+    if instance.slot_id is not None and instance.status != "cancelled":
+        release_places(instance.slot_id)
+    Tombstone.objects.create(model="booking", object_id=instance.pk, kind=instance.type)
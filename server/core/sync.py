@@ -0,0 +1,119 @@
+"""
+Delta sync ("changes since") for Booking and Item.
+
+Clients keep the `watermark` (and `after`, when present) from each
+response and pass them back as `since` and `after`; they then receive
+only rows saved since, plus the ids deleted since, instead of the whole
+table.
+
+`updated_at` and `deleted_at` are stamped before the transaction commits,
+so a row stamped just now may not be visible yet. Responses therefore
+only cover changes older than SYNC_SETTLE_SECONDS, and the watermark
+never passes that point: a late commit is picked up by the next call
+instead of being skipped. Pages are ordered by (timestamp, id), and a
+full page returns the last row's id as `after`, so any number of rows
+sharing a timestamp are paged through exactly once.
+
+Tombstones are kept for SYNC_TOMBSTONE_RETENTION_DAYS
+(`manage.py prune_tombstones`). A `since` older than that is answered
+with a full listing and `reset: true`, telling the client to replace
+its copy.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Tombstone
+
+SYNC_PAGE_SIZE = 1000
+
+
+def parse_since(value):
+    """Return (datetime or None, errors) for a `since` query param."""
+    if not value:
+        return None, {}
+    try:
+        since = parse_datetime(value.replace(" ", "+"))
+    except ValueError:
+        since = None
+    if since is None:
+        return None, {"since": ["Enter a valid ISO 8601 date/time."]}
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since, {}
+
+
+def parse_sync_params(params):
+    """Return (since, after, errors) for the `since` and `after` query params."""
+    since, errors = parse_since(params.get("since"))
+    after = params.get("after") or None
+    if after is not None:
+        if not after.isdigit():
+            errors["after"] = ["Must be a row id."]
+        elif since is None:
+            errors["after"] = ["Only valid together with `since`."]
+        else:
+            return since, int(after), errors
+    return since, None, errors
+
+
+def tombstone_horizon():
+    """Oldest `since` that tombstones still cover."""
+    return timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+
+def changes_since(queryset, model, since, after=None, kinds=None, limit=SYNC_PAGE_SIZE):
+    """
+    Rows of `queryset` saved since (`since`, `after`) (all rows when
+    `since` is None), in (updated_at, id) order, plus the ids of `model`
+    deleted in the same span.
+
+    `kinds` narrows tombstones the way the caller narrowed `queryset`
+    (booking types or item categories). Returns a dict with `changed`
+    (instances), `deleted`, `watermark`, `after`, `has_more` and `reset`.
+    A `since` older than the tombstone horizon resets the listing, unless
+    `after` marks it as the continuation of a listing already underway.
+    """
+    settled = timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+    reset = since is None or (after is None and since < tombstone_horizon())
+    if reset:
+        since = after = None
+
+    queryset = queryset.filter(updated_at__lt=settled)
+    if since is not None:
+        if after is None:
+            queryset = queryset.filter(updated_at__gte=since)
+        else:
+            queryset = queryset.filter(Q(updated_at__gt=since) | Q(updated_at=since, id__gt=after))
+    rows = list(queryset.order_by("updated_at", "id")[:limit + 1])
+    has_more = len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+        watermark, next_after = rows[-1].updated_at, rows[-1].pk
+    else:
+        watermark, next_after = settled, None
+
+    deleted = []
+    if since is not None:
+        tombstones = Tombstone.objects.filter(model=model, deleted_at__gte=since, deleted_at__lt=watermark)
+        if kinds is not None:
+            tombstones = tombstones.filter(kind__in=kinds)
+        deleted = list(tombstones.order_by("deleted_at").values_list("object_id", flat=True))
+
+    return {
+        "changed": rows,
+        "deleted": deleted,
+        "watermark": watermark,
+        "after": next_after,
+        "has_more": has_more,
+        "reset": reset,
+    }
+
+
+def prune_tombstones(before):
+    """Delete tombstones recorded before `before`. Returns the number removed."""
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=before).delete()
+    return deleted
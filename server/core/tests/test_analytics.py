@@ -0,0 +1,72 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Booking, BookingDailyStat, CruiseShip
+
+User = get_user_model()
+
+
+class BookingAnalyticsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        with cls.captureOnCommitCallbacks(execute=True):
+            CruiseShip.objects.create(name="Aurora", capacity=10, destination="Goa")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+
+    def _summary(self, **params):
+        response = self.client.get(reverse("manager-analytics"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_rollups_follow_creates_updates_and_deletes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = Booking.objects.create(user=self.voyager, type="movie", date=date(2025, 9, 1))
+            Booking.objects.create(user=self.voyager, type="salon", date=date(2025, 9, 1))
+            third = Booking.objects.create(user=self.voyager, type="movie", date=date(2025, 9, 2))
+
+            first.status = "cancelled"
+            first.save()
+            third.delete()
+
+        summary = self._summary()
+        self.assertEqual(summary["total"], 2)
+        self.assertEqual(summary["by_type"], {"movie": 1, "salon": 1})
+        self.assertEqual(summary["by_status"], {"cancelled": 1, "pending": 1})
+        self.assertEqual(summary["cancellation_rate"], 0.5)
+        self.assertEqual(summary["occupancy"], [{"date": date(2025, 9, 1), "active": 1, "rate": 0.1}])
+
+    def test_bulk_bookings_are_counted(self):
+        voyager_client = APIClient()
+        voyager_client.force_authenticate(self.voyager)
+        voyager_client.post(
+            reverse("voyager-bookings-bulk"), [{"type": "party", "date": "2025-09-03"}] * 4, format="json"
+        )
+        self.assertEqual(self._summary(date_from="2025-09-03")["by_type"], {"party": 4})
+
+    def test_summary_reads_only_rollups(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Booking.objects.create(user=self.voyager, type="movie", date=date(2025, 9, 1))
+        with self.assertNumQueries(4):
+            self._summary()
+
+    def test_rebuild_matches_incremental(self):
+        for day in range(1, 4):
+            Booking.objects.create(user=self.voyager, type="fitness", date=date(2025, 9, day))
+        incremental = self._summary()
+
+        BookingDailyStat.objects.all().delete()
+        call_command("rebuild_booking_rollups", stdout=StringIO())
+        self.assertEqual(self._summary(), incremental)
@@ -0,0 +1,92 @@
+from decimal import Decimal
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Booking, Item
+from core.serializers import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+def bearer(user):
+    token = CustomTokenObtainPairSerializer.get_token(user).access_token
+    return {"Authorization": f"Bearer {token}"}
+
+
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+        for day in range(1, 6):
+            Booking.objects.create(user=cls.voyager, type="movie", date=f"2025-01-0{day}")
+
+    def setUp(self):
+        cache.clear()
+
+    async def test_catalog_matches_sync_view(self):
+        response = await self.async_client.get(reverse("async-voyager-catering"), headers=bearer(self.voyager))
+        self.assertEqual(response.status_code, 200)
+
+        client = APIClient()
+        client.force_authenticate(self.voyager)
+        sync = await sync_to_async(client.get)(reverse("voyager-catering"))
+        self.assertEqual(response.json(), sync.json())
+        self.assertEqual(response["ETag"], sync["ETag"])
+
+        cached = await self.async_client.get(
+            reverse("async-voyager-catering"), headers={**bearer(self.voyager), "If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(cached.status_code, 304)
+
+    async def test_requires_token_and_role(self):
+        url = reverse("async-manager-bookings")
+        self.assertEqual((await self.async_client.get(url)).status_code, 401)
+        self.assertEqual((await self.async_client.get(url, headers=bearer(self.voyager))).status_code, 403)
+
+    async def test_booking_pages_follow_cursor(self):
+        url = reverse("async-manager-bookings")
+        first = (await self.async_client.get(url, {"page_size": 3}, headers=bearer(self.manager))).json()
+        self.assertEqual(len(first["results"]), 3)
+        second = (await self.async_client.get(first["next"], headers=bearer(self.manager))).json()
+        self.assertEqual(len(second["results"]), 2)
+        self.assertIsNone(second["next"])
+        ids = [row["id"] for row in first["results"] + second["results"]]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    async def test_booking_pages_match_sync_view(self):
+        client = APIClient()
+        await sync_to_async(client.force_authenticate)(self.manager)
+
+        def sync_page(query):
+            return client.get(f"{reverse('manager-bookings')}?{query}").json()
+
+        query = "page_size=2"
+        for _ in range(3):
+            async_page = (await self.async_client.get(
+                f"{reverse('async-manager-bookings')}?{query}", headers=bearer(self.manager)
+            )).json()
+            sync = await sync_to_async(sync_page)(query)
+            self.assertEqual(async_page["results"], sync["results"])
+            for link in ("next", "previous"):
+                self.assertEqual(
+                    async_page[link] and urlsplit(async_page[link]).query, sync[link] and urlsplit(sync[link]).query
+                )
+            query = urlsplit(async_page["next"] or async_page["previous"]).query
+
+    async def test_invalid_cursor_is_rejected(self):
+        response = await self.async_client.get(
+            reverse("async-manager-bookings"), {"cursor": "nope"}, headers=bearer(self.manager)
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Invalid cursor"})
@@ -0,0 +1,74 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+from core.authentication import ClaimsUser
+from core.models import Booking
+from core.revocation import sync_cutoffs
+from core.serializers import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+class ClaimsAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+
+    def setUp(self):
+        cache.clear()
+        # Load the revocation cut-offs once, as a process does on its first request.
+        sync_cutoffs()
+        token = CustomTokenObtainPairSerializer.get_token(self.voyager).access_token
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_read_endpoint_makes_no_queries(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("voyager-base"))
+        self.assertEqual(response.status_code, 200)
+
+    def test_write_uses_user_id_claim(self):
+        response = self.client.post(reverse("voyager-bookings"), {"type": "salon", "date": "2025-10-01"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["user"], self.voyager.id)
+        self.assertEqual(Booking.objects.get().user, self.voyager)
+
+    def test_full_user_lookup_is_cached(self):
+        token = CustomTokenObtainPairSerializer.get_token(self.voyager).access_token
+        self.assertEqual(ClaimsUser(token).role, "voyager")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(ClaimsUser(token).instance, self.voyager)
+        with self.assertNumQueries(0):
+            self.assertEqual(ClaimsUser(token).instance, self.voyager)
+
+    def test_cached_user_leaves_out_the_password_and_follows_saves(self):
+        user = ClaimsUser(CustomTokenObtainPairSerializer.get_token(self.voyager).access_token)
+        self.assertEqual(user.instance.email, "voyager@example.com")
+        self.assertNotIn(self.voyager.password, cache.get(f"auth:user:{self.voyager.pk}"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.voyager.pk).update(first_name="Ada")
+            self.voyager.refresh_from_db()
+            self.voyager.save()
+        user = ClaimsUser(CustomTokenObtainPairSerializer.get_token(self.voyager).access_token)
+        self.assertEqual(user.instance.first_name, "Ada")
+
+    def test_deactivated_user_is_refused(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.voyager.is_active = False
+            self.voyager.save()
+
+        user = ClaimsUser(CustomTokenObtainPairSerializer.get_token(self.voyager).access_token)
+        with self.assertRaises(AuthenticationFailed):
+            user.instance
+        # Tokens issued before the deactivation stop working too.
+        self.assertEqual(self.client.get(reverse("voyager-base")).status_code, 401)
+
+    def test_invalid_token_is_rejected(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        self.assertEqual(self.client.get(reverse("voyager-base")).status_code, 401)
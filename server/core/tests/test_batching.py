@@ -0,0 +1,62 @@
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+
+from core.batching import GroupCommit, coalesced_write
+from core.models import ContactMessage
+
+
+class GroupCommitTests(TransactionTestCase):
+    def test_units_keep_their_own_outcome(self):
+        group = GroupCommit()
+
+        def good():
+            return ContactMessage.objects.create(name="A", email="a@example.com", message="hi").pk
+
+        def bad():
+            ContactMessage.objects.create(name="B", email="b@example.com", message="hi")
+            raise ValueError("boom")
+
+        self.assertTrue(group.run(good))
+        with self.assertRaises(ValueError):
+            group.run(bad)
+        self.assertEqual(list(ContactMessage.objects.values_list("name", flat=True)), ["A"])
+
+    def test_concurrent_writers_share_commits(self):
+        group = GroupCommit(max_batch=8)
+        commits = []
+        original = group._commit
+
+        def counting_commit(batch):
+            commits.append(len(batch))
+            original(batch)
+
+        group._commit = counting_commit
+        barrier = threading.Barrier(12)
+        errors = []
+
+        def worker(n):
+            barrier.wait()
+            try:
+                group.run(lambda: ContactMessage.objects.create(name=f"n{n}", email="x@example.com", message="m"))
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(ContactMessage.objects.count(), 12)
+        self.assertEqual(sum(commits), 12)
+        self.assertTrue(all(size <= 8 for size in commits))
+
+    @override_settings(WRITE_COALESCING=False)
+    def test_disabled_runs_in_place(self):
+        pk = coalesced_write(lambda: ContactMessage.objects.create(name="C", email="c@example.com", message="m").pk)
+        self.assertTrue(ContactMessage.objects.filter(pk=pk).exists())
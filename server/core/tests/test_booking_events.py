@@ -0,0 +1,121 @@
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import Booking, BookingEvent
+from core.serializers import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+def bearer(user):
+    token = CustomTokenObtainPairSerializer.get_token(user).access_token
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def read_frames(response):
+    body = "".join([chunk.decode() async for chunk in response.streaming_content])
+    return [frame for frame in body.split("\n\n") if frame.startswith("id:")]
+
+
+async def log_event(pk, booking, created_at=None):
+    event = await BookingEvent.objects.acreate(
+        id=pk, kind="created", booking_id=booking.pk, user_id=booking.user_id,
+        type=booking.type, date=booking.date, status=booking.status,
+    )
+    if created_at is not None:
+        await BookingEvent.objects.filter(pk=pk).aupdate(created_at=created_at)
+    return event
+
+
+@override_settings(
+    BOOKING_EVENTS_STREAM_LIFETIME=0, BOOKING_EVENTS_POLL_INTERVAL=0, BOOKING_EVENTS_SETTLE_SECONDS=0
+)
+class BookingEventTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.head_cook = User.objects.create_user(
+            username="cook", email="cook@example.com", password="pass123", role="head_cook"
+        )
+
+    def test_signals_log_create_status_change_and_delete(self):
+        booking = Booking.objects.create(user=self.voyager, type="catering", date="2025-01-01")
+        booking.date = "2025-01-02"
+        booking.save()
+        booking.status = "confirmed"
+        booking.save()
+        booking.delete()
+        self.assertEqual(
+            list(BookingEvent.objects.order_by("id").values_list("kind", "status")),
+            [("created", "pending"), ("status_changed", "confirmed"), ("deleted", "confirmed")],
+        )
+
+    async def test_stream_resumes_after_last_event_id(self):
+        first = await Booking.objects.acreate(user=self.voyager, type="movie", date="2025-01-01")
+        second = await Booking.objects.acreate(user=self.voyager, type="movie", date="2025-01-02")
+        resume_from = await BookingEvent.objects.filter(booking_id=first.pk).values_list("id", flat=True).aget()
+
+        response = await self.async_client.get(
+            reverse("async-booking-events"), headers={**bearer(self.manager), "Last-Event-ID": str(resume_from)}
+        )
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        frames = await read_frames(response)
+        self.assertEqual(len(frames), 1)
+        data = json.loads(frames[0].split("data: ", 1)[1])
+        self.assertEqual(data["booking"], second.pk)
+        self.assertIn("event: created", frames[0])
+
+    async def test_fresh_connection_starts_at_end_of_log(self):
+        await Booking.objects.acreate(user=self.voyager, type="movie", date="2025-01-01")
+        response = await self.async_client.get(reverse("async-booking-events"), headers=bearer(self.manager))
+        self.assertEqual(await read_frames(response), [])
+
+    async def _frame_ids(self, last_event_id):
+        response = await self.async_client.get(
+            reverse("async-booking-events"), {"last_event_id": last_event_id}, headers=bearer(self.manager)
+        )
+        return [int(frame.split("\n", 1)[0][4:]) for frame in await read_frames(response)]
+
+    @override_settings(BOOKING_EVENTS_SETTLE_SECONDS=60)
+    async def test_stream_waits_at_a_gap_for_a_late_commit(self):
+        booking = await Booking.objects.acreate(user=self.voyager, type="movie", date="2025-01-01")
+        start = (await BookingEvent.objects.aget()).pk
+        # start + 1 is still in flight; start + 2 has committed.
+        await log_event(start + 2, booking)
+
+        self.assertEqual(await self._frame_ids(start), [])
+
+        await log_event(start + 1, booking)
+        self.assertEqual(await self._frame_ids(start), [start + 1, start + 2])
+
+    @override_settings(BOOKING_EVENTS_SETTLE_SECONDS=60)
+    async def test_stream_passes_a_settled_gap(self):
+        booking = await Booking.objects.acreate(user=self.voyager, type="movie", date="2025-01-01")
+        start = (await BookingEvent.objects.aget()).pk
+        # start + 1 was rolled back long enough ago.
+        await log_event(start + 2, booking, created_at=timezone.now() - timedelta(minutes=5))
+        await log_event(start + 3, booking)
+
+        self.assertEqual(await self._frame_ids(start), [start + 2, start + 3])
+
+    async def test_head_cook_only_sees_catering(self):
+        await Booking.objects.acreate(user=self.voyager, type="movie", date="2025-01-01")
+        catering = await Booking.objects.acreate(user=self.voyager, type="catering", date="2025-01-01")
+        response = await self.async_client.get(
+            reverse("async-booking-events"), {"last_event_id": 0}, headers=bearer(self.head_cook)
+        )
+        frames = await read_frames(response)
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(json.loads(frames[0].split("data: ", 1)[1])["booking"], catering.pk)
+
+    async def test_voyagers_are_refused(self):
+        response = await self.async_client.get(reverse("async-booking-events"), headers=bearer(self.voyager))
+        self.assertEqual(response.status_code, 403)
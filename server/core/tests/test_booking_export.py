@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Booking
+from core.serializers import BookingSerializer
+
+User = get_user_model()
+
+
+class BookingExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.supervisor = User.objects.create_user(
+            username="supervisor", email="supervisor@example.com", password="pass123", role="supervisor"
+        )
+        voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        for day in range(1, 4):
+            Booking.objects.create(user=voyager, type="movie", date=date(2025, 3, day))
+        Booking.objects.create(user=voyager, type="stationery", date=date(2025, 3, 9))
+
+    def _get(self, user, url, params):
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_matches_serializer_output(self):
+        body = self._get(self.manager, reverse("manager-bookings"), {"export": "ndjson"})
+        rows = [json.loads(line) for line in body.splitlines()]
+
+        expected = BookingSerializer(Booking.objects.order_by("created_at", "id"), many=True).data
+        self.assertEqual(rows, [dict(row) for row in expected])
+
+    def test_csv_export_respects_filters(self):
+        body = self._get(self.manager, reverse("manager-bookings"), {"export": "csv", "type": "movie"})
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row["type"] for row in rows}, {"movie"})
+
+    def test_supervisor_export(self):
+        body = self._get(self.supervisor, reverse("supervisor-orders"), {"export": "ndjson"})
+        self.assertEqual([json.loads(line)["type"] for line in body.splitlines()], ["stationery"])
+
+    def test_unknown_format(self):
+        client = APIClient()
+        client.force_authenticate(self.manager)
+        response = client.get(reverse("manager-bookings"), {"export": "xlsx"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,72 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import ActivitySlot, Booking, CruiseShip
+
+User = get_user_model()
+
+
+class BulkBookingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.voyager)
+
+    def test_group_booking_in_one_request(self):
+        payload = [{"type": "party", "date": "2025-07-04"} for _ in range(6)]
+        response = self.client.post(reverse("voyager-bookings-bulk"), payload, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row["index"] for row in response.data["results"]], list(range(6)))
+        self.assertTrue(all(row["booking"]["id"] for row in response.data["results"]))
+        self.assertEqual(Booking.objects.filter(user=self.voyager, type="party").count(), 6)
+
+    def test_invalid_entry_rejects_whole_batch(self):
+        payload = [{"type": "party", "date": "2025-07-04"}, {"type": "party", "date": "not-a-date"}]
+        response = self.client.post(reverse("voyager-bookings-bulk"), payload, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([row["success"] for row in response.data["results"]], [True, False])
+        self.assertIn("date", response.data["results"][1]["errors"])
+        self.assertFalse(Booking.objects.exists())
+
+    def test_slot_capacity_applies_to_the_group(self):
+        ship = CruiseShip.objects.create(name="Aurora", capacity=3, destination="Goa")
+        ActivitySlot.objects.create(ship=ship, activity="movie", date=date(2025, 7, 4))
+        payload = {"ship": ship.id, "bookings": [{"type": "movie", "date": "2025-07-04"}] * 4}
+
+        response = self.client.post(reverse("voyager-bookings-bulk"), payload, format="json")
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Booking.objects.exists())
+
+        payload["bookings"] = payload["bookings"][:3]
+        response = self.client.post(reverse("voyager-bookings-bulk"), payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(ActivitySlot.objects.get().remaining, 0)
+
+    def test_cancelled_entries_hold_no_place(self):
+        ship = CruiseShip.objects.create(name="Aurora", capacity=2, destination="Goa")
+        ActivitySlot.objects.create(ship=ship, activity="movie", date=date(2025, 7, 4))
+        booking = {"type": "movie", "date": "2025-07-04"}
+        payload = {"ship": ship.id, "bookings": [booking, {**booking, "status": "cancelled"}] * 2}
+
+        response = self.client.post(reverse("voyager-bookings-bulk"), payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(ActivitySlot.objects.get().remaining, 0)
+
+        Booking.objects.filter(status="cancelled").delete()
+        self.assertEqual(ActivitySlot.objects.get().remaining, 0)
+
+    def test_catering_orders_take_forced_type(self):
+        payload = [{"type": "resort", "date": "2025-07-04"}] * 2
+        response = self.client.post(reverse("voyager-catering-bulk"), payload, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Booking.objects.filter(type="catering").count(), 2)
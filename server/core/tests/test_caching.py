@@ -0,0 +1,213 @@
+import threading
+import time
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.cache_backends import TieredCache
+from core.caching import CacheNamespace, _flight_locks, shared_cache
+from core.models import Booking, CruiseShip
+
+User = get_user_model()
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_reads_are_served_locally_after_the_first_shared_hit(self):
+        shared_cache().set("greeting", "hello")
+        before = cache.stats.copy()
+
+        self.assertEqual(cache.get("greeting"), "hello")
+        self.assertEqual(cache.get("greeting"), "hello")
+        self.assertIsNone(cache.get("missing"))
+
+        self.assertEqual(cache.stats["shared_hits"] - before["shared_hits"], 1)
+        self.assertEqual(cache.stats["local_hits"] - before["local_hits"], 1)
+        self.assertEqual(cache.stats["misses"] - before["misses"], 1)
+
+    async def test_async_reads_are_served_locally(self):
+        await cache.aset("greeting", "hello")
+        before = cache.stats.copy()
+        self.assertEqual(await cache.aget("greeting"), "hello")
+        self.assertEqual(cache.stats["local_hits"] - before["local_hits"], 1)
+        self.assertFalse(await cache.aadd("greeting", "again"))
+        await cache.adelete("greeting")
+        self.assertIsNone(await shared_cache().aget("greeting"))
+
+    def test_writes_reach_both_tiers(self):
+        cache.set("answer", 42)
+        self.assertEqual(shared_cache().get("answer"), 42)
+        cache.delete("answer")
+        self.assertIsNone(shared_cache().get("answer"))
+        self.assertIsNone(cache.get("answer"))
+
+    def test_local_tier_evicts_least_recently_used(self):
+        small = TieredCache("shared", {"OPTIONS": {"LOCAL_MAX_ENTRIES": 2}})
+        small.set("a", 1)
+        small.set("b", 2)
+        small.get("a")
+        small.set("c", 3)
+
+        local_keys = set(small._store.entries)
+        self.assertNotIn(small.make_key("b"), local_keys)
+        self.assertEqual(local_keys, {small.make_key("a"), small.make_key("c")})
+        # Evicted locally, still available from the shared tier.
+        self.assertEqual(small.get("b"), 2)
+
+    def test_add_is_decided_by_the_shared_tier(self):
+        self.assertTrue(cache.add("lock", 1))
+        self.assertFalse(cache.add("lock", 2))
+        self.assertEqual(cache.get("lock"), 1)
+
+
+class CacheNamespaceTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.namespace = CacheNamespace("test", timeout=60)
+
+    def test_get_or_set_computes_once(self):
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+
+        self.assertEqual(self.namespace.get_or_set("value", compute), 1)
+        self.assertEqual(self.namespace.get_or_set("value", compute), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate_retires_every_key(self):
+        self.namespace.get_or_set("a", lambda: "old a")
+        self.namespace.get_or_set("b", lambda: "old b")
+        version = self.namespace.version()
+
+        self.namespace.invalidate()
+
+        self.assertNotEqual(self.namespace.version(), version)
+        self.assertEqual(self.namespace.get_or_set("a", lambda: "new a"), "new a")
+        self.assertEqual(self.namespace.get_or_set("b", lambda: "new b"), "new b")
+
+    def test_waiting_for_another_process_does_not_block_other_keys(self):
+        stripe = lambda key: hash(self.namespace.key(key)) % len(_flight_locks)
+        other = next(f"key{n}" for n in range(10000) if stripe(f"key{n}") == stripe("busy"))
+        # Another process holds the lock on "busy".
+        shared_cache().add(f"{self.namespace.key('busy')}:lock", 1)
+        waiter = threading.Thread(target=lambda: self.namespace.get_or_set("busy", lambda: "computed here"))
+        waiter.start()
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        self.assertEqual(self.namespace.get_or_set(other, lambda: "other"), "other")
+        self.assertLess(time.monotonic() - started, 1)
+
+        cache.set(self.namespace.key("busy"), "computed there")
+        waiter.join()
+        self.assertEqual(self.namespace.get_or_set("busy", lambda: "again"), "computed there")
+
+    async def test_aget_or_set_computes_once(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(await self.namespace.aget_or_set("value", compute), "value")
+        self.assertEqual(await self.namespace.aget_or_set("value", compute), "value")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.namespace.get_or_set("value", lambda: "other"), "value")
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.namespace.get_or_set("slow", compute)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["value"] * 4)
+        self.assertEqual(len(calls), 1)
+
+
+class InvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.namespace = CacheNamespace("test", timeout=60)
+
+    def test_invalidate_bumps_once_per_transaction_on_commit(self):
+        version = self.namespace.version()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for _ in range(3):
+                self.namespace.invalidate()
+            self.assertEqual(self.namespace.version(), version)
+        self.assertEqual(len(callbacks), 1)
+        self.assertNotEqual(self.namespace.version(), version)
+
+    def test_rolled_back_invalidation_does_not_hide_the_next(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    self.namespace.invalidate()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.namespace.invalidate()
+        self.assertEqual(len(callbacks), 1)
+
+
+class DashboardCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        with cls.captureOnCommitCallbacks(execute=True):
+            CruiseShip.objects.create(name="Aurora", capacity=10, destination="Goa")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+
+    def _total(self):
+        response = self.client.get(reverse("manager-analytics"))
+        self.assertEqual(response.status_code, 200)
+        return response.data["total"]
+
+    def test_analytics_are_cached_until_a_booking_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Booking.objects.create(user=self.voyager, type="movie", date=date(2025, 9, 1))
+        self.assertEqual(self._total(), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(self._total(), 1)
+
+        # Retired once the write commits, not before.
+        with self.captureOnCommitCallbacks(execute=True):
+            Booking.objects.create(user=self.voyager, type="salon", date=date(2025, 9, 1))
+            self.assertEqual(self._total(), 1)
+        self.assertEqual(self._total(), 2)
+
+    def test_cache_counters_are_exported(self):
+        self._total()
+        self._total()
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn('cache_requests_total{namespace="analytics",result="hit"}', body)
+        self.assertIn('cache_requests_total{namespace="analytics",result="miss"}', body)
+        self.assertIn('cache_tier_requests_total{result="local_hits"}', body)
@@ -0,0 +1,65 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Item
+
+User = get_user_model()
+
+
+class CatalogCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+            Item.objects.create(name="Notebook", category="stationery", price=Decimal("3.00"))
+        self.client = APIClient()
+        self.client.force_authenticate(self.voyager)
+        self.url = reverse("voyager-catering")
+
+    def test_conditional_get_returns_304_without_queries(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual([item["name"] for item in first.data], ["Pasta"])
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+
+    def test_repeat_get_is_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 1)
+
+    def test_catalog_version_moves_on_commit(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Item.objects.create(name="Soup", category="catering", price=Decimal("6.00"))
+            # Until the commit the version, and so the ETag, stays put.
+            self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_item_save_and_delete_invalidate(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            item = Item.objects.create(name="Soup", category="catering", price=Decimal("6.00"))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            item.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
@@ -0,0 +1,103 @@
+import gzip
+import io
+import unittest
+import zlib
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.compression import brotli
+from core.models import Item
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+
+class FastJSONTests(unittest.TestCase):
+    def test_renders_same_bytes_as_json_renderer(self):
+        data = {
+            "id": 1,
+            "price": "12.50",
+            "amount": Decimal("3.10"),
+            "date": date(2025, 1, 1),
+            "at": datetime(2025, 1, 1, 8, 30, 15, 123456, tzinfo=timezone.utc),
+            "naive": datetime(2025, 1, 1, 8, 30),
+            "name": "Crème brûlée  ",
+            "detail": gettext_lazy("Not found."),
+            "nested": [{"a": None, "b": True, "c": 1.5}],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_falls_back_to_json_renderer(self):
+        data = {"a": [1, 2]}
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=4"),
+            JSONRenderer().render(data, "application/json; indent=4"),
+        )
+
+    def test_parser_accepts_and_rejects_like_json_parser(self):
+        parser = FastJSONParser()
+        self.assertEqual(parser.parse(io.BytesIO('{"name": "Crème"}'.encode())), {"name": "Crème"})
+        for body in (b'{"a": NaN}', b"{"):
+            with self.assertRaises(ParseError):
+                parser.parse(io.BytesIO(body))
+
+
+class CompressionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        Item.objects.bulk_create(
+            Item(name=f"Dish {n}", category="catering", price=Decimal("9.50")) for n in range(100)
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.voyager)
+
+    def test_large_responses_are_gzipped(self):
+        response = self.client.get(reverse("voyager-catering"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertTrue(response["ETag"].startswith("W/"))
+        plain = self.client.get(reverse("voyager-catering"))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    @override_settings(COMPRESSION_MIN_SIZE=1_000_000)
+    def test_small_responses_are_left_alone(self):
+        response = self.client.get(reverse("voyager-catering"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @unittest.skipIf(brotli is None, "brotli is not installed")
+    def test_brotli_preferred_when_accepted(self):
+        response = self.client.get(reverse("voyager-catering"), HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+
+    def test_brotli_branch(self):
+        fake = mock.Mock(compress=lambda data, quality: b"br" + zlib.compress(data))
+        plain = self.client.get(reverse("voyager-catering"))
+        with mock.patch("core.compression.brotli", fake):
+            response = self.client.get(reverse("voyager-catering"), HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(zlib.decompress(response.content[2:]), plain.content)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(response["ETag"], "W/" + plain["ETag"])
+
+    def test_requests_with_cookies_get_gzip_not_brotli(self):
+        fake = mock.Mock(compress=lambda data, quality: b"br" + zlib.compress(data))
+        self.client.cookies["sessionid"] = "session"
+        with mock.patch("core.compression.brotli", fake):
+            response = self.client.get(reverse("voyager-catering"), HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "gzip")
@@ -0,0 +1,72 @@
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.contact_queue import drain
+from core.models import ContactMessage
+
+MESSAGE = {"name": "Ada", "email": "ada@example.com", "message": "Is the spa open on sea days?"}
+
+
+class ContactQueueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        spool = tempfile.TemporaryDirectory()
+        self.addCleanup(spool.cleanup)
+        self.settings_override = override_settings(CONTACT_QUEUE=True, CONTACT_QUEUE_DIR=spool.name)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+    def test_messages_are_acknowledged_then_saved_by_drain(self):
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse("contact-api"), MESSAGE, format="json")
+        self.assertEqual(response.status_code, 202)
+        self.assertFalse(ContactMessage.objects.exists())
+
+        self.assertEqual(drain(), (1, 0))
+        self.assertEqual(ContactMessage.objects.get().email, "ada@example.com")
+        self.assertEqual(drain(), (0, 0))
+
+    def test_repeated_message_is_stored_once(self):
+        statuses = [self.client.post(reverse("contact-api"), MESSAGE, format="json").status_code for _ in range(3)]
+        self.assertEqual(statuses, [202] * 3)
+        drain()
+        self.assertEqual(ContactMessage.objects.count(), 1)
+
+    def test_failed_enqueue_does_not_block_the_retry(self):
+        with mock.patch("core.views.enqueue", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.client.post(reverse("contact-api"), MESSAGE, format="json")
+        self.assertEqual(self.client.post(reverse("contact-api"), MESSAGE, format="json").status_code, 202)
+        self.assertEqual(drain(), (1, 0))
+
+    def test_drain_skips_messages_already_saved(self):
+        self.client.post(reverse("contact-api"), MESSAGE, format="json")
+        drain()
+        # Another process's cache would not have seen the first copy.
+        cache.clear()
+        self.client.post(reverse("contact-api"), MESSAGE, format="json")
+        self.assertEqual(drain(), (0, 1))
+
+    def test_rate_limited_per_ip(self):
+        statuses = [
+            self.client.post(reverse("contact-api"), {**MESSAGE, "message": f"Question {n}"}, format="json").status_code
+            for n in range(11)
+        ]
+        self.assertEqual(statuses[:10], [202] * 10)
+        self.assertEqual(statuses[10], 429)
+
+
+class ContactDirectSaveTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_saved_during_request_when_queue_is_off(self):
+        response = APIClient().post(reverse("contact-api"), MESSAGE, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ContactMessage.objects.count(), 1)
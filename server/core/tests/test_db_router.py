@@ -0,0 +1,48 @@
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.db import REPLICA_ALIAS, PrimaryReplicaRouter, ReplicaReadMixin, use_replica
+from core.models import Booking
+
+DATABASES_WITH_REPLICA = {
+    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+    REPLICA_ALIAS: {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+}
+
+
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_use_replica_only_when_asked(self):
+        with self.settings(DATABASES=DATABASES_WITH_REPLICA):
+            self.assertIsNone(self.router.db_for_read(Booking))
+            with use_replica():
+                self.assertEqual(self.router.db_for_read(Booking), REPLICA_ALIAS)
+                self.assertEqual(self.router.db_for_write(Booking), "default")
+            self.assertIsNone(self.router.db_for_read(Booking))
+
+    def test_without_replica_everything_stays_on_default(self):
+        with use_replica():
+            self.assertIsNone(self.router.db_for_read(Booking))
+
+    def test_replica_is_never_migrated(self):
+        self.assertFalse(self.router.allow_migrate(REPLICA_ALIAS, "core"))
+        self.assertTrue(self.router.allow_migrate("default", "core"))
+
+    def test_mixin_routes_safe_methods_only(self):
+        class ProbeView(ReplicaReadMixin, APIView):
+            authentication_classes = []
+            permission_classes = []
+
+            def get(self, request):
+                return Response(PrimaryReplicaRouter().db_for_read(Booking))
+
+            def post(self, request):
+                return Response(PrimaryReplicaRouter().db_for_read(Booking))
+
+        factory = RequestFactory()
+        with self.settings(DATABASES=DATABASES_WITH_REPLICA):
+            self.assertEqual(ProbeView.as_view()(factory.get("/")).data, REPLICA_ALIAS)
+            self.assertIsNone(ProbeView.as_view()(factory.post("/")).data)
@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.fast_serializers import booking_order_values, booking_values, item_values
+from core.models import Booking, Item, Order, OrderLine
+from core.serializers import BookingOrderSerializer, BookingSerializer, ItemSerializer
+
+User = get_user_model()
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class FastSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        pasta = Item.objects.create(name="Pasta", category="catering", price=Decimal("12.5"), description="Fresh")
+        Item.objects.create(name="Crème brûlée", category="catering", price=Decimal("7"))
+        for day in range(1, 4):
+            booking = Booking.objects.create(user=cls.voyager, type="catering", date=f"2025-01-0{day}")
+            order = Order.objects.create(booking=booking, meal="dinner", total=Decimal("25"))
+            OrderLine.objects.create(order=order, item=pasta, item_name="Pasta", quantity=2,
+                                     unit_price=Decimal("12.5"), line_total=Decimal("25"))
+            OrderLine.objects.create(order=order, item=None, item_name="Retired dish", quantity=1,
+                                     unit_price=Decimal("0"), line_total=Decimal("0"))
+        # A booking without an order.
+        Booking.objects.create(user=cls.voyager, type="catering", date="2025-01-05", status="cancelled")
+
+    def test_items_match_item_serializer(self):
+        items = Item.objects.filter(category="catering")
+        self.assertEqual(render(item_values.serialize(items)), render(ItemSerializer(items, many=True).data))
+
+    def test_bookings_match_booking_serializer(self):
+        bookings = Booking.objects.order_by("id")
+        self.assertEqual(
+            render(booking_values.serialize(bookings)), render(BookingSerializer(bookings, many=True).data)
+        )
+
+    def test_orders_match_booking_order_serializer(self):
+        bookings = Booking.objects.filter(type="catering")
+        expected = BookingOrderSerializer(
+            bookings.select_related("order").prefetch_related(
+                Prefetch("order__lines", queryset=OrderLine.objects.order_by("id"))
+            ),
+            many=True,
+        ).data
+        with self.assertNumQueries(2):
+            data = booking_order_values.serialize(bookings)
+        self.assertEqual(render(data), render(expected))
+
+    def test_manager_page_matches_booking_serializer(self):
+        client = APIClient()
+        client.force_authenticate(self.manager)
+        response = client.get(reverse("manager-bookings"), {"page_size": 2})
+        expected = BookingSerializer(Booking.objects.order_by("-created_at", "-id")[:2], many=True).data
+        self.assertEqual(render(response.data["results"]), render(expected))
@@ -0,0 +1,49 @@
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import identify_hasher
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.hashers import default_hash_workers, needs_rehash, verify_password
+
+User = get_user_model()
+
+
+def iterations(user):
+    user.refresh_from_db()
+    return identify_hasher(user.password).decode(user.password)["iterations"]
+
+
+@override_settings(PASSWORD_PBKDF2_ITERATIONS=1000)
+class PasswordHashingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="guest@example.com", password="Sail-away-42")
+
+    def test_profile_sets_work_factor(self):
+        self.assertEqual(iterations(self.user), 1000)
+        self.assertFalse(needs_rehash(self.user.password))
+
+    def test_login_rehashes_outdated_hash(self):
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            self.assertTrue(needs_rehash(self.user.password))
+            self.assertEqual(authenticate(email="guest@example.com", password="Sail-away-42"), self.user)
+            self.assertEqual(iterations(self.user), 2000)
+
+    def test_wrong_password_leaves_hash_alone(self):
+        encoded = self.user.password
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            self.assertFalse(verify_password(self.user, "nope"))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, encoded)
+
+    def test_session_and_token_login(self):
+        credentials = {"email": "guest@example.com", "password": "Sail-away-42"}
+        self.assertEqual(self.client.post(reverse("session-login"), credentials, "application/json").status_code, 200)
+        self.assertIn("access", self.client.post(reverse("token_obtain_pair"), credentials).json())
+        self.assertIsNone(authenticate(email="nobody@example.com", password="Sail-away-42"))
+
+    def test_pool_defaults_to_half_the_cpus(self):
+        for cpus, workers in [(None, 1), (1, 1), (2, 1), (8, 4)]:
+            with mock.patch("core.hashers.os.cpu_count", return_value=cpus):
+                self.assertEqual(default_hash_workers(), workers)
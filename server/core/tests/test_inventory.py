@@ -0,0 +1,102 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.inventory import SlotUnavailable
+from core.models import ActivitySlot, Booking, CruiseShip
+
+User = get_user_model()
+
+
+class ActivitySlotAllocationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.ship = CruiseShip.objects.create(name="Aurora", capacity=2, destination="Goa")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.voyager)
+        self.url = reverse("voyager-bookings")
+
+    def _book(self, **extra):
+        return self.client.post(self.url, {"type": "movie", "date": "2025-05-01", **extra}, format="json")
+
+    def test_slot_defaults_to_ship_capacity(self):
+        slot = ActivitySlot.objects.create(ship=self.ship, activity="movie", date=date(2025, 5, 1))
+        self.assertEqual((slot.capacity, slot.remaining), (2, 2))
+
+    def test_bookings_stop_at_capacity(self):
+        slot = ActivitySlot.objects.create(ship=self.ship, activity="movie", date=date(2025, 5, 1))
+
+        self.assertEqual(self._book().status_code, 201)
+        self.assertEqual(self._book(ship=self.ship.id).status_code, 201)
+        response = self._book()
+        self.assertEqual(response.status_code, 409)
+
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 0)
+        self.assertEqual(Booking.objects.filter(slot=slot).count(), 2)
+
+    def test_activity_without_slot_is_unlimited(self):
+        for _ in range(3):
+            self.assertEqual(self._book().status_code, 201)
+        self.assertFalse(Booking.objects.exclude(slot=None).exists())
+
+    def test_ambiguous_ship_is_rejected(self):
+        other = CruiseShip.objects.create(name="Borealis", capacity=5, destination="Dubai")
+        ActivitySlot.objects.create(ship=self.ship, activity="movie", date=date(2025, 5, 1))
+        ActivitySlot.objects.create(ship=other, activity="movie", date=date(2025, 5, 1))
+
+        self.assertEqual(self._book().status_code, 409)
+        self.assertEqual(self._book(ship=other.id).status_code, 201)
+
+    def test_cancelling_or_deleting_gives_the_place_back(self):
+        slot = ActivitySlot.objects.create(ship=self.ship, activity="movie", date=date(2025, 5, 1))
+        self._book()
+        self._book()
+        first, second = Booking.objects.filter(slot=slot)
+
+        first.status = "cancelled"
+        first.save()
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 1)
+        # Saving it again, still cancelled, gives nothing more back.
+        first.save()
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 1)
+
+        self.assertEqual(self._book().status_code, 201)
+        with self.assertRaises(SlotUnavailable):
+            first.status = "confirmed"
+            first.save()
+        first.refresh_from_db()
+        self.assertEqual(first.status, "cancelled")
+
+        second.delete()
+        first.delete()
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 1)
+
+    def test_booking_created_cancelled_holds_no_place(self):
+        slot = ActivitySlot.objects.create(ship=self.ship, activity="movie", date=date(2025, 5, 1))
+        self._book()
+        self.assertEqual(self._book(status="cancelled").status_code, 201)
+        cancelled = Booking.objects.get(status="cancelled")
+        self.assertEqual(cancelled.slot_id, slot.id)
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 1)
+
+        cancelled.delete()
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 1)
+
+        self._book(status="cancelled")
+        cancelled = Booking.objects.get(status="cancelled")
+        cancelled.status = "confirmed"
+        cancelled.save()
+        slot.refresh_from_db()
+        self.assertEqual(slot.remaining, 0)
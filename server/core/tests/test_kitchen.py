@@ -0,0 +1,112 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.kitchen import aggregate_demand
+from core.models import Booking, Item, KitchenDemand
+
+User = get_user_model()
+
+
+class KitchenDemandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.cook = User.objects.create_user(
+            username="cook", email="cook@example.com", password="pass123", role="head_cook"
+        )
+        cls.pasta = Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+        cls.soup = Item.objects.create(name="Soup", category="catering", price=Decimal("4.00"))
+
+    def setUp(self):
+        self.voyager_client = APIClient()
+        self.voyager_client.force_authenticate(self.voyager)
+        self.cook_client = APIClient()
+        self.cook_client.force_authenticate(self.cook)
+
+    def _order(self, meal, items, date="2025-08-01"):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.voyager_client.post(
+                reverse("voyager-catering"), {"date": date, "meal": meal, "items": items}, format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+        return Booking.objects.get(pk=response.data["id"])
+
+    def _production(self, **params):
+        response = self.cook_client.get(reverse("head_cook-production"), params)
+        self.assertEqual(response.status_code, 200)
+        return [(str(r["date"]), r["meal"], r["item_name"], r["quantity"]) for r in response.data]
+
+    def _summary_matches_aggregation(self):
+        summary = sorted(
+            (row.date, row.meal, row.item_name, row.quantity) for row in KitchenDemand.objects.filter(quantity__gt=0)
+        )
+        fresh = sorted((r["date"], r["meal"], r["name"], r["quantity"]) for r in aggregate_demand())
+        self.assertEqual(summary, fresh)
+
+    def test_summary_tracks_orders(self):
+        self._order("lunch", [{"item": self.pasta.id, "quantity": 2}])
+        self._order("lunch", [{"item": self.pasta.id, "quantity": 1}, {"item": self.soup.id, "quantity": 3}])
+        self._order("dinner", [{"item": self.soup.id, "quantity": 1}], date="2025-08-02")
+
+        self.assertEqual(self._production(), [
+            ("2025-08-01", "lunch", "Pasta", 3),
+            ("2025-08-01", "lunch", "Soup", 3),
+            ("2025-08-02", "dinner", "Soup", 1),
+        ])
+        self.assertEqual(self._production(date_from="2025-08-02"), [("2025-08-02", "dinner", "Soup", 1)])
+        self._summary_matches_aggregation()
+
+    def test_cancel_and_delete_update_summary(self):
+        first = self._order("lunch", [{"item": self.pasta.id, "quantity": 2}])
+        second = self._order("lunch", [{"item": self.pasta.id, "quantity": 5}])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.status = "cancelled"
+            first.save()
+        self.assertEqual(self._production(), [("2025-08-01", "lunch", "Pasta", 5)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertEqual(self._production(), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.status = "confirmed"
+            first.save()
+        self.assertEqual(self._production(), [("2025-08-01", "lunch", "Pasta", 2)])
+        self._summary_matches_aggregation()
+
+    def test_date_and_meal_changes_move_demand(self):
+        booking = self._order("lunch", [{"item": self.pasta.id, "quantity": 2}])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.date = date(2025, 8, 3)
+            booking.save()
+        self.assertEqual(self._production(), [("2025-08-03", "lunch", "Pasta", 2)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order = booking.order
+            order.meal = "dinner"
+            order.save()
+        self.assertEqual(self._production(), [("2025-08-03", "dinner", "Pasta", 2)])
+
+        # Cancelled and moved at once: taken out where it was counted.
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.date, booking.status = date(2025, 8, 4), "cancelled"
+            booking.save()
+        self.assertEqual(self._production(), [])
+        self._summary_matches_aggregation()
+
+    def test_rebuild_command(self):
+        self._order("breakfast", [{"item": self.soup.id, "quantity": 4}])
+        KitchenDemand.objects.update(quantity=99)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("rebuild_kitchen_demand", stdout=StringIO())
+        self.assertEqual(self._production(), [("2025-08-01", "breakfast", "Soup", 4)])
@@ -0,0 +1,80 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models import Booking
+
+User = get_user_model()
+
+
+class ManagerBookingsPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.voyager = User.objects.create_user(
+            username="voyager", email="voyager@example.com", password="pass123"
+        )
+        for day in range(1, 8):
+            Booking.objects.create(user=cls.voyager, type="movie", date=date(2025, 1, day))
+        Booking.objects.create(user=cls.voyager, type="resort", date=date(2025, 2, 1), status="confirmed")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+        self.url = reverse("manager-bookings")
+
+    def test_walks_every_booking_once_via_cursor(self):
+        seen = []
+        response = self.client.get(self.url, {"page_size": 3})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            seen.extend(row["id"] for row in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        expected = list(Booking.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def _walk(self, response, link):
+        """Follow `link` from `response`; returns the pages of ids and the last response."""
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append([row["id"] for row in response.data["results"]])
+            if not response.data[link]:
+                return pages, response
+            response = self.client.get(response.data[link])
+
+    def test_bookings_sharing_a_timestamp_are_paged_by_id(self):
+        Booking.objects.update(created_at=timezone.now())
+        expected = list(Booking.objects.order_by("-id").values_list("id", flat=True))
+
+        pages, last = self._walk(self.client.get(self.url, {"page_size": 3}), "next")
+        self.assertEqual(sum(pages, []), expected)
+
+        previous = self.client.get(last.data["previous"])
+        pages, _ = self._walk(previous, "previous")
+        self.assertEqual(sum(reversed(pages), []), expected[:len(expected) - len(last.data["results"])])
+
+    def test_filters(self):
+        response = self.client.get(self.url, {"type": "resort", "status": "confirmed"})
+        self.assertEqual(len(response.data["results"]), 1)
+
+        response = self.client.get(self.url, {"date_from": "2025-01-03", "date_to": "2025-01-05"})
+        self.assertEqual(len(response.data["results"]), 3)
+
+        response = self.client.get(self.url, {"user": self.manager.id})
+        self.assertEqual(response.data["results"], [])
+
+    def test_invalid_filter_is_rejected(self):
+        response = self.client.get(self.url, {"date_from": "yesterday", "type": "cruise"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("date_from", response.data["errors"])
+        self.assertIn("type", response.data["errors"])
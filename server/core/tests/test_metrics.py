@@ -0,0 +1,69 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.fast_serializers import BookingValues
+from core.metrics import RequestStats, current_stats, registry
+from core.models import Booking
+
+User = get_user_model()
+
+
+class RequestMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+
+    def setUp(self):
+        registry.reset()
+        self.client = APIClient()
+        self.client.force_authenticate(self.manager)
+
+    def test_route_metrics_are_exported(self):
+        self.client.get(reverse("manager-bookings"))
+        body = self.client.get(reverse("metrics")).content.decode()
+
+        labels = 'method="GET",route="/api/manager/bookings/",status="200"'
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 1", body)
+        self.assertIn(f"http_request_db_queries_count{{{labels}}} 1", body)
+        self.assertIn(f'http_request_db_queries_bucket{{{labels},le="0"}} 0', body)
+        self.assertIn(f"http_request_serialize_seconds_count{{{labels}}} 1", body)
+        self.assertIn(f"http_request_render_seconds_count{{{labels}}} 1", body)
+        self.assertIn(f"http_response_size_bytes_count{{{labels}}} 1", body)
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"])
+    def test_metrics_hidden_from_other_addresses(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
+
+    def test_forwarded_requests_are_checked_by_client_address(self):
+        url = reverse("metrics")
+        # A local proxy forwarding an outside request.
+        self.assertEqual(self.client.get(url, HTTP_X_FORWARDED_FOR="203.0.113.9").status_code, 404)
+        with override_settings(METRICS_TRUSTED_PROXIES=1, METRICS_ALLOWED_IPS=["10.0.0.5"]):
+            self.assertEqual(self.client.get(url, HTTP_X_FORWARDED_FOR="10.0.0.5").status_code, 200)
+            # A spoofed entry in front of the one the proxy added is ignored.
+            self.assertEqual(self.client.get(url, HTTP_X_FORWARDED_FOR="10.0.0.5, 203.0.113.9").status_code, 404)
+            self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_serialization_time_excludes_sql(self):
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        try:
+            BookingValues().serialize(Booking.objects.all())
+        finally:
+            current_stats.reset(token)
+        self.assertEqual(stats.query_count, 1)
+        self.assertGreater(stats.serialize_time, 0)
+        self.assertLess(stats.serialize_time, time.perf_counter() - stats.started - stats.query_time)
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0.001)
+    def test_slow_requests_are_logged_with_sql(self):
+        with self.assertLogs("core.slow_requests", level="WARNING") as logs:
+            self.client.get(reverse("manager-bookings"))
+        self.assertIn("/api/manager/bookings/", logs.output[0])
+        self.assertIn('FROM "core_booking"', logs.output[0])
@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Booking, Item, Order
+
+User = get_user_model()
+
+
+class OrderLineTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.cook = User.objects.create_user(
+            username="cook", email="cook@example.com", password="pass123", role="head_cook"
+        )
+        cls.pasta = Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+        cls.soup = Item.objects.create(name="Soup", category="catering", price=Decimal("4.00"))
+        cls.pen = Item.objects.create(name="Pen", category="stationery", price=Decimal("1.00"))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.voyager)
+
+    def _order(self, items):
+        return self.client.post(
+            reverse("voyager-catering"), {"date": "2025-08-01", "items": items}, format="json"
+        )
+
+    def test_order_snapshots_prices_and_total(self):
+        response = self._order([
+            {"item": self.pasta.id, "quantity": 2},
+            {"item": self.soup.id, "quantity": 1},
+            {"item": self.pasta.id, "quantity": 1},
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["type"], "catering")
+        self.assertEqual(response.data["order"]["total"], "41.50")
+
+        self.pasta.price = Decimal("99.00")
+        self.pasta.save()
+        order = Order.objects.get()
+        self.assertEqual(
+            sorted((line.item_name, line.quantity, line.unit_price) for line in order.lines.all()),
+            [("Pasta", 3, Decimal("12.50")), ("Soup", 1, Decimal("4.00"))],
+        )
+
+    def test_items_must_match_category(self):
+        response = self._order([{"item": self.pen.id, "quantity": 1}])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("items", response.data["errors"])
+        self.assertFalse(Booking.objects.exists())
+
+    def test_head_cook_orders_load_in_two_queries(self):
+        for _ in range(5):
+            self._order([{"item": self.pasta.id, "quantity": 1}, {"item": self.soup.id, "quantity": 2}])
+
+        client = APIClient()
+        client.force_authenticate(self.cook)
+        with self.assertNumQueries(2):
+            response = client.get(reverse("head_cook-orders"))
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len(response.data[0]["order"]["lines"]), 2)
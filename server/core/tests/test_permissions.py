@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.permissions import IsHeadCook, IsRole, IsVoyager
+
+User = get_user_model()
+
+
+class RolePermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.cook = User.objects.create_user(
+            username="cook", email="cook@example.com", password="pass123", role="head_cook"
+        )
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+
+    def _get(self, user, name):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get(reverse(name))
+
+    def test_composed_roles_admit_either_role(self):
+        self.assertEqual(self._get(self.voyager, "voyager-base").status_code, 200)
+        self.assertEqual(self._get(self.cook, "voyager-base").status_code, 200)
+        self.assertEqual(self._get(self.manager, "voyager-base").status_code, 403)
+
+    def test_view_is_not_mutated(self):
+        view = APIView()
+        request = RequestFactory().get("/")
+        request.user = self.cook
+        request.auth = None
+        self.assertTrue((IsVoyager | IsHeadCook)().has_permission(request, view))
+        self.assertFalse(hasattr(view, "allowed_roles"))
+
+    def test_role_is_read_from_token_claims(self):
+        token = AccessToken.for_user(self.voyager)
+        token["role"] = "head_cook"
+        request = RequestFactory().get("/")
+        request.user = self.voyager
+        request.auth = token
+        self.assertTrue(IsHeadCook().has_permission(request, APIView()))
+        self.assertFalse(IsVoyager().has_permission(request, APIView()))
+
+    def test_view_declared_roles(self):
+        class StaffView(APIView):
+            allowed_roles = ["Manager", "supervisor"]
+
+        request = RequestFactory().get("/")
+        request.user = self.manager
+        request.auth = None
+        self.assertTrue(IsRole().has_permission(request, StaffView()))
+        request.user = self.voyager
+        self.assertFalse(IsRole().has_permission(request, StaffView()))
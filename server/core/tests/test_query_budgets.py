@@ -0,0 +1,232 @@
+"""
+Query-count and latency budgets for every route in core.urls and api.urls.
+
+The fixture seeds a few hundred bookings, orders and items so list views
+that issue a query per row blow their budget. Every named route must
+appear in BUDGETS; adding a route without a budget fails
+`test_every_route_has_a_budget`.
+"""
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, include, path, reverse
+from rest_framework.test import APIClient
+
+from api import urls as api_urls
+from api.models import Booking as LegacyBooking, Item as LegacyItem
+from core import urls as core_urls
+from core.models import Booking, Item, Order, OrderLine
+from core.revocation import sync_cutoffs
+from core.serializers import CustomTokenObtainPairSerializer
+from core.tokens import RefreshToken
+
+User = get_user_model()
+
+urlpatterns = [
+    path("api/", include("core.urls")),
+    path("legacy/", include("api.urls")),
+]
+
+VOYAGERS = 20
+BOOKINGS_PER_VOYAGER = 15
+LINES_PER_ORDER = 3
+START = date(2025, 1, 1)
+
+# Seconds any request may take on a CI runner.
+MAX_SECONDS = 1.0
+# Requests that hash a password get longer.
+HASHING_SECONDS = 5.0
+
+
+def _booking_payload():
+    return {"type": "movie", "date": "2025-02-01"}
+
+
+def _order_payload(category):
+    def payload(fixture):
+        item = Item.objects.filter(category=category).first()
+        return {"date": "2025-02-01", "meal": "lunch", "items": [{"item": item.pk, "quantity": 2}]}
+    return payload
+
+
+def _item_kwargs(fixture):
+    return {"pk": Item.objects.first().pk}
+
+
+# (route name, method, role or None, data or callable(fixture), url kwargs, max queries, max seconds)
+BUDGETS = [
+    ("index", "get", None, None, None, 0, MAX_SECONDS),
+    ("voyager-register", "post", None,
+     {"email": "new@example.com", "password": "Sea-Days-2025", "password2": "Sea-Days-2025"}, None, 4,
+     HASHING_SECONDS),
+    ("admin-register", "post", None,
+     {"email": "new-admin@example.com", "password": "Sea-Days-2025", "password2": "Sea-Days-2025"}, None, 4,
+     HASHING_SECONDS),
+    ("manager-register", "post", None,
+     {"email": "new-manager@example.com", "password": "Sea-Days-2025", "password2": "Sea-Days-2025"}, None, 4,
+     HASHING_SECONDS),
+    ("head_cook-register", "post", None,
+     {"email": "new-cook@example.com", "password": "Sea-Days-2025", "password2": "Sea-Days-2025"}, None, 4,
+     HASHING_SECONDS),
+    ("supervisor-register", "post", None,
+     {"email": "new-supervisor@example.com", "password": "Sea-Days-2025", "password2": "Sea-Days-2025"}, None, 4,
+     HASHING_SECONDS),
+    ("session-login", "post", None, {"email": "voyager0@example.com", "password": "pass123"}, None, 6,
+     HASHING_SECONDS),
+    ("session-logout", "post", None, None, None, 0, MAX_SECONDS),
+    ("token_obtain_pair", "post", None, {"email": "voyager0@example.com", "password": "pass123"}, None, 2,
+     HASHING_SECONDS),
+    ("token_refresh", "post", None, lambda fixture: {"refresh": str(RefreshToken.for_user(fixture.voyager))},
+     None, 2, MAX_SECONDS),
+    ("token_revoke", "post", None, lambda fixture: {"refresh": str(RefreshToken.for_user(fixture.voyager))},
+     None, 1, MAX_SECONDS),
+    ("user-revoke-tokens", "post", "manager", None, lambda fixture: {"pk": fixture.guest.pk}, 2, MAX_SECONDS),
+    ("contact-api", "post", None, {"name": "Ada", "email": "ada@example.com", "message": "Hello"}, None, 1,
+     MAX_SECONDS),
+    ("voyager-base", "get", "voyager", None, None, 0, MAX_SECONDS),
+    ("voyager-catering", "get", "voyager", None, None, 1, MAX_SECONDS),
+    ("voyager-catering", "post", "voyager", _order_payload("catering"), None, 10, MAX_SECONDS),
+    ("voyager-stationery", "get", "voyager", None, None, 1, MAX_SECONDS),
+    ("voyager-stationery", "post", "voyager", _order_payload("stationery"), None, 8, MAX_SECONDS),
+    ("voyager-bookings", "post", "voyager", _booking_payload(), None, 6, MAX_SECONDS),
+    ("voyager-bookings-bulk", "post", "voyager", [_booking_payload()] * 10, None, 6, MAX_SECONDS),
+    ("voyager-catering-bulk", "post", "voyager", [_booking_payload()] * 10, None, 6, MAX_SECONDS),
+    ("voyager-stationery-bulk", "post", "voyager", [_booking_payload()] * 10, None, 6, MAX_SECONDS),
+    ("admin-items", "get", "admin", None, None, 2, MAX_SECONDS),
+    ("admin-items", "post", "admin", {"name": "Tea", "category": "catering", "price": "2.00"}, None, 2,
+     MAX_SECONDS),
+    ("admin-item-detail", "get", "admin", None, _item_kwargs, 2, MAX_SECONDS),
+    ("admin-item-detail", "put", "admin", {"name": "Tea", "category": "catering", "price": "2.50"},
+     _item_kwargs, 3, MAX_SECONDS),
+    ("admin-item-detail", "delete", "admin", None, _item_kwargs, 8, MAX_SECONDS),
+    ("manager-bookings", "get", "manager", None, None, 1, MAX_SECONDS),
+    ("manager-analytics", "get", "manager", None, None, 4, MAX_SECONDS),
+    ("head_cook-base", "get", "head_cook", None, None, 0, MAX_SECONDS),
+    ("head_cook-orders", "get", "head_cook", None, None, 2, MAX_SECONDS),
+    ("head_cook-production", "get", "head_cook", None, None, 1, MAX_SECONDS),
+    ("supervisor-orders", "get", "supervisor", None, None, 2, MAX_SECONDS),
+    ("sync-bookings", "get", "manager", None, None, 1, MAX_SECONDS),
+    ("sync-items", "get", "voyager", None, None, 1, MAX_SECONDS),
+    ("async-voyager-base", "get", "voyager", None, None, 0, MAX_SECONDS),
+    ("async-voyager-catering", "get", "voyager", None, None, 1, MAX_SECONDS),
+    ("async-voyager-stationery", "get", "voyager", None, None, 1, MAX_SECONDS),
+    ("async-manager-bookings", "get", "manager", None, None, 1, MAX_SECONDS),
+    ("async-manager-analytics", "get", "manager", None, None, 4, MAX_SECONDS),
+    ("async-head_cook-base", "get", "head_cook", None, None, 0, MAX_SECONDS),
+    ("async-head_cook-production", "get", "head_cook", None, None, 1, MAX_SECONDS),
+    ("async-booking-events", "get", "manager", None, None, 1, MAX_SECONDS),
+    ("items", "get", "voyager", None, None, 3, MAX_SECONDS),
+    ("items", "post", "staff", {"name": "Tea", "category": "catering", "price": "2.00"}, None, 2, MAX_SECONDS),
+    ("bookings", "get", "voyager", None, None, 3, MAX_SECONDS),
+    ("bookings", "post", "voyager", _booking_payload(), None, 2, MAX_SECONDS),
+]
+
+
+def route_names(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern.name
+
+
+@override_settings(
+    ROOT_URLCONF=__name__,
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    BOOKING_EVENTS_STREAM_LIFETIME=0,
+)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        voyagers = [
+            User.objects.create_user(username=f"voyager{n}", email=f"voyager{n}@example.com", password="pass123")
+            for n in range(VOYAGERS)
+        ]
+        cls.voyager = voyagers[0]
+        cls.guest = voyagers[1]
+        cls.users = {"voyager": cls.voyager}
+        for role in ("admin", "manager", "head_cook", "supervisor"):
+            cls.users[role] = User.objects.create_user(
+                username=role, email=f"{role}@example.com", password="pass123", role=role
+            )
+        cls.users["staff"] = User.objects.create_user(
+            username="staff", email="staff@example.com", password="pass123", is_staff=True
+        )
+
+        items = Item.objects.bulk_create(
+            Item(name=f"{category} {n}", category=category, price=Decimal("4.50"))
+            for category in ("catering", "stationery")
+            for n in range(20)
+        )
+        types = ["catering", "stationery", "movie", "salon", "fitness"]
+        bookings = Booking.objects.bulk_create(
+            Booking(user=voyager, type=types[n % len(types)], date=START + timedelta(days=n % 30))
+            for voyager in voyagers
+            for n in range(BOOKINGS_PER_VOYAGER)
+        )
+        orders = Order.objects.bulk_create(
+            Order(booking=booking, meal="lunch", total=Decimal("13.50"))
+            for booking in bookings
+            if booking.type in ("catering", "stationery")
+        )
+        OrderLine.objects.bulk_create(
+            OrderLine(order=order, item=item, item_name=item.name, quantity=1,
+                      unit_price=item.price, line_total=item.price)
+            for order in orders
+            for item in items[:LINES_PER_ORDER]
+        )
+
+        LegacyItem.objects.bulk_create(
+            LegacyItem(name=f"legacy {n}", price=Decimal("1.00")) for n in range(40)
+        )
+        LegacyBooking.objects.bulk_create(
+            LegacyBooking(user=cls.voyager, date=START + timedelta(days=n)) for n in range(40)
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def client_for(self, role):
+        client = APIClient()
+        if role is not None:
+            user = self.users[role]
+            token = CustomTokenObtainPairSerializer.get_token(user).access_token
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def test_every_route_has_a_budget(self):
+        covered = {budget[0] for budget in BUDGETS}
+        for patterns in (core_urls.urlpatterns, api_urls.urlpatterns):
+            for name in route_names(patterns):
+                self.assertIn(name, covered, f"Route '{name}' has no query budget.")
+
+    def test_routes_stay_within_budget(self):
+        for name, method, role, data, url_kwargs, max_queries, max_seconds in BUDGETS:
+            with self.subTest(route=name, method=method):
+                if callable(data):
+                    data = data(self)
+                kwargs = url_kwargs(self) if callable(url_kwargs) else url_kwargs
+                url = reverse(name, kwargs=kwargs)
+                client = self.client_for(role)
+                cache.clear()
+                # Per-process warm-up, not a per-request cost.
+                sync_cutoffs()
+
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as queries:
+                    response = getattr(client, method)(url, data, format="json")
+                elapsed = time.perf_counter() - started
+
+                self.assertLess(response.status_code, 400, f"{method.upper()} {url}: {response.status_code}")
+                executed = [
+                    query["sql"] for query in queries.captured_queries if "SAVEPOINT" not in query["sql"]
+                ]
+                self.assertLessEqual(
+                    len(executed), max_queries,
+                    f"{method.upper()} {url} ran {len(executed)} queries:\n" + "\n".join(executed),
+                )
+                self.assertLess(elapsed, max_seconds, f"{method.upper()} {url} took {elapsed:.2f}s")
@@ -0,0 +1,91 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.accounts import first_free_username, taken_usernames
+from core.models import Voyager
+
+User = get_user_model()
+
+
+class RegistrationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def _register(self, email, **extra):
+        return self.client.post(
+            reverse("voyager-register"), {"email": email, "password": "Sail-away-42", **extra}, format="json"
+        )
+
+    def test_colliding_usernames_get_next_free_suffix(self):
+        names = [self._register(f"alex@{domain}.com").data["user"]["username"] for domain in "abcd"]
+        self.assertEqual(names, ["alex", "alex1", "alex2", "alex3"])
+
+    def test_registration_is_one_lookup_and_one_insert(self):
+        self._register("sam@a.com")
+        self._register("sam@b.com")
+        with CaptureQueriesContext(connection) as queries:
+            response = self._register("sam@c.com", username="Sam")
+        self.assertEqual(response.status_code, 201)
+        statements = [q["sql"].split()[0] for q in queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(statements, ["SELECT", "INSERT"])
+        user = User.objects.get(email="sam@c.com")
+        self.assertEqual((user.username, user.role), ("Sam", "voyager"))
+        self.assertTrue(user.check_password("Sail-away-42"))
+
+    def test_duplicate_email_is_rejected(self):
+        self._register("kim@example.com")
+        response = self._register(" KIM@example.com ")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email", response.data["errors"])
+
+    def test_role_serializers_set_role(self):
+        response = self.client.post(
+            reverse("manager-register"), {"email": "boss@example.com", "password": "Sail-away-42"}, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(User.objects.get(email="boss@example.com").role, "manager")
+
+    def test_first_free_username(self):
+        self.assertEqual(first_free_username("lee", set()), "lee")
+        self.assertEqual(first_free_username("lee", {"lee", "lee1", "lee3", "leeroy"}), "lee2")
+
+    def test_taken_usernames_fetches_only_candidates(self):
+        for username in ["lee", "lee2", "leeroy", "lee2x", "j.o", "jxo", "j.o1"]:
+            User.objects.create(username=username, email=f"{username}@example.com")
+        self.assertEqual(taken_usernames(["lee", "j.o"]), {"lee", "lee2", "j.o", "j.o1"})
+
+
+class ImportVoyagersTests(TestCase):
+    def test_manifest_import(self):
+        User.objects.create_user(email="dup@example.com", password="x", username="pat")
+        manifest = (
+            "email,username,password,first_name,phone_number\n"
+            "pat@example.com,,pw-one,Pat,555-0100\n"
+            "pat@other.com,,,Pat,\n"
+            "dup@example.com,,,Dup,\n"
+            "not-an-email,,,Nope,\n"
+        )
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as handle:
+            handle.write(manifest)
+        self.addCleanup(os.unlink, handle.name)
+
+        err = StringIO()
+        call_command("import_voyagers", handle.name, workers=1, stdout=StringIO(), stderr=err)
+
+        first = User.objects.get(email="pat@example.com")
+        second = User.objects.get(email="pat@other.com")
+        self.assertEqual((first.username, second.username), ("pat1", "pat2"))
+        self.assertTrue(first.check_password("pw-one"))
+        self.assertFalse(second.has_usable_password())
+        self.assertEqual(Voyager.objects.get(user=first).phone_number, "555-0100")
+        self.assertIn("Row 3", err.getvalue())
+        self.assertIn("Row 4", err.getvalue())
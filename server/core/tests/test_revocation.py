@@ -0,0 +1,135 @@
+import time
+from datetime import timedelta
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import RevokedToken
+from core.revocation import is_revoked, sync_cutoffs
+from core.serializers import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+class TokenRevocationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pass123", role="admin"
+        )
+
+    def setUp(self):
+        cache.clear()
+        # Drop the revocation generation, so later tests reload their cut-offs.
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+
+    def _refresh(self, refresh):
+        return self.client.post(reverse("token_refresh"), {"refresh": str(refresh)}, format="json")
+
+    def _bearer(self, token):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        refresh = CustomTokenObtainPairSerializer.get_token(self.voyager)
+
+        first = self._refresh(refresh)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+        # The replacement token still works.
+        self.assertEqual(self._refresh(first.data["refresh"]).status_code, 200)
+
+    def _revoke_user(self, staff, user):
+        client = self._bearer(CustomTokenObtainPairSerializer.get_token(staff).access_token)
+        with self.captureOnCommitCallbacks(execute=True):
+            return client.post(reverse("user-revoke-tokens", kwargs={"pk": user.pk}))
+
+    def test_revoked_token_survives_a_cache_flush(self):
+        refresh = CustomTokenObtainPairSerializer.get_token(self.voyager)
+        response = self.client.post(reverse("token_revoke"), {"refresh": str(refresh)}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        cache.clear()
+
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+        self.assertEqual(RevokedToken.objects.get().jti, refresh["jti"])
+
+    def test_revoke_all_for_user(self):
+        refresh = CustomTokenObtainPairSerializer.get_token(self.voyager)
+        access = refresh.access_token
+        self.assertEqual(self._bearer(access).get(reverse("voyager-base")).status_code, 200)
+
+        self.assertEqual(self._revoke_user(self.manager, self.voyager).status_code, 200)
+
+        self.assertEqual(self._bearer(access).get(reverse("voyager-base")).status_code, 401)
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+
+        # Tokens issued after the cut-off are unaffected.
+        later = CustomTokenObtainPairSerializer.get_token(self.voyager).access_token
+        later["iat"] = int(time.time()) + 1
+        self.assertFalse(is_revoked(later.payload))
+
+    def test_user_cutoff_applies_to_string_user_ids(self):
+        refresh = RefreshToken.for_user(self.voyager)
+        self.assertEqual(refresh["user_id"], str(self.voyager.pk))
+
+        self._revoke_user(self.manager, self.voyager)
+
+        self.assertTrue(is_revoked(refresh.payload))
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+        self.assertEqual(self._bearer(refresh.access_token).get(reverse("voyager-base")).status_code, 401)
+
+    def test_user_cutoff_survives_a_cache_flush(self):
+        access = CustomTokenObtainPairSerializer.get_token(self.voyager).access_token
+        self._revoke_user(self.manager, self.voyager)
+
+        cache.clear()
+
+        self.assertEqual(self._bearer(access).get(reverse("voyager-base")).status_code, 401)
+
+    async def test_async_views_honour_user_cutoffs(self):
+        access = CustomTokenObtainPairSerializer.get_token(self.voyager).access_token
+        headers = {"Authorization": f"Bearer {access}"}
+        self.assertEqual((await self.async_client.get(reverse("async-voyager-base"), headers=headers)).status_code, 200)
+
+        await sync_to_async(self._revoke_user)(self.manager, self.voyager)
+
+        self.assertEqual((await self.async_client.get(reverse("async-voyager-base"), headers=headers)).status_code, 401)
+
+    def test_revoking_is_limited_by_target_role(self):
+        self.assertEqual(self._revoke_user(self.voyager, self.manager).status_code, 403)
+        self.assertEqual(self._revoke_user(self.manager, self.admin).status_code, 403)
+        self.assertEqual(self._revoke_user(self.manager, self.manager).status_code, 403)
+        self.assertEqual(self._revoke_user(self.admin, self.manager).status_code, 200)
+        self.assertFalse(RevokedToken.objects.filter(user_id=self.admin.pk).exists())
+
+    def test_access_token_check_makes_no_queries(self):
+        client = self._bearer(CustomTokenObtainPairSerializer.get_token(self.voyager).access_token)
+        sync_cutoffs()
+        with self.assertNumQueries(0):
+            self.assertEqual(client.get(reverse("voyager-base")).status_code, 200)
+
+    def test_prune_drops_expired_revocations(self):
+        now = timezone.now()
+        RevokedToken.objects.create(jti="expired", expires_at=now - timedelta(minutes=1))
+        RevokedToken.objects.create(jti="live", expires_at=now + timedelta(minutes=1))
+
+        out = StringIO()
+        call_command("prune_revoked_tokens", stdout=out)
+
+        self.assertIn("Pruned 1", out.getvalue())
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["live"])
@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.models import Booking, Item, Order
+
+User = get_user_model()
+
+
+class SparseFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.manager = User.objects.create_user(
+            username="manager", email="manager@example.com", password="pass123", role="manager"
+        )
+        cls.head_cook = User.objects.create_user(
+            username="cook", email="cook@example.com", password="pass123", role="head_cook"
+        )
+        for day in range(1, 4):
+            booking = Booking.objects.create(user=cls.voyager, type="catering", date=f"2025-01-0{day}")
+            Order.objects.create(booking=booking, meal="lunch", total=Decimal("5"))
+        Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_fields_limit_keys_and_columns(self):
+        self.client.force_authenticate(self.manager)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("manager-bookings"), {"fields": "type,status"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data["results"][0]), ["type", "status"])
+        sql = queries.captured_queries[-1]["sql"]
+        self.assertNotIn('"core_booking"."user_id"', sql)
+        self.assertNotIn('"core_booking"."date"', sql)
+        # The cursor still works without created_at in the output.
+        self.assertIsNone(response.data["next"])
+
+    def test_include_user_embeds_it_in_the_same_query(self):
+        self.client.force_authenticate(self.manager)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("manager-bookings"), {"fields": "id,user", "include": "user"})
+        self.assertEqual(
+            response.data["results"][0]["user"],
+            {"id": self.voyager.pk, "username": "voyager", "email": "voyager@example.com"},
+        )
+
+    def test_orders_without_order_field_skip_lines_query(self):
+        self.client.force_authenticate(self.head_cook)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("head_cook-orders"), {"fields": "id,date"})
+        self.assertEqual(response.data[0], {"id": response.data[0]["id"], "date": "2025-01-01"})
+
+    def test_catalog_fields(self):
+        self.client.force_authenticate(self.voyager)
+        response = self.client.get(reverse("voyager-catering"), {"fields": "name,price"})
+        self.assertEqual(response.data, [{"name": "Pasta", "price": "12.50"}])
+
+    def test_unknown_fields_and_includes_are_rejected(self):
+        self.client.force_authenticate(self.manager)
+        response = self.client.get(reverse("manager-bookings"), {"fields": "secret", "include": "ship"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data["errors"]), {"fields", "include"})
+
+    def test_empty_fieldset_is_rejected(self):
+        self.client.force_authenticate(self.manager)
+        response = self.client.get(reverse("manager-bookings"), {"fields": ","})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.data["errors"])
+
+    def test_order_alone(self):
+        self.client.force_authenticate(self.head_cook)
+        response = self.client.get(reverse("head_cook-orders"), {"fields": "order"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data[0]), ["order"])
+        self.assertEqual(response.data[0]["order"]["meal"], "lunch")
+
+    def test_order_keeps_its_requested_position(self):
+        self.client.force_authenticate(self.head_cook)
+        response = self.client.get(reverse("head_cook-orders"), {"fields": "order,type", "include": "user"})
+        self.assertEqual(list(response.data[0]), ["order", "type", "user"])
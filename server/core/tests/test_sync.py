@@ -0,0 +1,158 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models import Booking, Item, Tombstone
+from core.sync import changes_since
+
+User = get_user_model()
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class DeltaSyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.voyager = User.objects.create_user(username="voyager", email="voyager@example.com", password="pass123")
+        cls.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pass123", role="admin"
+        )
+        cls.head_cook = User.objects.create_user(
+            username="cook", email="cook@example.com", password="pass123", role="head_cook"
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_item_sync_returns_only_changes_and_tombstones(self):
+        self.client.force_authenticate(self.admin)
+        pasta = Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+        notebook = Item.objects.create(name="Notebook", category="stationery", price=Decimal("3.00"))
+
+        first = self.client.get(reverse("sync-items"))
+        self.assertEqual(len(first.data["changed"]), 2)
+        watermark = first.data["watermark"]
+
+        unchanged = self.client.get(reverse("sync-items"), {"since": watermark})
+        self.assertEqual(unchanged.data["changed"], [])
+        self.assertEqual(unchanged.data["deleted"], [])
+
+        pasta.price = Decimal("13.00")
+        pasta.save()
+        self.client.delete(reverse("admin-item-detail", args=[notebook.pk]))
+
+        delta = self.client.get(reverse("sync-items"), {"since": watermark})
+        self.assertEqual([item["id"] for item in delta.data["changed"]], [pasta.pk])
+        self.assertEqual(delta.data["deleted"], [notebook.pk])
+
+    def test_booking_sync_is_scoped_to_role(self):
+        self.client.force_authenticate(self.head_cook)
+        start = self.client.get(reverse("sync-bookings")).data["watermark"]
+        catering = Booking.objects.create(user=self.voyager, type="catering", date="2025-01-01")
+        Booking.objects.create(user=self.voyager, type="movie", date="2025-01-01").delete()
+        catering.status = "confirmed"
+        catering.save()
+
+        delta = self.client.get(reverse("sync-bookings"), {"since": start})
+        self.assertEqual([row["id"] for row in delta.data["changed"]], [catering.pk])
+        self.assertEqual(delta.data["changed"][0]["status"], "confirmed")
+        self.assertEqual(delta.data["deleted"], [])
+
+    def test_invalid_since_is_rejected(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(reverse("sync-items"), {"since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.data["errors"])
+
+    def test_voyagers_cannot_sync_bookings(self):
+        self.client.force_authenticate(self.voyager)
+        self.assertEqual(self.client.get(reverse("sync-bookings")).status_code, 403)
+
+    @override_settings(SYNC_SETTLE_SECONDS=60)
+    def test_watermark_trails_uncommitted_writes(self):
+        self.client.force_authenticate(self.admin)
+        first = self.client.get(reverse("sync-items"))
+        self.assertEqual(first.data["changed"], [])
+
+        # A row stamped 30s ago whose transaction only commits now.
+        late = Item.objects.create(name="Soup", category="catering", price=Decimal("4.00"))
+        Item.objects.filter(pk=late.pk).update(updated_at=timezone.now() - timedelta(seconds=30))
+
+        # Still inside the settle window, so not served yet...
+        pending = self.client.get(reverse("sync-items"), {"since": first.data["watermark"]})
+        self.assertEqual(pending.data["changed"], [])
+        # ...but not behind the watermark either, so it arrives once settled.
+        with self.settings(SYNC_SETTLE_SECONDS=20):
+            delta = self.client.get(reverse("sync-items"), {"since": pending.data["watermark"]})
+        self.assertEqual([item["id"] for item in delta.data["changed"]], [late.pk])
+
+    def test_pages_through_rows_sharing_a_timestamp(self):
+        items = Item.objects.bulk_create(
+            Item(name=f"Item {n}", category="catering", price=Decimal("1.00")) for n in range(5)
+        )
+        stamp = timezone.now() - timedelta(minutes=1)
+        Item.objects.update(updated_at=stamp)
+
+        seen = []
+        since = after = None
+        for _ in range(5):
+            data = changes_since(Item.objects.all(), "item", since, after, limit=2)
+            seen += [item.pk for item in data["changed"]]
+            since, after = data["watermark"], data["after"]
+            if not data["has_more"]:
+                break
+        self.assertEqual(seen, [item.pk for item in items])
+        self.assertFalse(data["has_more"])
+
+    def test_since_older_than_tombstones_resets(self):
+        self.client.force_authenticate(self.admin)
+        Item.objects.create(name="Pasta", category="catering", price=Decimal("12.50"))
+        since = (timezone.now() - timedelta(days=365)).isoformat()
+
+        response = self.client.get(reverse("sync-items"), {"since": since})
+        self.assertTrue(response.data["reset"])
+        self.assertEqual(len(response.data["changed"]), 1)
+
+    def test_pages_a_stale_table_to_the_end(self):
+        items = Item.objects.bulk_create(
+            Item(name=f"Item {n}", category="catering", price=Decimal("1.00")) for n in range(5)
+        )
+        stamp = timezone.now() - timedelta(days=60)
+        for n, item in enumerate(items):
+            Item.objects.filter(pk=item.pk).update(updated_at=stamp + timedelta(seconds=n))
+
+        seen, resets = [], []
+        since = after = None
+        for _ in range(5):
+            data = changes_since(Item.objects.all(), "item", since, after, limit=2)
+            seen += [item.pk for item in data["changed"]]
+            resets.append(data["reset"])
+            since, after = data["watermark"], data["after"]
+            if not data["has_more"]:
+                break
+        self.assertEqual(seen, [item.pk for item in items])
+        self.assertFalse(data["has_more"])
+        self.assertEqual(resets, [True, False, False])
+
+    def test_after_requires_since(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(reverse("sync-items"), {"after": "3"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("after", response.data["errors"])
+
+    def test_prune_tombstones(self):
+        old = Tombstone.objects.create(model="item", object_id=1, kind="catering")
+        Tombstone.objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=365))
+        Tombstone.objects.create(model="item", object_id=2, kind="catering")
+
+        out = StringIO()
+        call_command("prune_tombstones", stdout=out)
+
+        self.assertIn("Pruned 1", out.getvalue())
+        self.assertEqual(list(Tombstone.objects.values_list("object_id", flat=True)), [2])
@@ -0,0 +1,23 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+from .caching import shared_cache
+
+
+class ContactRateThrottle(SimpleRateThrottle):
+    """
+    Per client IP limit for the contact form, signed in or not. The rate is
+    REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]["contact"].
+    """
+
+    scope = "contact"
+
+    @property
+    def cache(self):
+        # Request history must be shared by every worker, so skip the
+        # per-process tier. The history is read, then written back, and the
+        # file-based backend has no atomic update, so requests racing each
+        # other can each be let through: the limit is approximate, not exact.
+        return shared_cache()
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
@@ -0,0 +1,39 @@
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import is_revoked, is_token_revoked, revoke_token
+
+
+class RevocableTokenMixin:
+    """Rejects tokens on the revocation list (core.revocation) when verifying them."""
+
+    def verify(self):
+        super().verify()
+        if is_revoked(self.payload):
+            raise TokenError("Token is revoked")
+
+
+class AccessToken(RevocableTokenMixin, tokens.AccessToken):
+    pass
+
+
+class RefreshToken(RevocableTokenMixin, tokens.RefreshToken):
+    access_token_class = AccessToken
+
+    def verify(self):
+        super().verify()
+        # With blacklisting on rotation, blacklist() below rejects a revoked
+        # token when it inserts it; otherwise look it up.
+        if not (api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION):
+            if is_token_revoked(self.payload[api_settings.JTI_CLAIM]):
+                raise TokenError("Token is revoked")
+
+    def blacklist(self):
+        """
+        Revoke this token. Called by the refresh serializer after rotation
+        (BLACKLIST_AFTER_ROTATION); fails if it was already revoked, by an
+        earlier rotation, a concurrent one or a logout.
+        """
+        if not revoke_token(self):
+            raise TokenError("Token is revoked")
@@ -20,17 +20,29 @@ from .views import (
 
     # JWT
     CustomTokenObtainPairView,
+    TokenRevokeView,
+    UserTokenRevokeView,
 
     # Role-based features
     VoyagerCateringOrdersView,
     VoyagerStationeryOrdersView,
     VoyagerBookingView,
+    VoyagerBulkBookingView,
+    VoyagerBulkCateringOrdersView,
+    VoyagerBulkStationeryOrdersView,
     AdminItemManagementView,
     ManagerViewBookings,
+    ManagerBookingAnalyticsView,
     HeadCookViewOrders,
+    HeadCookProductionView,
     SupervisorViewOrders,
+
+    # Delta sync
+    BookingChangesView,
+    ItemChangesView,
 )
 from rest_framework_simplejwt.views import TokenRefreshView
+from . import async_views
 
 
 urlpatterns = [
@@ -50,6 +62,8 @@ urlpatterns = [
     # ===== JWT Auth =====
     path("token/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("token/revoke/", TokenRevokeView.as_view(), name="token_revoke"),
+    path("users/<int:pk>/revoke_tokens/", UserTokenRevokeView.as_view(), name="user-revoke-tokens"),
 
     # ===== Contact =====
     path("contact/", contact_api, name="contact-api"),
@@ -59,6 +73,9 @@ urlpatterns = [
     path("voyager/catering/", VoyagerCateringOrdersView.as_view(), name="voyager-catering"),
     path("voyager/stationery/", VoyagerStationeryOrdersView.as_view(), name="voyager-stationery"),
     path("voyager/bookings/", VoyagerBookingView.as_view(), name="voyager-bookings"),
+    path("voyager/bookings/bulk/", VoyagerBulkBookingView.as_view(), name="voyager-bookings-bulk"),
+    path("voyager/catering/bulk/", VoyagerBulkCateringOrdersView.as_view(), name="voyager-catering-bulk"),
+    path("voyager/stationery/bulk/", VoyagerBulkStationeryOrdersView.as_view(), name="voyager-stationery-bulk"),
 
     # ===== Admin APIs =====
     path("admin/items/", AdminItemManagementView.as_view(), name="admin-items"),
@@ -66,11 +83,27 @@ urlpatterns = [
 
     # ===== Manager APIs =====
     path("manager/bookings/", ManagerViewBookings.as_view(), name="manager-bookings"),
+    path("manager/analytics/", ManagerBookingAnalyticsView.as_view(), name="manager-analytics"),
 
     # ===== HeadCook APIs =====
     path("head_cook/", HeadCookBaseView.as_view(), name="head_cook-base"),
     path("head_cook/orders/", HeadCookViewOrders.as_view(), name="head_cook-orders"),
+    path("head_cook/production/", HeadCookProductionView.as_view(), name="head_cook-production"),
 
     # ===== Supervisor APIs =====
     path("supervisor/orders/", SupervisorViewOrders.as_view(), name="supervisor-orders"),
+
+    # ===== Delta sync =====
+    path("sync/bookings/", BookingChangesView.as_view(), name="sync-bookings"),
+    path("sync/items/", ItemChangesView.as_view(), name="sync-items"),
+
+    # ===== Async read APIs (served natively under ASGI) =====
+    path("async/voyager/", async_views.voyager_dashboard, name="async-voyager-base"),
+    path("async/voyager/catering/", async_views.catering_catalog, name="async-voyager-catering"),
+    path("async/voyager/stationery/", async_views.stationery_catalog, name="async-voyager-stationery"),
+    path("async/manager/bookings/", async_views.manager_bookings, name="async-manager-bookings"),
+    path("async/manager/analytics/", async_views.manager_analytics, name="async-manager-analytics"),
+    path("async/head_cook/", async_views.head_cook_dashboard, name="async-head_cook-base"),
+    path("async/head_cook/production/", async_views.head_cook_production, name="async-head_cook-production"),
+    path("async/events/bookings/", async_views.booking_events, name="async-booking-events"),
 ]
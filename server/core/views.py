@@ -1,15 +1,19 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model, login, logout
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.db import transaction
 import json
+from collections import Counter
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
 from .serializers import (
     VoyagerRegisterSerializer,
@@ -18,12 +22,41 @@ from .serializers import (
     HeadCookRegisterSerializer,
     SupervisorRegisterSerializer,
     CustomTokenObtainPairSerializer,
+    TokenRevokeSerializer,
     ContactMessageSerializer,
     ItemSerializer,
     BookingSerializer,
+    BookingOrderSerializer,
+    OrderCreateSerializer,
 )
-from .models import Item, Booking
-from .permissions import IsVoyager, IsAdmin, IsManager, IsHeadCook, IsSupervisor
+from .models import Item, Booking, Order
+from .analytics import cached_booking_summary, record_bookings
+from .batching import coalesced_write
+from .authentication import ClaimsJWTAuthentication
+from .catalog import catalog_etag, catalog_version, etag_matches, get_catalog
+from .contact_queue import enqueue, forget_message, is_duplicate
+from .db import ReplicaReadMixin
+from .events import record_events
+from .exports import EXPORT_FORMATS, stream_bookings
+from .fast_serializers import BookingOrderValues, BookingValues, ItemValues, for_params, project_fields
+from .filters import date_range_filters, filter_bookings
+from .hashers import verify_password
+from .inventory import SlotUnavailable, allocate
+from .kitchen import production_rows
+from .pagination import BookingCursorPagination
+from .revocation import revoke_token, revoke_user_tokens
+from .permissions import (
+    STAFF_BOOKING_TYPES,
+    IsVoyager,
+    IsAdmin,
+    IsManager,
+    IsHeadCook,
+    IsSupervisor,
+    request_role,
+)
+from .sync import changes_since, parse_sync_params
+from .throttling import ContactRateThrottle
+from .tokens import RefreshToken
 
 User = get_user_model()
 
@@ -57,7 +90,7 @@ def session_login(request):
     except User.DoesNotExist:
         return JsonResponse({"success": False, "message": "Invalid credentials"}, status=401)
 
-    if user.check_password(password):
+    if verify_password(user, password):
         login(request, user)
         return JsonResponse(
             {
@@ -79,11 +112,26 @@ def session_logout(request):
 # ========= CONTACT API =========
 @api_view(["POST"])
 @permission_classes([permissions.AllowAny])
+@throttle_classes([ContactRateThrottle])
 def contact_api(request):
     serializer = ContactMessageSerializer(data=request.data)
     if serializer.is_valid():
-        serializer.save()
-        return Response({"success": True, "message": "Message received successfully!"})
+        data = serializer.validated_data
+        # A repeat of a recent message is acknowledged the same way but not
+        # stored again.
+        if not is_duplicate(data["email"], data["message"]):
+            try:
+                if settings.CONTACT_QUEUE:
+                    enqueue(data)
+                else:
+                    coalesced_write(serializer.save)
+            except Exception:
+                forget_message(data["email"], data["message"])
+                raise
+        return Response(
+            {"success": True, "message": "Message received successfully!"},
+            status=status.HTTP_202_ACCEPTED if settings.CONTACT_QUEUE else status.HTTP_200_OK,
+        )
     return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -177,50 +225,242 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
 
+class TokenRevokeView(APIView):
+    """Log out a JWT client by revoking its refresh token."""
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request):
+        serializer = TokenRevokeSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            revoke_token(RefreshToken(serializer.validated_data["refresh"]))
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+        return Response({"success": True, "message": "Token revoked"})
+
+
+class UserTokenRevokeView(APIView):
+    """
+    Revoke every token issued to a user so far, e.g. when a guest
+    disembarks. They can sign in again afterwards. Managers may only
+    revoke voyagers; admins may revoke anyone.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsManager | IsAdmin]
+    revocable_roles = {
+        "manager": frozenset({User.Role.VOYAGER}),
+        "admin": frozenset(User.Role),
+    }
+
+    def post(self, request, pk):
+        role = User.objects.filter(pk=pk).values_list("role", flat=True).first()
+        if role is None:
+            return Response({"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND)
+        if role not in self.revocable_roles[request_role(request)]:
+            return Response(
+                {"detail": "Your role cannot revoke this user's tokens."}, status=status.HTTP_403_FORBIDDEN
+            )
+        revoke_user_tokens(pk)
+        return Response({"success": True, "message": "Tokens revoked", "user_id": pk})
+
+
+def parse_ship_id(value):
+    """Return `(ship_id, error_response)` for an optional `ship` field."""
+    if value is None:
+        return None, None
+    if not str(value).isdigit():
+        return None, Response(
+            {"success": False, "errors": {"ship": ["Ship must be a numeric id."]}},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return int(value), None
+
+
+# ========= CATALOG =========
+def catalog_response(request, category):
+    """
+    Cached item catalog for `category` with ETag revalidation.
+
+    A matching If-None-Match is answered with 304 straight from the cache
+    version counter, without touching the Item table. `?fields=` narrows
+    the cached rows.
+    """
+    serializer, errors = for_params(ItemValues, request.query_params)
+    if errors:
+        return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+    version = catalog_version(category)
+    etag = catalog_etag(category, version)
+    if etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(project_fields(get_catalog(category, version), serializer.fields))
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+# ========= ORDERS =========
+def create_order_response(request, category):
+    """Create a booking with line items for `category` and return it."""
+    serializer = OrderCreateSerializer(data=request.data, context={"category": category})
+    if not serializer.is_valid():
+        return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    booking = coalesced_write(lambda: serializer.save(user_id=request.user.pk))
+    return Response(BookingOrderSerializer(booking).data, status=status.HTTP_201_CREATED)
+
+
 # ========= ROLE-BASED FEATURES =========
 # ---- VOYAGER (also allow HeadCook here) ----
 class VoyagerCateringOrdersView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated, (IsVoyager | IsHeadCook)]
 
     def get(self, request):
-        catering_items = Item.objects.filter(category="catering")
-        return Response(ItemSerializer(catering_items, many=True).data)
+        return catalog_response(request, "catering")
 
     def post(self, request):
+        if "items" in request.data:
+            return create_order_response(request, "catering")
         serializer = BookingSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(user=request.user, type="catering")
+            coalesced_write(lambda: serializer.save(user_id=request.user.pk, type="catering"))
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
 class VoyagerStationeryOrdersView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated, (IsVoyager | IsHeadCook)]
 
     def get(self, request):
-        stationery_items = Item.objects.filter(category="stationery")
-        return Response(ItemSerializer(stationery_items, many=True).data)
+        return catalog_response(request, "stationery")
 
     def post(self, request):
+        if "items" in request.data:
+            return create_order_response(request, "stationery")
         serializer = BookingSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(user=request.user, type="stationery")
+            coalesced_write(lambda: serializer.save(user_id=request.user.pk, type="stationery"))
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
 
 class VoyagerBookingView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated, (IsVoyager | IsHeadCook)]
 
     def post(self, request):
         serializer = BookingSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save(user=request.user)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        if not serializer.is_valid():
+            return Response({"success": False, "errors": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        ship_id, error = parse_ship_id(request.data.get("ship"))
+        if error:
+            return error
+
+        def write():
+            data = serializer.validated_data
+            # A booking created cancelled holds no place (see booking_deleted).
+            count = 0 if data.get("status") == "cancelled" else 1
+            slot_id = allocate(data["type"], data["date"], ship_id, count)
+            serializer.save(user_id=request.user.pk, slot_id=slot_id)
+
+        try:
+            coalesced_write(write)
+        except SlotUnavailable as exc:
+            return Response({"success": False, "message": str(exc)}, status=status.HTTP_409_CONFLICT)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+# ---- VOYAGER BULK ----
+class VoyagerBulkBookingView(APIView):
+    """
+    Create a group of bookings in one request.
+
+    The body is a list of BookingSerializer payloads, or
+    `{"ship": <id>, "bookings": [...]}`. Every entry is validated up front
+    and nothing is written unless all of them are valid. The batch is then
+    inserted with a single bulk_create inside one transaction, taking slot
+    places per (type, date) group rather than per booking.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated, (IsVoyager | IsHeadCook)]
+    booking_type = None  # set by the catering/stationery order variants
+    max_batch_size = 100
+
+    def post(self, request):
+        payload = request.data
+        ship_id = None
+        if isinstance(payload, dict):
+            ship_id, error = parse_ship_id(payload.get("ship"))
+            if error:
+                return error
+            payload = payload.get("bookings")
+
+        if not isinstance(payload, list) or not payload:
+            return Response(
+                {"success": False, "errors": {"bookings": ["Expected a non-empty list of bookings."]}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(payload) > self.max_batch_size:
+            return Response(
+                {"success": False, "errors": {"bookings": [f"At most {self.max_batch_size} bookings per request."]}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        item_serializers = [BookingSerializer(data=item) for item in payload]
+        if not all([serializer.is_valid() for serializer in item_serializers]):
+            results = [
+                {"index": index, "success": True}
+                if not serializer.errors
+                else {"index": index, "success": False, "errors": serializer.errors}
+                for index, serializer in enumerate(item_serializers)
+            ]
+            return Response({"success": False, "results": results}, status=status.HTTP_400_BAD_REQUEST)
+
+        bookings = [
+            Booking(user_id=request.user.pk, **serializer.validated_data) for serializer in item_serializers
+        ]
+        try:
+            with transaction.atomic():
+                if self.booking_type:
+                    for booking in bookings:
+                        booking.type = self.booking_type
+                else:
+                    groups = Counter()
+                    for booking in bookings:
+                        groups[(booking.type, booking.date)] += booking.status != "cancelled"
+                    slots = {
+                        (booking_type, booking_date): allocate(booking_type, booking_date, ship_id, count)
+                        for (booking_type, booking_date), count in groups.items()
+                    }
+                    for booking in bookings:
+                        booking.slot_id = slots[(booking.type, booking.date)]
+                created = Booking.objects.bulk_create(bookings)
+                # bulk_create skips post_save, so update the rollups and event log here.
+                record_bookings(created)
+                record_events(created)
+        except SlotUnavailable as exc:
+            return Response({"success": False, "message": str(exc)}, status=status.HTTP_409_CONFLICT)
+
+        results = [
+            {"index": index, "success": True, "booking": row}
+            for index, row in enumerate(BookingSerializer(created, many=True).data)
+        ]
+        return Response({"success": True, "results": results}, status=status.HTTP_201_CREATED)
+
+
+class VoyagerBulkCateringOrdersView(VoyagerBulkBookingView):
+    booking_type = "catering"
+
+
+class VoyagerBulkStationeryOrdersView(VoyagerBulkBookingView):
+    booking_type = "stationery"
 
 
 # ---- ADMIN ----
@@ -235,8 +475,10 @@ class AdminItemManagementView(APIView):
                 return Response(ItemSerializer(item).data)
             except Item.DoesNotExist:
                 return Response({"detail": "Item not found."}, status=status.HTTP_404_NOT_FOUND)
-        items = Item.objects.all()
-        return Response(ItemSerializer(items, many=True).data)
+        serializer, errors = for_params(ItemValues, request.query_params)
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serializer.serialize(Item.objects.all()))
 
     def post(self, request):
         serializer = ItemSerializer(data=request.data)
@@ -266,39 +508,174 @@ class AdminItemManagementView(APIView):
             return Response({"detail": "Item not found."}, status=status.HTTP_404_NOT_FOUND)
 
 
+# ---- BOOKING EXPORT ----
+class BookingExportMixin:
+    """
+    Adds `?export=ndjson|csv` to a booking list view.
+
+    Views call `self.export_response(request, queryset, filename)` and return
+    it when it is not None.
+    """
+
+    def export_response(self, request, queryset, filename):
+        export_format = request.query_params.get("export")
+        if not export_format:
+            return None
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"success": False, "errors": {"export": [f"Unsupported export format '{export_format}'."]}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # Rows are read after dispatch returns, so pin the alias chosen now.
+        return stream_bookings(queryset.using(queryset.db), export_format, filename)
+
+
 # ---- MANAGER ----
-class ManagerViewBookings(APIView):
-    authentication_classes = [JWTAuthentication]
+class ManagerViewBookings(ReplicaReadMixin, BookingExportMixin, APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsManager]
+    pagination_class = BookingCursorPagination
 
     def get(self, request):
-        bookings = Booking.objects.all()
-        return Response(BookingSerializer(bookings, many=True).data)
+        bookings, errors = filter_bookings(Booking.objects.all(), request.query_params)
+        serializer, field_errors = for_params(BookingValues, request.query_params)
+        errors.update(field_errors)
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        export = self.export_response(request, bookings, "bookings")
+        if export is not None:
+            return export
+
+        # The paginator needs the ordering columns even when they are not shown.
+        columns = dict.fromkeys((*serializer.lookups, "created_at", "id"))
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(bookings.values(*columns), request, view=self)
+        return paginator.get_paginated_response(serializer.serialize_page(page))
+
+
+class ManagerBookingAnalyticsView(ReplicaReadMixin, APIView):
+    """Booking counts, cancellation rate and occupancy from the daily rollups."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsManager]
+
+    def get(self, request):
+        filters, errors = date_range_filters(request.query_params)
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(cached_booking_summary(**filters))
 
 
 # ---- HEAD COOK ----
-class HeadCookViewOrders(APIView):
-    authentication_classes = [JWTAuthentication]
+class HeadCookViewOrders(ReplicaReadMixin, BookingExportMixin, APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsHeadCook]
 
     def get(self, request):
         catering_orders = Booking.objects.filter(type="catering")
-        return Response(BookingSerializer(catering_orders, many=True).data)
+        export = self.export_response(request, catering_orders, "catering-orders")
+        if export is not None:
+            return export
+        serializer, errors = for_params(BookingOrderValues, request.query_params)
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serializer.serialize(catering_orders))
+
+
+class HeadCookProductionView(ReplicaReadMixin, APIView):
+    """
+    Quantities to prepare per date, meal window and item.
+
+    Served from the KitchenDemand summary table, so the cost depends on the
+    number of dishes in the requested range rather than on order volume.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsHeadCook]
+
+    def get(self, request):
+        filters, errors = date_range_filters(request.query_params)
+        meal = request.query_params.get("meal")
+        if meal:
+            if meal not in dict(Order.MEAL_WINDOWS):
+                errors["meal"] = [f"Unknown meal window '{meal}'."]
+            else:
+                filters["meal"] = meal
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(production_rows(**filters))
 
 
 # ---- SUPERVISOR ----
-class SupervisorViewOrders(APIView):
-    authentication_classes = [JWTAuthentication]
+class SupervisorViewOrders(ReplicaReadMixin, BookingExportMixin, APIView):
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsSupervisor]
 
     def get(self, request):
         stationery_orders = Booking.objects.filter(type="stationery")
-        return Response(BookingSerializer(stationery_orders, many=True).data)
+        export = self.export_response(request, stationery_orders, "stationery-orders")
+        if export is not None:
+            return export
+        serializer, errors = for_params(BookingOrderValues, request.query_params)
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serializer.serialize(stationery_orders))
+
+
+# ---- DELTA SYNC ----
+def sync_response(data, serializer_class):
+    return Response({
+        "changed": serializer_class(data["changed"], many=True).data,
+        "deleted": data["deleted"],
+        "watermark": data["watermark"],
+        "after": data["after"],
+        "has_more": data["has_more"],
+        "reset": data["reset"],
+    })
+
+
+class BookingChangesView(APIView):
+    """
+    Bookings created, updated or deleted since `?since=<watermark>&after=<id>`,
+    scoped to the booking types the caller's role follows.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsManager | IsHeadCook | IsSupervisor]
+
+    def get(self, request):
+        since, after, errors = parse_sync_params(request.query_params)
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        types = STAFF_BOOKING_TYPES[request_role(request)]
+        bookings = Booking.objects.all() if types is None else Booking.objects.filter(type__in=types)
+        data = changes_since(bookings, "booking", since, after, kinds=types)
+        return sync_response(data, BookingSerializer)
+
+
+class ItemChangesView(APIView):
+    """Catalog items created, updated or deleted since `?since=<watermark>&after=<id>`."""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        since, after, errors = parse_sync_params(request.query_params)
+        category = request.query_params.get("category")
+        if category and category not in dict(Item.CATEGORY_CHOICES):
+            errors["category"] = [f"Unknown category '{category}'."]
+        if errors:
+            return Response({"success": False, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        items = Item.objects.filter(category=category) if category else Item.objects.all()
+        data = changes_since(items, "item", since, after, kinds=(category,) if category else None)
+        return sync_response(data, ItemSerializer)
 
 
 # ---- VOYAGER BASE ----
 class VoyagerBaseView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated, (IsVoyager | IsHeadCook)]
 
     def get(self, request):
@@ -313,7 +690,7 @@ class VoyagerBaseView(APIView):
 
 # ---- HEAD COOK BASE ----
 class HeadCookBaseView(APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated, IsHeadCook]
 
     def get(self, request):
@@ -51,6 +51,8 @@ INSTALLED_APPS = [
 # MIDDLEWARE
 # -------------------
 MIDDLEWARE = [
+    "core.metrics.RequestMetricsMiddleware",
+    "core.compression.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -61,6 +63,23 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Request metrics (core.metrics), scraped from /metrics by the listed
+# addresses. Behind reverse proxies, set METRICS_TRUSTED_PROXIES to how
+# many of them append to X-Forwarded-For, so the scraper's own address is
+# checked rather than the proxy's; with 0, forwarded requests are refused.
+# Requests slower than SLOW_REQUEST_THRESHOLD_MS (0 disables) are logged
+# with up to SLOW_REQUEST_MAX_QUERIES of their SQL statements.
+METRICS_ALLOWED_IPS = config("METRICS_ALLOWED_IPS", default="127.0.0.1,::1", cast=Csv())
+METRICS_TRUSTED_PROXIES = config("METRICS_TRUSTED_PROXIES", default=0, cast=int)
+SLOW_REQUEST_THRESHOLD_MS = config("SLOW_REQUEST_THRESHOLD_MS", default=1000, cast=int)
+SLOW_REQUEST_MAX_QUERIES = config("SLOW_REQUEST_MAX_QUERIES", default=50, cast=int)
+
+# Responses of at least COMPRESSION_MIN_SIZE bytes are brotli- (if the
+# `brotli` package is installed and the request has no cookies, against
+# BREACH) or gzip-compressed; see core.compression.
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+COMPRESSION_BROTLI_QUALITY = config("COMPRESSION_BROTLI_QUALITY", default=5, cast=int)
+
 # -------------------
 # URL + WSGI
 # -------------------
@@ -88,12 +107,149 @@ TEMPLATES = [
 # -------------------
 # DATABASE
 # -------------------
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# DB_ENGINE=sqlite (default) or postgresql. For PostgreSQL, DB_POOL=True
+# uses psycopg's built-in connection pool; otherwise connections persist
+# for DB_CONN_MAX_AGE seconds with health checks. Setting DB_REPLICA_HOST
+# (or DB_REPLICA_NAME for SQLite) adds a "replica" alias that the staff
+# dashboards read from (see core.db).
+DB_ENGINE = config("DB_ENGINE", default="sqlite")
+
+if DB_ENGINE == "sqlite":
+    # SQLITE_TUNING=False gives SQLite's stock behaviour (rollback journal,
+    # synchronous=FULL, deferred transactions). journal_mode=WAL is stored
+    # in the database file itself, so db.sqlite3 is not tracked: create
+    # it locally with `manage.py migrate`.
+    SQLITE_TUNING = config("SQLITE_TUNING", default=True, cast=bool)
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": config("DB_NAME", default=str(BASE_DIR / "db.sqlite3")),
+            "OPTIONS": {
+                # WAL lets dashboard reads run alongside booking writes, and
+                # with synchronous=NORMAL a commit no longer waits on fsync.
+                "init_command": (
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    f"PRAGMA mmap_size={config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int)};"
+                    f"PRAGMA cache_size=-{config('SQLITE_CACHE_KB', default=64 * 1024, cast=int)};"
+                    "PRAGMA temp_store=MEMORY;"
+                ),
+                # Seconds a writer waits for the lock instead of failing
+                # with "database is locked".
+                "timeout": config("SQLITE_BUSY_TIMEOUT", default=20, cast=int),
+                # Take the write lock at BEGIN so a transaction that reads
+                # first cannot deadlock on the lock upgrade.
+                "transaction_mode": "IMMEDIATE",
+            } if SQLITE_TUNING else {},
+        }
+    }
+    _replica_overrides = {"NAME": config("DB_REPLICA_NAME", default="")}
+else:
+    DB_POOL = config("DB_POOL", default=False, cast=bool)
+    DATABASES = {
+        "default": {
+            "ENGINE": f"django.db.backends.{DB_ENGINE}",
+            "NAME": config("DB_NAME", default="cruiseship"),
+            "USER": config("DB_USER", default=""),
+            "PASSWORD": config("DB_PASSWORD", default=""),
+            "HOST": config("DB_HOST", default="localhost"),
+            "PORT": config("DB_PORT", default=""),
+            # A pool and persistent connections are mutually exclusive.
+            "CONN_MAX_AGE": 0 if DB_POOL else config("DB_CONN_MAX_AGE", default=60, cast=int),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                "pool": {
+                    "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+                    "max_size": config("DB_POOL_MAX_SIZE", default=20, cast=int),
+                },
+            } if DB_POOL else {},
+        }
+    }
+    _replica_overrides = {
+        "HOST": config("DB_REPLICA_HOST", default=""),
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+    }
+
+if next(iter(_replica_overrides.values())):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        **_replica_overrides,
+        "TEST": {"MIRROR": "default"},
     }
+
+DATABASE_ROUTERS = ["core.db.PrimaryReplicaRouter"]
+
+# Group-commit the high-volume inserts (contact messages, bookings, orders)
+# so concurrent requests share one transaction; see core.batching. Most
+# useful on SQLite, where every commit serializes on a single writer.
+WRITE_COALESCING = config("WRITE_COALESCING", default=DB_ENGINE == "sqlite", cast=bool)
+WRITE_COALESCING_MAX_BATCH = config("WRITE_COALESCING_MAX_BATCH", default=64, cast=int)
+
+# Live booking feed (core.async_views.booking_events): how often an open
+# stream checks the event log, and how long before the client is asked
+# to reconnect with Last-Event-ID. BOOKING_EVENTS_SETTLE_SECONDS is how
+# long a gap in the event ids is held open for a commit still in flight;
+# it must exceed the longest write transaction (see core.events).
+BOOKING_EVENTS_SETTLE_SECONDS = config("BOOKING_EVENTS_SETTLE_SECONDS", default=5, cast=int)
+BOOKING_EVENTS_POLL_INTERVAL = config("BOOKING_EVENTS_POLL_INTERVAL", default=1.0, cast=float)
+BOOKING_EVENTS_STREAM_LIFETIME = config("BOOKING_EVENTS_STREAM_LIFETIME", default=300, cast=int)
+
+# Delta sync (core.sync): changes are served once they are older than
+# SYNC_SETTLE_SECONDS, which must exceed the longest write transaction so
+# none commits behind a watermark. Tombstones are kept for
+# SYNC_TOMBSTONE_RETENTION_DAYS; older clients get a full listing.
+SYNC_SETTLE_SECONDS = config("SYNC_SETTLE_SECONDS", default=10, cast=float)
+SYNC_TOMBSTONE_RETENTION_DAYS = config("SYNC_TOMBSTONE_RETENTION_DAYS", default=30, cast=int)
+
+# -------------------
+# CACHE
+# -------------------
+# Two tiers (see core.cache_backends): each process keeps up to
+# CACHE_LOCAL_MAX_ENTRIES recent values for at most CACHE_LOCAL_TIMEOUT
+# seconds in front of a backend shared by every worker on the host, a
+# file-based cache in CACHE_DIR. Tests keep the shared tier in process
+# memory instead (see server.test_settings and core.test_runner).
+CACHE_DIR = config("CACHE_DIR", default=str(BASE_DIR / "var" / "cache"))
+CACHES = {
+    "default": {
+        "BACKEND": "core.cache_backends.TieredCache",
+        "LOCATION": "shared",
+        "OPTIONS": {
+            "LOCAL_MAX_ENTRIES": config("CACHE_LOCAL_MAX_ENTRIES", default=1000, cast=int),
+            "LOCAL_TIMEOUT": config("CACHE_LOCAL_TIMEOUT", default=10, cast=float),
+        },
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": CACHE_DIR,
+        "OPTIONS": {"MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=10000, cast=int)},
+    },
+}
+TEST_RUNNER = "core.test_runner.TestRunner"
+
+# -------------------
+# PASSWORD HASHING
+# -------------------
+# Profile chooses the hasher for new and upgraded hashes; the others stay
+# listed so existing hashes still verify (and get rehashed on next login).
+PASSWORD_HASHER_PROFILE = config("PASSWORD_HASHER_PROFILE", default="pbkdf2")
+_PASSWORD_HASHER_PROFILES = {
+    "pbkdf2": "core.hashers.TunablePBKDF2PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",  # needs argon2-cffi
 }
+PASSWORD_HASHERS = [_PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]] + [
+    hasher for name, hasher in _PASSWORD_HASHER_PROFILES.items() if name != PASSWORD_HASHER_PROFILE
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+# 0 keeps Django's default PBKDF2 work factor.
+PASSWORD_PBKDF2_ITERATIONS = config("PASSWORD_PBKDF2_ITERATIONS", default=0, cast=int)
+# Concurrent password hashes per process; 0 means half the CPUs (at least
+# one), leaving the rest to request handling. With several worker
+# processes per host, lower it so their pools together fit the cores.
+PASSWORD_HASH_WORKERS = config("PASSWORD_HASH_WORKERS", default=0, cast=int)
 
 # -------------------
 # PASSWORD VALIDATION
@@ -109,6 +265,7 @@ AUTH_PASSWORD_VALIDATORS = [
 # AUTH + REST FRAMEWORK
 # -------------------
 AUTH_USER_MODEL = "core.User"
+AUTHENTICATION_BACKENDS = ["core.backends.PooledModelBackend"]
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -117,10 +274,30 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    "DEFAULT_THROTTLE_RATES": {
+        "contact": config("CONTACT_RATE_LIMIT", default="10/minute"),
+    },
 }
 
+# Contact form intake. With CONTACT_QUEUE on, messages are spooled to
+# CONTACT_QUEUE_DIR and saved by `manage.py process_contact_queue`; off,
+# they are saved during the request. Either way a message repeated within
+# CONTACT_DEDUP_WINDOW seconds is only stored once.
+CONTACT_QUEUE = config("CONTACT_QUEUE", default=False, cast=bool)
+CONTACT_QUEUE_DIR = config("CONTACT_QUEUE_DIR", default=str(BASE_DIR / "var" / "contact_queue"))
+CONTACT_DEDUP_WINDOW = config("CONTACT_DEDUP_WINDOW", default=3600, cast=int)
+
 # -------------------
 # LANGUAGE / TIME
 # -------------------
@@ -152,7 +329,10 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
-    "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    # Revocable tokens (core.tokens): rotated and revoked tokens are
+    # rejected through the revocation list in core.revocation.
+    "AUTH_TOKEN_CLASSES": ("core.tokens.AccessToken",),
+    "TOKEN_REFRESH_SERIALIZER": "core.serializers.RevocableTokenRefreshSerializer",
 }
 
 # -------------------
@@ -0,0 +1,14 @@
+"""
+Settings for the test suite. `manage.py test` applies them through
+core.test_runner; other runners (e.g. pytest-django) can point
+DJANGO_SETTINGS_MODULE here instead.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import CACHES as _CACHES
+
+# Keep the shared cache tier in process memory, so test runs never read
+# or write CACHE_DIR and never see each other's entries.
+CACHES = {
+    **_CACHES,
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "shared"},
+}
@@ -4,12 +4,15 @@ from django.http import HttpResponse
 from django.conf import settings
 from django.conf.urls.static import static
 
+from core.metrics import metrics_view
+
 def home_view(request):
     return HttpResponse("Welcome to the Cruise Ship Management System API.")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", home_view, name="home"),
+    path("metrics", metrics_view, name="metrics"),
 
     # Core app (auth, token, registration, session, items, bookings, etc.)
     path("api/", include("core.urls")),